@@ -11,9 +11,13 @@ historical crash performance context for the portfolio's correlation level.
 
 import json
 import logging
+import math
 import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, reduce
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -33,6 +37,7 @@ from agents.shared.models import (
     CrashPerformance,
     ErrorMessage,
     Portfolio,
+    TokenHolding,
 )
 
 logger = logging.getLogger(__name__)
@@ -41,6 +46,73 @@ logger = logging.getLogger(__name__)
 HISTORICAL_PRICES_DIR = Path(__file__).parent.parent / "data" / "historical_prices"
 HISTORICAL_CRASHES_PATH = Path(__file__).parent.parent / "data" / "historical-crashes.json"
 
+# Relative tolerance below which a return series is treated as constant
+VARIANCE_RTOL = 1e-12
+
+# Upper bound on threads used to load token price CSVs in parallel
+PRICE_LOAD_WORKERS = 8
+
+# Upper bound on threads used to analyze several wallets at once
+PORTFOLIO_BATCH_WORKERS = 4
+
+# Number of parsed price CSVs kept in memory (one entry per token file version)
+PRICE_CACHE_SIZE = 256
+
+# Number of memoized ETH return windows (keyed by days and ETH.csv version)
+ETH_RETURNS_CACHE_SIZE = 8
+
+# Distinct portfolios whose CorrelationAnalysis is memoized (see build_correlation_analysis)
+CORRELATION_ANALYSIS_CACHE_SIZE = 32
+
+# Sorted interpretation boundaries: the label index is the number of
+# thresholds strictly below abs(r). MODERATE is inclusive (>=), so its
+# boundary is nudged down by one ulp.
+INTERPRETATION_THRESHOLDS = (
+    math.nextafter(MODERATE_CORRELATION_THRESHOLD, -math.inf),
+    HIGH_CORRELATION_THRESHOLD,
+)
+INTERPRETATION_LABELS = ("Low", "Moderate", "High")
+
+# Crash-context brackets by correlation percentage: >90, 80-90, 70-80, <70
+CORRELATION_BRACKET_THRESHOLDS = (
+    math.nextafter(70, -math.inf),
+    math.nextafter(80, -math.inf),
+    90,
+)
+CORRELATION_BRACKETS = ("<70%", "70-80%", "80-90%", ">90%")
+
+# Narrative templates (filled with str.format_map)
+NARRATIVE_SUMMARY_TEMPLATE = (
+    "Your portfolio is {correlation_pct}% {direction} correlated to ETH over the past 90 days. "
+    "This is {interpretation} correlation."
+)
+NARRATIVE_CRASH_HEADER = "\n\nHistorical crash performance for portfolios at your correlation level:"
+NARRATIVE_CRASH_LINE_TEMPLATE = (
+    "\n- {crash_name} ({crash_period}): "
+    "Portfolios at your correlation level lost an average of {portfolio_loss_pct:.0f}% "
+    "(ETH dropped {eth_drawdown_pct:.0f}%), compared to {market_avg_loss_pct:.0f}% market average."
+)
+NARRATIVE_RISK_IMPLICATIONS = {
+    "High": (
+        "\n\nThis high correlation means your portfolio moves almost identically to ETH, "
+        "amplifying both gains and losses. When ETH crashes, your portfolio will likely crash equally hard. "
+        "Diversifying with uncorrelated assets (BTC, stablecoins, Layer-1 alternatives) could reduce this compounding risk."
+    ),
+    "Moderate": (
+        "\n\nThis moderate correlation means your portfolio has some diversification from ETH movements, "
+        "but still experiences significant exposure. Continue balancing ETH-correlated DeFi positions "
+        "with uncorrelated assets to improve risk-adjusted returns."
+    ),
+    "Low": (
+        "\n\nYour portfolio structure demonstrates good diversification from ETH movements. "
+        "Continue maintaining exposure to uncorrelated assets to preserve this risk-reduction benefit."
+    ),
+}
+NARRATIVE_NO_CRASH_DATA_TEMPLATE = (
+    " This indicates {interpretation_lower} {direction_stem} correlation. "
+    "Historical crash data unavailable."
+)
+
 # Agent initialization with seed from environment
 correlation_agent = Agent(
     name="correlation_agent_local",
@@ -49,12 +121,16 @@ correlation_agent = Agent(
 )
 
 
-def load_historical_crashes() -> pd.DataFrame:
+@lru_cache(maxsize=1)
+def _read_crash_scenarios() -> Tuple[dict, ...]:
     """
-    Load historical crash data from JSON file using pandas.
+    Parse historical-crashes.json once per process.
+
+    The returned scenario dicts are shared between callers and must be
+    treated as read-only.
 
     Returns:
-        DataFrame with crash scenario data
+        Tuple of crash scenario dicts, in file order
 
     Raises:
         FileNotFoundError: If historical-crashes.json doesn't exist
@@ -67,13 +143,85 @@ def load_historical_crashes() -> pd.DataFrame:
         with open(HISTORICAL_CRASHES_PATH) as f:
             data = json.load(f)
 
-        # Convert to DataFrame
-        df = pd.DataFrame(data["crashes"])
-        return df
+        return tuple(data["crashes"])
     except Exception as e:
         raise ValueError(f"Failed to load historical crash data: {str(e)}")
 
 
+def load_historical_crashes() -> pd.DataFrame:
+    """
+    Load historical crash data from JSON file using pandas.
+
+    Returns:
+        DataFrame with crash scenario data
+
+    Raises:
+        FileNotFoundError: If historical-crashes.json doesn't exist
+        ValueError: If JSON is malformed
+    """
+    # Convert to DataFrame (JSON is parsed once and cached)
+    return pd.DataFrame(list(_read_crash_scenarios()))
+
+
+@lru_cache(maxsize=1)
+def _crash_context_by_bracket() -> Dict[str, Tuple[CrashPerformance, ...]]:
+    """
+    Build CrashPerformance models for every correlation bracket, once.
+
+    Returns:
+        Dict mapping bracket label (e.g. '>90%') to crash performances
+        in scenario order
+
+    Raises:
+        FileNotFoundError: If historical-crashes.json doesn't exist
+        ValueError: If JSON is malformed
+    """
+    crashes = _read_crash_scenarios()
+
+    try:
+        by_bracket: Dict[str, List[CrashPerformance]] = {}
+        for crash in crashes:
+            for bracket, portfolio_loss in crash["correlation_brackets"].items():
+                by_bracket.setdefault(bracket, []).append(
+                    CrashPerformance(
+                        crash_name=crash["name"],
+                        crash_period=crash["period"],
+                        eth_drawdown_pct=crash["eth_drawdown_pct"],
+                        portfolio_loss_pct=portfolio_loss,
+                        market_avg_loss_pct=crash["market_avg_loss_pct"],
+                    )
+                )
+        return {bracket: tuple(performances) for bracket, performances in by_bracket.items()}
+    except Exception as e:
+        raise ValueError(f"Failed to load historical crash data: {str(e)}")
+
+
+def interpret_correlation(correlation_coef: float) -> str:
+    """
+    Map a correlation coefficient to its interpretation level.
+
+    Args:
+        correlation_coef: Raw correlation coefficient (-1 to 1)
+
+    Returns:
+        "High" (>85%), "Moderate" (70-85%) or "Low" (<70%)
+    """
+    return INTERPRETATION_LABELS[bisect_left(INTERPRETATION_THRESHOLDS, abs(correlation_coef))]
+
+
+def get_correlation_bracket(correlation_pct: int) -> str:
+    """
+    Map a correlation percentage to its historical crash bracket.
+
+    Args:
+        correlation_pct: Portfolio correlation percentage (0-100)
+
+    Returns:
+        Bracket label: ">90%", "80-90%", "70-80%" or "<70%"
+    """
+    return CORRELATION_BRACKETS[bisect_left(CORRELATION_BRACKET_THRESHOLDS, correlation_pct)]
+
+
 def get_crash_context(correlation_pct: int) -> List[CrashPerformance]:
     """
     Query historical crash data based on calculated correlation coefficient.
@@ -88,39 +236,17 @@ def get_crash_context(correlation_pct: int) -> List[CrashPerformance]:
         FileNotFoundError: If crash data file missing
     """
     try:
-        df = load_historical_crashes()
+        crash_context_by_bracket = _crash_context_by_bracket()
     except FileNotFoundError:
         # Graceful fallback: return empty list if data unavailable
         logger.warning("Historical crash data unavailable, returning empty context")
         return []
 
     # Determine correlation bracket
-    if correlation_pct > 90:
-        bracket = ">90%"
-    elif correlation_pct >= 80:
-        bracket = "80-90%"
-    elif correlation_pct >= 70:
-        bracket = "70-80%"
-    else:
-        bracket = "<70%"
-
-    # Extract crash performance for this bracket from all 3 scenarios
-    crash_performances = []
-
-    for _, crash in df.iterrows():
-        portfolio_loss = crash["correlation_brackets"][bracket]
-
-        crash_performances.append(
-            CrashPerformance(
-                crash_name=crash["name"],
-                crash_period=crash["period"],
-                eth_drawdown_pct=crash["eth_drawdown_pct"],
-                portfolio_loss_pct=portfolio_loss,
-                market_avg_loss_pct=crash["market_avg_loss_pct"],
-            )
-        )
+    bracket = get_correlation_bracket(correlation_pct)
 
-    return crash_performances
+    # Crash performance for this bracket from all 3 scenarios
+    return list(crash_context_by_bracket[bracket])
 
 
 def generate_narrative_with_crash_context(
@@ -146,59 +272,71 @@ def generate_narrative_with_crash_context(
 
     # Base correlation statement
     narrative_parts = [
-        f"Your portfolio is {correlation_pct}% {direction} correlated to ETH over the past 90 days. "
-        f"This is {interpretation} correlation."
+        NARRATIVE_SUMMARY_TEMPLATE.format_map({
+            "correlation_pct": correlation_pct,
+            "direction": direction,
+            "interpretation": interpretation,
+        })
     ]
 
     # Add historical crash context if available
     if crash_context:
-        narrative_parts.append("\n\nHistorical crash performance for portfolios at your correlation level:")
-
-        for crash in crash_context:
-            narrative_parts.append(
-                f"\n- {crash.crash_name} ({crash.crash_period}): "
-                f"Portfolios at your correlation level lost an average of {crash.portfolio_loss_pct:.0f}% "
-                f"(ETH dropped {crash.eth_drawdown_pct:.0f}%), compared to {crash.market_avg_loss_pct:.0f}% market average."
-            )
-
-        # Add risk implication based on interpretation
-        if interpretation == "High":
-            narrative_parts.append(
-                "\n\nThis high correlation means your portfolio moves almost identically to ETH, "
-                "amplifying both gains and losses. When ETH crashes, your portfolio will likely crash equally hard. "
-                "Diversifying with uncorrelated assets (BTC, stablecoins, Layer-1 alternatives) could reduce this compounding risk."
-            )
-        elif interpretation == "Moderate":
-            narrative_parts.append(
-                "\n\nThis moderate correlation means your portfolio has some diversification from ETH movements, "
-                "but still experiences significant exposure. Continue balancing ETH-correlated DeFi positions "
-                "with uncorrelated assets to improve risk-adjusted returns."
-            )
-        else:  # Low
-            narrative_parts.append(
-                "\n\nYour portfolio structure demonstrates good diversification from ETH movements. "
-                "Continue maintaining exposure to uncorrelated assets to preserve this risk-reduction benefit."
-            )
+        narrative_parts.append(NARRATIVE_CRASH_HEADER)
+        narrative_parts.extend(NARRATIVE_CRASH_LINE_TEMPLATE.format_map(vars(crash)) for crash in crash_context)
+
+        # Add risk implication based on interpretation (anything else reads as Low)
+        narrative_parts.append(NARRATIVE_RISK_IMPLICATIONS.get(interpretation, NARRATIVE_RISK_IMPLICATIONS["Low"]))
     else:
         # Fallback narrative if crash data unavailable
         narrative_parts.append(
-            f" This indicates {interpretation.lower()} {direction.rstrip('ly')} correlation. "
-            "Historical crash data unavailable."
+            NARRATIVE_NO_CRASH_DATA_TEMPLATE.format_map({
+                "interpretation_lower": interpretation.lower(),
+                "direction_stem": direction.rstrip("ly"),
+            })
         )
 
     return "".join(narrative_parts)
 
 
-def load_price_data(symbol: str, days: int) -> pd.DataFrame:
+@lru_cache(maxsize=PRICE_CACHE_SIZE)
+def _read_price_csv(csv_path: Path, mtime_ns: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Load historical price data for a token from CSV file.
+    Parse a price CSV into date-sorted (dates, prices, volumes) arrays.
+
+    Cached per (path, mtime) so repeated analyses reuse the parsed data and an
+    updated file is re-read. Arrays are read-only because they are shared.
+
+    Args:
+        csv_path: Path to the token's CSV file
+        mtime_ns: File modification time (cache key only)
+
+    Returns:
+        Tuple of datetime64 dates, float64 prices and float64 volumes
+    """
+    df = pd.read_csv(csv_path)
+    df["date"] = pd.to_datetime(df["date"])
+    df = df.sort_values("date")
+
+    columns = (
+        df["date"].to_numpy(dtype="datetime64[ns]"),
+        df["price_usd"].to_numpy(dtype=np.float64),
+        df["volume_usd"].to_numpy(dtype=np.float64),
+    )
+    for column in columns:
+        column.flags.writeable = False
+    return columns
+
+
+def _load_price_columns(symbol: str, days: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load the last days+1 rows of a token's price history as column arrays.
 
     Args:
         symbol: Token symbol (e.g., 'ETH', 'UNI')
         days: Number of days of historical data to load
 
     Returns:
-        DataFrame with columns: date, price_usd, volume_usd
+        Tuple of (dates, prices, volumes) read-only arrays
 
     Raises:
         FileNotFoundError: If CSV file for symbol doesn't exist
@@ -209,18 +347,60 @@ def load_price_data(symbol: str, days: int) -> pd.DataFrame:
     if not csv_path.exists():
         raise FileNotFoundError(f"Price data not found for {symbol} at {csv_path}")
 
-    # Load CSV
-    df = pd.read_csv(csv_path)
-    df["date"] = pd.to_datetime(df["date"])
-    df = df.sort_values("date").reset_index(drop=True)
+    # Load CSV (parsed once per file version)
+    dates, prices, volumes = _read_price_csv(csv_path, csv_path.stat().st_mtime_ns)
 
     # Get last N days
-    df = df.tail(days + 1).reset_index(drop=True)  # +1 for calculating returns
+    start = max(0, len(dates) - (days + 1))  # +1 for calculating returns
+
+    if len(dates) - start < days:
+        raise ValueError(f"Insufficient data for {symbol}: found {len(dates) - start} days, need {days}")
 
-    if len(df) < days:
-        raise ValueError(f"Insufficient data for {symbol}: found {len(df)} days, need {days}")
+    return dates[start:], prices[start:], volumes[start:]
 
-    return df
+
+def load_price_arrays(symbol: str, days: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load historical dates and prices for a token as NumPy arrays.
+
+    Hot-path variant of load_price_data that skips DataFrame construction.
+
+    Args:
+        symbol: Token symbol (e.g., 'ETH', 'UNI')
+        days: Number of days of historical data to load
+
+    Returns:
+        Tuple of (dates, prices) read-only arrays, last days+1 rows
+
+    Raises:
+        FileNotFoundError: If CSV file for symbol doesn't exist
+        ValueError: If insufficient data available
+    """
+    dates, prices, _ = _load_price_columns(symbol, days)
+    return dates, prices
+
+
+def load_price_data(symbol: str, days: int) -> pd.DataFrame:
+    """
+    Load historical price data for a token from CSV file.
+
+    Args:
+        symbol: Token symbol (e.g., 'ETH', 'UNI')
+        days: Number of days of historical data to load
+
+    Returns:
+        DataFrame with columns: date, price_usd, volume_usd
+
+    Raises:
+        FileNotFoundError: If CSV file for symbol doesn't exist
+        ValueError: If insufficient data available
+    """
+    dates, prices, volumes = _load_price_columns(symbol, days)
+    return pd.DataFrame({
+        "date": dates,
+        "price_usd": prices,
+        "volume_usd": volumes,
+    })
 
 
 def calculate_daily_returns(prices: pd.Series) -> pd.Series:
@@ -233,8 +413,21 @@ def calculate_daily_returns(prices: pd.Series) -> pd.Series:
     Returns:
         Series of daily returns (price_today - price_yesterday) / price_yesterday
     """
-    returns = prices.pct_change().dropna()
-    return returns
+    # Operate on the raw array (one subtract + one in-place divide) instead of
+    # pct_change(), which allocates intermediate Series and a NaN first row
+    values = prices.to_numpy(dtype=np.float64)
+    if np.isnan(values).any():
+        # Same as pct_change().dropna(): forward-fill missing prices first
+        values = pd.Series(values).ffill().to_numpy()
+    # Zero previous prices give inf (x/0) or NaN (0/0), as pct_change() does
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.subtract(values[1:], values[:-1])
+        np.divide(returns, values[:-1], out=returns)
+    # ...then drop undefined returns (leading missing prices, 0/0)
+    defined = ~np.isnan(returns)
+    if defined.all():
+        return pd.Series(returns, index=prices.index[1:], name=prices.name)
+    return pd.Series(returns[defined], index=prices.index[1:][defined], name=prices.name)
 
 
 def load_eth_returns(days: int) -> pd.Series:
@@ -251,6 +444,24 @@ def load_eth_returns(days: int) -> pd.Series:
         FileNotFoundError: If ETH.csv doesn't exist
         ValueError: If insufficient data available
     """
+    eth_path = HISTORICAL_PRICES_DIR / "ETH.csv"
+    mtime_ns = eth_path.stat().st_mtime_ns if eth_path.exists() else 0
+    # Copy so callers can't mutate the memoized Series
+    return _cached_eth_returns(days, mtime_ns).copy()
+
+
+@lru_cache(maxsize=ETH_RETURNS_CACHE_SIZE)
+def _cached_eth_returns(days: int, mtime_ns: int) -> pd.Series:
+    """
+    Compute ETH daily returns, memoized per window and ETH.csv version.
+
+    Args:
+        days: Number of days for historical window
+        mtime_ns: Modification time of ETH.csv (cache key only)
+
+    Returns:
+        Series of daily ETH returns
+    """
     df = load_price_data("ETH", days)
     returns = calculate_daily_returns(df["price_usd"])
     return returns
@@ -278,15 +489,20 @@ def calculate_portfolio_returns(portfolio: Portfolio, days: int) -> pd.Series:
     excluded_tokens = []
     excluded_value = 0.0
 
-    for token in portfolio.tokens:
+    # Load all token CSVs concurrently (I/O bound; pandas parsing releases the GIL)
+    with ThreadPoolExecutor(max_workers=max(1, min(PRICE_LOAD_WORKERS, len(portfolio.tokens)))) as executor:
+        price_futures = [executor.submit(load_price_arrays, token.symbol, days) for token in portfolio.tokens]
+
+    for token, price_future in zip(portfolio.tokens, price_futures):
         symbol = token.symbol
         weight = token.value_usd / total_value
         token_weights[symbol] = weight
 
         try:
-            # Load price data and calculate returns
-            df = load_price_data(symbol, days)
-            returns = calculate_daily_returns(df["price_usd"])
+            # Collect price data and calculate returns (positionally indexed,
+            # matching load_eth_returns)
+            _, prices = price_future.result()
+            returns = calculate_daily_returns(pd.Series(prices))
 
             # Check if we have enough data (minimum required days from config)
             if len(returns) < MIN_REQUIRED_DATA_DAYS:
@@ -321,26 +537,49 @@ def calculate_portfolio_returns(portfolio: Portfolio, days: int) -> pd.Series:
 
     # Align all return series to have the same dates
     # Use the intersection of all dates
-    all_dates = None
-    for returns in token_returns.values():
-        if all_dates is None:
-            all_dates = set(returns.index)
-        else:
-            all_dates = all_dates.intersection(set(returns.index))
+    common_dates = reduce(
+        lambda index, other: index.intersection(other),
+        (returns.index for returns in token_returns.values()),
+    ).sort_values()
+
+    if len(common_dates) < MIN_REQUIRED_DATA_DAYS:
+        raise ValueError(f"Insufficient overlapping data: only {len(common_dates)} common dates")
+
+    # Single-token portfolio: its weight is 1, so the returns are the token's own
+    if len(token_returns) == 1:
+        return next(iter(token_returns.values()))
+
+    # Calculate weighted portfolio returns as one (T x K) @ (K,) product
+    returns_matrix = np.column_stack(
+        [returns.loc[common_dates].to_numpy(dtype=np.float64) for returns in token_returns.values()]
+    )
+    weights = np.array([adjusted_weights[symbol] for symbol in token_returns], dtype=np.float64)
+
+    return pd.Series(returns_matrix @ weights, index=common_dates)
+
 
-    if not all_dates or len(all_dates) < MIN_REQUIRED_DATA_DAYS:
-        raise ValueError(f"Insufficient overlapping data: only {len(all_dates) if all_dates else 0} common dates")
+def calculate_portfolio_returns_batch(portfolios: List[Portfolio], days: int) -> List[pd.Series]:
+    """
+    Calculate weighted returns for several portfolios concurrently.
+
+    Runs in threads rather than processes so every wallet shares the
+    in-process price CSV cache; the remaining work is NumPy and file I/O.
+
+    Args:
+        portfolios: Portfolios to analyze
+        days: Number of days for historical window
 
-    # Calculate weighted portfolio returns
-    portfolio_returns = pd.Series(0.0, index=sorted(all_dates))
+    Returns:
+        List of portfolio return Series, in the same order as portfolios
 
-    for symbol, returns in token_returns.items():
-        weight = adjusted_weights[symbol]
-        # Filter returns to common dates
-        aligned_returns = returns[returns.index.isin(all_dates)]
-        portfolio_returns += weight * aligned_returns
+    Raises:
+        ValueError: If any portfolio has insufficient data (see calculate_portfolio_returns)
+    """
+    if not portfolios:
+        return []
 
-    return portfolio_returns.sort_index()
+    with ThreadPoolExecutor(max_workers=min(PORTFOLIO_BATCH_WORKERS, len(portfolios))) as executor:
+        return list(executor.map(lambda portfolio: calculate_portfolio_returns(portfolio, days), portfolios))
 
 
 def calculate_pearson_correlation(portfolio_returns: pd.Series, eth_returns: pd.Series) -> float:
@@ -354,21 +593,54 @@ def calculate_pearson_correlation(portfolio_returns: pd.Series, eth_returns: pd.
     Returns:
         Correlation coefficient (-1.0 to 1.0)
     """
-    # Align the two series to have the same dates
-    # Use inner join to get only dates present in both series
-    aligned_portfolio = portfolio_returns[portfolio_returns.index.isin(eth_returns.index)].sort_index()
-    aligned_eth = eth_returns[eth_returns.index.isin(portfolio_returns.index)].sort_index()
+    # The same Series passed twice (e.g. an ETH-only wallet) needs no alignment
+    # and its y-side sums equal the x-side ones
+    identical = portfolio_returns is eth_returns
+
+    if identical:
+        x = y = portfolio_returns.to_numpy(dtype=np.float64)
+    else:
+        # Align the two series on dates present in both (inner join), in sorted
+        # order. Works on the raw index arrays (datetime64 or positional ints) and
+        # gathers values by position, so no reindexed Series are allocated.
+        _, portfolio_positions, eth_positions = np.intersect1d(
+            portfolio_returns.index.to_numpy(),
+            eth_returns.index.to_numpy(),
+            assume_unique=True,
+            return_indices=True,
+        )
+        x = portfolio_returns.to_numpy(dtype=np.float64)[portfolio_positions]
+        y = eth_returns.to_numpy(dtype=np.float64)[eth_positions]
 
-    # Ensure same length and order
-    common_dates = sorted(set(aligned_portfolio.index).intersection(set(aligned_eth.index)))
-    aligned_portfolio = aligned_portfolio[common_dates]
-    aligned_eth = aligned_eth[common_dates]
+    n = x.size
 
-    # Calculate correlation using NumPy
-    correlation_matrix = np.corrcoef(aligned_portfolio, aligned_eth)
-    correlation_coef = correlation_matrix[0, 1]
+    if n < 2:
+        logger.warning("Correlation needs at least 2 overlapping returns, returning 0.0")
+        return 0.0
+
+    # Pearson r via the computational formula (single pass over raw sums, no
+    # centred copies): SSxy = Σxy - ΣxΣy/n, SSx = Σx² - (Σx)²/n
+    sum_x = x.sum()
+    sum_xx = x @ x
+    ss_xx = sum_xx - sum_x * sum_x / n
+
+    if identical:
+        sum_yy, ss_yy, ss_xy = sum_xx, ss_xx, ss_xx
+    else:
+        sum_y = y.sum()
+        sum_yy = y @ y
+        ss_xy = x @ y - sum_x * sum_y / n
+        ss_yy = sum_yy - sum_y * sum_y / n
+
+    # Handle zero variance (constant returns). The subtraction above cancels to
+    # rounding noise rather than exactly 0, so compare relative to the raw sums.
+    if ss_xx <= VARIANCE_RTOL * sum_xx or ss_yy <= VARIANCE_RTOL * sum_yy:
+        logger.warning("Correlation undefined for constant returns, returning 0.0")
+        return 0.0
+
+    correlation_coef = float(np.clip(ss_xy / np.sqrt(ss_xx * ss_yy), -1.0, 1.0))
 
-    # Handle NaN (can happen if returns are constant)
+    # Handle NaN (can happen if returns contain missing values)
     if np.isnan(correlation_coef):
         logger.warning("Correlation calculation resulted in NaN, returning 0.0")
         return 0.0
@@ -379,6 +651,145 @@ def calculate_pearson_correlation(portfolio_returns: pd.Series, eth_returns: pd.
     return correlation_coef
 
 
+def calculate_pearson_correlations_batch(portfolio_returns_matrix: np.ndarray, eth_returns: np.ndarray) -> np.ndarray:
+    """
+    Compute Pearson correlations of several portfolios against ETH at once.
+
+    Rows are centred and correlated with ETH in a single matrix-vector
+    product. All rows must already be aligned to the same dates as
+    eth_returns.
+
+    Args:
+        portfolio_returns_matrix: (N, T) array, one row of daily returns per portfolio
+        eth_returns: (T,) array of daily ETH returns on the same dates
+
+    Returns:
+        (N,) array of correlation coefficients (-1.0 to 1.0); 0.0 where
+        undefined (constant or missing returns), as in calculate_pearson_correlation
+
+    Raises:
+        ValueError: If the matrix is not 2-D or its columns don't match eth_returns
+    """
+    returns = np.asarray(portfolio_returns_matrix, dtype=np.float64)
+    eth = np.asarray(eth_returns, dtype=np.float64)
+
+    if returns.ndim != 2 or eth.ndim != 1 or returns.shape[1] != eth.size:
+        raise ValueError(
+            f"Expected (N, {eth.size}) portfolio returns matrix, got shape {returns.shape}"
+        )
+
+    if eth.size < 2:
+        logger.warning("Correlation needs at least 2 overlapping returns, returning 0.0")
+        return np.zeros(returns.shape[0])
+
+    centred = returns - returns.mean(axis=1, keepdims=True)
+    eth_centred = eth - eth.mean()
+
+    ss_xy = centred @ eth_centred
+    ss_xx = np.einsum("ij,ij->i", centred, centred)
+    ss_yy = eth_centred @ eth_centred
+
+    # Zero variance (constant returns) is judged relative to the raw sums of
+    # squares, matching the scalar guard
+    undefined = (ss_xx <= VARIANCE_RTOL * np.einsum("ij,ij->i", returns, returns)) | (
+        ss_yy <= VARIANCE_RTOL * (eth @ eth)
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correlations = np.clip(ss_xy / np.sqrt(ss_xx * ss_yy), -1.0, 1.0)
+
+    # Handle NaN (missing values) and undefined rows
+    undefined |= np.isnan(correlations)
+    if undefined.any():
+        logger.warning(f"Correlation undefined for {int(undefined.sum())} portfolio(s), returning 0.0")
+        correlations[undefined] = 0.0
+
+    return correlations
+
+
+def build_correlation_analysis(portfolio: Portfolio) -> CorrelationAnalysis:
+    """
+    Build the 90-day CorrelationAnalysis for a portfolio, memoized per distinct holdings.
+
+    Results are cached per holdings and price CSV versions (the token files
+    plus ETH.csv), so repeat requests for the same portfolio skip the return
+    series, correlation and narrative work. The returned model is shared
+    between callers and must be treated as read-only.
+
+    Args:
+        portfolio: Portfolio model containing token holdings
+
+    Returns:
+        CorrelationAnalysis with coefficient, interpretation, crash context and narrative
+
+    Raises:
+        ValueError: If insufficient price data is available
+        FileNotFoundError: If ETH.csv doesn't exist
+    """
+    holdings = tuple(
+        (token.symbol, token.amount, token.price_usd, token.value_usd) for token in portfolio.tokens
+    )
+    csv_paths = [HISTORICAL_PRICES_DIR / f"{symbol}.csv" for symbol, *_ in holdings]
+    csv_paths.append(HISTORICAL_PRICES_DIR / "ETH.csv")
+    price_versions = tuple(path.stat().st_mtime_ns if path.exists() else 0 for path in csv_paths)
+    return _cached_correlation_analysis(holdings, portfolio.total_value_usd, price_versions)
+
+
+@lru_cache(maxsize=CORRELATION_ANALYSIS_CACHE_SIZE)
+def _cached_correlation_analysis(
+    holdings: Tuple[Tuple[str, float, float, float], ...],
+    total_value_usd: float,
+    price_versions: Tuple[int, ...],
+) -> CorrelationAnalysis:
+    """
+    Compute the 90-day CorrelationAnalysis for one set of holdings.
+
+    Args:
+        holdings: (symbol, amount, price_usd, value_usd) per token, in portfolio order
+        total_value_usd: Total portfolio value in USD
+        price_versions: Modification times of the price CSVs (cache key only)
+
+    Returns:
+        CorrelationAnalysis for the holdings
+    """
+    # Holdings come from an already-validated Portfolio, so skip re-validation
+    portfolio = Portfolio.model_construct(
+        tokens=[
+            TokenHolding.model_construct(symbol=symbol, amount=amount, price_usd=price_usd, value_usd=value_usd)
+            for symbol, amount, price_usd, value_usd in holdings
+        ],
+        total_value_usd=total_value_usd,
+    )
+
+    portfolio_returns = calculate_portfolio_returns(portfolio, days=90)
+    eth_returns = load_eth_returns(days=90)
+    correlation_coef = calculate_pearson_correlation(portfolio_returns, eth_returns)
+
+    # Use absolute value for percentage display and interpretation (thresholds from config)
+    correlation_pct = int(abs(correlation_coef) * 100)
+    interpretation = interpret_correlation(correlation_coef)
+
+    # Get historical crash context for this correlation level
+    crash_context = get_crash_context(correlation_pct)
+
+    # Generate narrative with crash context
+    narrative = generate_narrative_with_crash_context(
+        correlation_coef,
+        correlation_pct,
+        interpretation,
+        crash_context
+    )
+
+    return CorrelationAnalysis(
+        correlation_coefficient=correlation_coef,
+        correlation_percentage=correlation_pct,
+        interpretation=interpretation,
+        historical_context=crash_context,
+        calculation_period_days=90,
+        narrative=narrative,
+    )
+
+
 @correlation_agent.on_message(model=AnalysisRequest)
 async def handle_analysis_request(ctx: Context, sender: str, msg: AnalysisRequest):
     """
@@ -402,35 +813,8 @@ async def handle_analysis_request(ctx: Context, sender: str, msg: AnalysisReques
         if not portfolio or len(portfolio.tokens) == 0:
             raise ValueError("Portfolio must contain at least one token")
 
-        # Perform correlation calculation
-        portfolio_returns = calculate_portfolio_returns(portfolio, days=90)
-        eth_returns = load_eth_returns(days=90)
-        correlation_coef = calculate_pearson_correlation(portfolio_returns, eth_returns)
-
-        # Build response
-        # Use absolute value for percentage display and interpretation (thresholds from config)
-        correlation_pct = int(abs(correlation_coef) * 100)
-        interpretation = "High" if abs(correlation_coef) > HIGH_CORRELATION_THRESHOLD else "Moderate" if abs(correlation_coef) >= MODERATE_CORRELATION_THRESHOLD else "Low"
-
-        # Get historical crash context for this correlation level
-        crash_context = get_crash_context(correlation_pct)
-
-        # Generate narrative with crash context
-        narrative = generate_narrative_with_crash_context(
-            correlation_coef,
-            correlation_pct,
-            interpretation,
-            crash_context
-        )
-
-        analysis = CorrelationAnalysis(
-            correlation_coefficient=correlation_coef,
-            correlation_percentage=correlation_pct,
-            interpretation=interpretation,
-            historical_context=crash_context,
-            calculation_period_days=90,
-            narrative=narrative,
-        )
+        # Perform correlation calculation with crash context and narrative
+        analysis = build_correlation_analysis(portfolio)
 
         processing_time_ms = int((time.time() - start_time) * 1000)
 
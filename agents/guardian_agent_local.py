@@ -10,9 +10,12 @@ to deliver comprehensive cryptocurrency portfolio risk intelligence.
 
 import asyncio
 import logging
+import math
 import re
 import time
-from typing import Optional
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from uagents import Agent, Context
 
@@ -48,6 +51,29 @@ SECTOR_AGENT_ADDRESS = get_env_var("SECTOR_AGENT_ADDRESS", default="")
 
 # Timeout configuration (seconds)
 AGENT_RESPONSE_TIMEOUT = int(get_env_var("AGENT_RESPONSE_TIMEOUT", default="10"))
+# Interval between storage polls while waiting for a specialist response
+RESPONSE_POLL_INTERVAL = 0.01
+
+# Risk level lookup: RISK_LEVEL_TABLE[correlation band][has concentrated sector].
+# Bands are <70%, 70-85% and >85%; the inclusive 70% boundary is nudged down
+# one ulp so bisect_left counts "strictly below" for both thresholds.
+RISK_CORRELATION_BAND_THRESHOLDS = (math.nextafter(70, -math.inf), 85)
+RISK_LEVEL_TABLE = (
+    ("Low", "High"),
+    ("Moderate", "High"),
+    ("High", "Critical"),
+)
+
+# Number of memoized synthesis narratives (keyed by rounded display values)
+SYNTHESIS_NARRATIVE_CACHE_SIZE = 512
+
+# Historical crash brackets by correlation percentage (>90, 80-90, 70-80, <70);
+# inclusive lower bounds are nudged down one ulp for bisect_left
+CRASH_BRACKET_THRESHOLDS = (math.nextafter(70, -math.inf), math.nextafter(80, -math.inf), 90)
+CRASH_BRACKETS = ("<70%", "70-80%", "80-90%", ">90%")
+
+# Portfolio loss (%) below which a historical crash counts as severe
+SEVERE_CRASH_LOSS_PCT = -70.0
 
 
 def extract_wallet_address(message_text: str) -> Optional[str]:
@@ -122,17 +148,21 @@ async def wait_for_response(
         Response data dict if received, None if timeout
     """
     response_key = f"{agent_name.lower()}_{request_id}"
-    start_time = time.time()
+    start_time = time.monotonic()
+    deadline = start_time + timeout
 
-    # Poll storage for response (check every 100ms)
-    while time.time() - start_time < timeout:
+    # Poll storage for response, never sleeping past the deadline
+    while True:
         response = ctx.storage.get(response_key)
         if response:
-            elapsed_ms = int((time.time() - start_time) * 1000)
+            elapsed_ms = int((time.monotonic() - start_time) * 1000)
             logger.info(f"Received {agent_name} response for {request_id} after {elapsed_ms}ms")
             return response
 
-        await asyncio.sleep(0.1)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(RESPONSE_POLL_INTERVAL, remaining))
 
     # Timeout reached
     logger.warning(f"{agent_name} response timed out after {timeout}s for request {request_id}")
@@ -358,10 +388,9 @@ def detect_compounding_risk(
         >>> detect_compounding_risk(corr, sector)
         True
     """
-    high_correlation = correlation_analysis.correlation_percentage > 85
-    high_concentration = len(sector_analysis.concentrated_sectors) > 0  # >60% threshold
-
-    return high_correlation and high_concentration
+    # High correlation (>85%) and any sector above the >60% threshold; the
+    # second check is skipped when the first fails
+    return correlation_analysis.correlation_percentage > 85 and bool(sector_analysis.concentrated_sectors)
 
 
 def calculate_risk_level(
@@ -384,18 +413,10 @@ def calculate_risk_level(
         - Moderate: Correlation 70-85% OR Sector 40-60%
         - Low: Correlation <70% AND all sectors <40%
     """
-    high_correlation = correlation_percentage > 85
+    correlation_band = bisect_left(RISK_CORRELATION_BAND_THRESHOLDS, correlation_percentage)
     high_concentration = len(concentrated_sectors) > 0  # >60%
 
-    if high_correlation and high_concentration:
-        return "Critical"
-    elif high_correlation or high_concentration:
-        return "High"
-    elif correlation_percentage >= 70 or len(concentrated_sectors) > 0:
-        # Moderate correlation (70-85%) or moderate concentration detected
-        return "Moderate"
-    else:
-        return "Low"
+    return RISK_LEVEL_TABLE[correlation_band][high_concentration]
 
 
 def generate_synthesis_narrative(
@@ -432,10 +453,13 @@ def generate_synthesis_narrative(
             3. Historical comparison
     """
     correlation_pct = correlation_analysis.correlation_percentage
-    concentrated_sectors_list = sector_analysis.concentrated_sectors
+    historical_context = correlation_analysis.historical_context
+    crash_name = crash_data[0].get('name', '2022 Bear Market') if crash_data else None
 
+    # The narrative only depends on a few small values (percentages rounded for
+    # display), so the text itself is memoized on those.
     if compounding_risk_detected:
-        # Compounding risk portfolio narrative with explicit agent attribution
+        concentrated_sectors_list = sector_analysis.concentrated_sectors
         concentrated_sector = concentrated_sectors_list[0] if concentrated_sectors_list else "Unknown"
 
         # Get sector concentration percentage
@@ -444,74 +468,93 @@ def generate_synthesis_narrative(
         if concentrated_sector in sector_breakdown:
             concentration_pct = sector_breakdown[concentrated_sector].get('percentage', 0)
 
-        # Calculate leverage effect
-        leverage = round(correlation_pct / 30.0, 1)
+        # Get portfolio loss from historical context
+        portfolio_loss = historical_context[0].portfolio_loss_pct if historical_context else -75.0  # Default
 
-        # Build narrative with explicit agent references (Story 2.5)
-        narrative_parts = [
-            f"As CorrelationAgent showed, your {correlation_pct}% ETH correlation creates significant exposure to Ethereum price movements. "
-            f"SectorAgent revealed that your {concentration_pct:.0f}% {concentrated_sector} concentration amplifies this risk through sector-specific vulnerabilities. "
-        ]
-
-        # Add Guardian's synthesis insight (combining both agents)
-        narrative_parts.append(
-            f"Combining these insights, Guardian identifies a compounding risk pattern: "
-            f"this structure acts like {leverage}x leverage to ETH movements. "
+        narrative = _compounding_synthesis_narrative(
+            correlation_pct,
+            concentrated_sector,
+            f"{concentration_pct:.0f}",
+            crash_name,
+            f"{portfolio_loss:.0f}",
         )
+        logger.info("Generated synthesis narrative with agent attribution (CorrelationAgent, SectorAgent references)")
+    else:
+        market_avg_loss = historical_context[0].market_avg_loss_pct if historical_context else -55.0  # Default
 
-        # Add historical crash example if available
-        if crash_data and len(crash_data) > 0:
-            worst_crash = crash_data[0]  # Assume sorted by severity
-            crash_name = worst_crash.get('name', '2022 Bear Market')
+        narrative = _diversified_synthesis_narrative(correlation_pct, crash_name, f"{market_avg_loss:.0f}")
+        logger.info("Generated diversified portfolio synthesis narrative with agent attribution")
 
-            # Get portfolio loss from historical context
-            portfolio_loss = -75.0  # Default
-            if correlation_analysis.historical_context:
-                portfolio_loss = correlation_analysis.historical_context[0].portfolio_loss_pct
+    return narrative
 
-            correlation_only_loss = correlation_pct * 0.6  # Rough estimate
 
-            narrative_parts.append(
-                f"In {crash_name}, portfolios with this dual-risk structure lost {portfolio_loss:.0f}% "
-                f"(not just {correlation_only_loss:.0f}% from correlation alone). "
-            )
+@lru_cache(maxsize=SYNTHESIS_NARRATIVE_CACHE_SIZE)
+def _compounding_synthesis_narrative(
+    correlation_pct: int,
+    concentrated_sector: str,
+    concentration_pct_str: str,
+    crash_name: Optional[str],
+    portfolio_loss_str: str
+) -> str:
+    """Build the compounding-risk synthesis narrative (memoized on display values)."""
+    # Calculate leverage effect
+    leverage = round(correlation_pct / 30.0, 1)
+
+    # Build narrative with explicit agent references (Story 2.5)
+    narrative_parts = [
+        f"As CorrelationAgent showed, your {correlation_pct}% ETH correlation creates significant exposure to Ethereum price movements. "
+        f"SectorAgent revealed that your {concentration_pct_str}% {concentrated_sector} concentration amplifies this risk through sector-specific vulnerabilities. "
+    ]
+
+    # Add Guardian's synthesis insight (combining both agents)
+    narrative_parts.append(
+        f"Combining these insights, Guardian identifies a compounding risk pattern: "
+        f"this structure acts like {leverage}x leverage to ETH movements. "
+    )
+
+    # Add historical crash example if available
+    if crash_name is not None:
+        correlation_only_loss = correlation_pct * 0.6  # Rough estimate
 
-        # Add key insight
         narrative_parts.append(
-            f"{concentrated_sector} sector amplifies ETH correlation—when both crash together, losses multiply."
+            f"In {crash_name}, portfolios with this dual-risk structure lost {portfolio_loss_str}% "
+            f"(not just {correlation_only_loss:.0f}% from correlation alone). "
         )
 
-        logger.info("Generated synthesis narrative with agent attribution (CorrelationAgent, SectorAgent references)")
-
-        return "".join(narrative_parts)
+    # Add key insight
+    narrative_parts.append(
+        f"{concentrated_sector} sector amplifies ETH correlation—when both crash together, losses multiply."
+    )
 
-    else:
-        # Well-diversified portfolio narrative with explicit agent attribution
-        narrative_parts = [
-            f"CorrelationAgent calculated your {correlation_pct}% ETH correlation as manageable. "
-            f"According to SectorAgent's analysis, no sector exceeds 30% concentration. "
-        ]
+    return "".join(narrative_parts)
 
-        # Add Guardian's synthesis insight
-        narrative_parts.append(
-            "Combining these findings, Guardian confirms this balanced structure limits compounding risks. "
-        )
 
-        # Add historical comparison if available
-        if crash_data and len(crash_data) > 0:
-            crash_name = crash_data[0].get('name', '2022 Bear Market')
-            market_avg_loss = -55.0  # Default
-            if correlation_analysis.historical_context:
-                market_avg_loss = correlation_analysis.historical_context[0].market_avg_loss_pct
+@lru_cache(maxsize=SYNTHESIS_NARRATIVE_CACHE_SIZE)
+def _diversified_synthesis_narrative(
+    correlation_pct: int,
+    crash_name: Optional[str],
+    market_avg_loss_str: str
+) -> str:
+    """Build the well-diversified synthesis narrative (memoized on display values)."""
+    # Well-diversified portfolio narrative with explicit agent attribution
+    narrative_parts = [
+        f"CorrelationAgent calculated your {correlation_pct}% ETH correlation as manageable. "
+        f"According to SectorAgent's analysis, no sector exceeds 30% concentration. "
+    ]
 
-            narrative_parts.append(
-                f"During {crash_name}, well-diversified portfolios like yours lost around "
-                f"{market_avg_loss:.0f}% versus -75% for concentrated portfolios."
-            )
+    # Add Guardian's synthesis insight
+    narrative_parts.append(
+        "Combining these findings, Guardian confirms this balanced structure limits compounding risks. "
+    )
 
-        logger.info("Generated diversified portfolio synthesis narrative with agent attribution")
+    # Add historical comparison if available
+    if crash_name is not None:
+        narrative_parts.append(
+            f"During {crash_name}, well-diversified portfolios like yours lost around "
+            f"{market_avg_loss_str}% versus -75% for concentrated portfolios."
+        )
 
-        return "".join(narrative_parts)
+    return "".join(narrative_parts)
 
 
 def get_correlation_recommendations(
@@ -882,6 +925,21 @@ def generate_recommendations(
         return []
 
 
+@lru_cache(maxsize=len(CRASH_BRACKETS))
+def _query_severe_crashes(correlation_bracket: str) -> Tuple[dict, ...]:
+    """
+    Query MeTTa once per bracket for crashes where it lost more than SEVERE_CRASH_LOSS_PCT.
+
+    Failed queries raise and are not cached.
+    """
+    return tuple(
+        query_crashes_by_correlation_loss(
+            correlation_bracket=correlation_bracket,
+            min_loss_pct=SEVERE_CRASH_LOSS_PCT
+        )
+    )
+
+
 def synthesis_analysis(
     correlation_response: CorrelationAnalysisResponse,
     sector_response: SectorAnalysisResponse,
@@ -937,13 +995,10 @@ def synthesis_analysis(
         if compounding_detected:
             try:
                 # Determine correlation bracket
-                correlation_bracket = ">90%" if correlation_pct > 90 else "80-90%"
+                correlation_bracket = CRASH_BRACKETS[bisect_left(CRASH_BRACKET_THRESHOLDS, correlation_pct)]
 
-                # Query MeTTa for severe crashes
-                crash_data = query_crashes_by_correlation_loss(
-                    correlation_bracket=correlation_bracket,
-                    min_loss_pct=-70.0
-                )
+                # Query MeTTa for severe crashes (memoized per bracket)
+                crash_data = list(_query_severe_crashes(correlation_bracket))
                 logger.info(
                     f"MeTTa query returned {len(crash_data)} crash scenarios "
                     f"for {correlation_bracket} bracket"
@@ -996,8 +1051,9 @@ def synthesis_analysis(
         )
         logger.info(f"Generated {len(recommendations)} recommendations for risk_level={overall_risk_level}")
 
-        # Build GuardianSynthesis model
-        synthesis = GuardianSynthesis(
+        # Build GuardianSynthesis model. Every field was validated above (the
+        # analyses at the response boundary) or computed here, so skip re-validation.
+        synthesis = GuardianSynthesis.model_construct(
             correlation_analysis=correlation_analysis,
             sector_analysis=sector_analysis,
             compounding_risk_detected=compounding_detected,
@@ -11,9 +11,12 @@ diversification score and risk narrative.
 
 import json
 import logging
+import sys
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 import pandas as pd
 from uagents import Agent, Context
@@ -28,6 +31,7 @@ from agents.shared.models import (
     OpportunityCost,
     ErrorMessage,
     Portfolio,
+    TokenHolding,
 )
 
 logger = logging.getLogger(__name__)
@@ -41,9 +45,57 @@ HISTORICAL_CRASHES_PATH = Path(__file__).parent.parent / "data" / "historical-cr
 # Concentration threshold (percentage)
 CONCENTRATION_THRESHOLD = 60.0
 
+# Sector assigned to tokens missing from sector-mappings.json (interned like
+# the mapped sector names so sector-name keys compare by identity)
+UNKNOWN_SECTOR = sys.intern("Unknown Sector")
+
+# Diversification score by number of concentrated sectors (0, 1, 2+)
+DIVERSIFICATION_SCORES = ("Well-Diversified", "Moderate Concentration", "High Concentration")
+
+# Sector narrative templates (filled with str.format_map)
+SECTOR_NARRATIVE_HEADERS = {
+    "Well-Diversified": "Your portfolio is well-diversified across {num_sectors} sectors:\n",
+}
+SECTOR_NARRATIVE_DEFAULT_HEADER = "Your portfolio is distributed across {num_sectors} sectors:\n"
+SECTOR_LINE_TEMPLATE = "\n- {sector_name}: {percentage:.1f}% (${value_usd:.2f} USD) - {tokens}"
+CONCENTRATION_WARNING_TEMPLATE = (
+    "\n⚠️ HIGH CONCENTRATION: {percentage:.1f}% of your portfolio is in {sector_name} tokens. "
+    "This creates dangerous sector risk - if {sector_name} crashes, your entire portfolio is exposed."
+)
+DIVERSIFICATION_SCORE_TEMPLATE = "\n\nDiversification Score: {diversification_score}"
+DIVERSIFICATION_IMPLICATIONS = {
+    "Well-Diversified": (
+        "\n\nNo sector exceeds 60% concentration. Your portfolio structure demonstrates good sector "
+        "diversification, which reduces the risk of a single-sector crash wiping out your holdings."
+    ),
+    "Moderate Concentration": (
+        "\n\nOne sector exceeds 60% concentration. Consider diversifying into uncorrelated sectors "
+        "to reduce this compounding risk."
+    ),
+    "High Concentration": (
+        "\n\nMultiple sectors exceed 60% concentration or you have extreme concentration in one sector. "
+        "Consider diversifying into uncorrelated sectors like Stablecoins, Layer-1 Alts, or different "
+        "DeFi categories to reduce this compounding risk."
+    ),
+}
+
+# Sector risk narrative templates (filled with str.format_map)
+SECTOR_RISK_NARRATIVE_EMPTY = "Well-diversified across sectors, no concentration warnings."
+SECTOR_RISK_TEMPLATE = (
+    "\n\n📉 Historical Risk:\n"
+    "Your {sector_name} concentration lost {sector_loss} "
+    "during the {crash_scenario} ({crash_period}), "
+    "compared to {market_avg_loss} market average."
+    " Meanwhile, {missed_sector} tokens like {missed_token} "
+    "gained {recovery_gain_pct} during recovery. {opportunity_narrative}"
+)
+
 # Default crash scenario to analyze
 DEFAULT_CRASH_SCENARIO = "crash_2022_bear"
 
+# Distinct portfolios whose SectorAnalysis is memoized (see build_sector_analysis)
+SECTOR_ANALYSIS_CACHE_SIZE = 32
+
 # Agent initialization with seed from environment
 sector_agent = Agent(
     name="sector_agent_local",
@@ -56,6 +108,9 @@ def load_sector_mappings() -> pd.DataFrame:
     """
     Load sector mapping data from JSON file using pandas.
 
+    The file is parsed once per version (keyed by modification time); each
+    call returns a copy so callers can't mutate the cached frame.
+
     Returns:
         DataFrame with token-to-sector mappings
 
@@ -66,21 +121,69 @@ def load_sector_mappings() -> pd.DataFrame:
     if not SECTOR_MAPPINGS_PATH.exists():
         raise FileNotFoundError(f"Sector mappings not found at {SECTOR_MAPPINGS_PATH}")
 
+    return _read_sector_mappings(SECTOR_MAPPINGS_PATH, SECTOR_MAPPINGS_PATH.stat().st_mtime_ns).copy()
+
+
+@lru_cache(maxsize=1)
+def _read_sector_mappings(mappings_path: Path, mtime_ns: int) -> pd.DataFrame:
+    """
+    Parse sector-mappings.json into a DataFrame indexed by token symbol.
+
+    Args:
+        mappings_path: Path to sector-mappings.json
+        mtime_ns: File modification time (cache key only)
+
+    Returns:
+        DataFrame with token-to-sector mappings (shared, treat as read-only)
+
+    Raises:
+        ValueError: If JSON is malformed
+    """
     try:
         # Load JSON and convert to DataFrame
-        df = pd.read_json(SECTOR_MAPPINGS_PATH, orient="index")
+        df = pd.read_json(mappings_path, orient="index")
         logger.info(f"Loaded {len(df)} sector mappings")
         return df
     except Exception as e:
         raise ValueError(f"Failed to load sector mappings: {str(e)}")
 
 
-def load_historical_crashes() -> pd.DataFrame:
+def load_sector_lookup() -> Mapping[str, str]:
     """
-    Load historical crash data from JSON file using pandas.
+    Load the token-symbol to sector-name lookup used for classification.
 
     Returns:
-        DataFrame with historical crash scenarios including sector-specific performance
+        Read-only mapping of token symbol to sector name
+
+    Raises:
+        FileNotFoundError: If sector-mappings.json doesn't exist
+        ValueError: If JSON is malformed
+    """
+    if not SECTOR_MAPPINGS_PATH.exists():
+        raise FileNotFoundError(f"Sector mappings not found at {SECTOR_MAPPINGS_PATH}")
+
+    return _sector_lookup(SECTOR_MAPPINGS_PATH, SECTOR_MAPPINGS_PATH.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _sector_lookup(mappings_path: Path, mtime_ns: int) -> Mapping[str, str]:
+    """Build the symbol -> sector dict once per sector-mappings.json version."""
+    df = _read_sector_mappings(mappings_path, mtime_ns)
+    # Intern sector names: every token in a sector then shares one string
+    # object, so bucket lookups and comparisons short-circuit on identity
+    return MappingProxyType({symbol: sys.intern(sector) for symbol, sector in zip(df.index, df["sector"])})
+
+
+@lru_cache(maxsize=1)
+def _read_crash_scenarios() -> Tuple[dict, ...]:
+    """
+    Parse historical-crashes.json once per process.
+
+    The returned scenario dicts are shared between callers and must be
+    treated as read-only.
+
+    Returns:
+        Tuple of crash scenario dicts, in file order
 
     Raises:
         FileNotFoundError: If historical-crashes.json doesn't exist
@@ -94,14 +197,37 @@ def load_historical_crashes() -> pd.DataFrame:
         with open(HISTORICAL_CRASHES_PATH, 'r') as f:
             data = json.load(f)
 
-        # Convert crashes list to DataFrame
-        df = pd.DataFrame(data["crashes"])
-        logger.info(f"Loaded {len(df)} historical crash scenarios")
-        return df
+        crashes = tuple(data["crashes"])
+        logger.info(f"Loaded {len(crashes)} historical crash scenarios")
+        return crashes
     except Exception as e:
         raise ValueError(f"Failed to load historical crashes: {str(e)}")
 
 
+def load_historical_crashes() -> pd.DataFrame:
+    """
+    Load historical crash data from JSON file using pandas.
+
+    For tabular inspection only: the analysis path looks scenarios up in the
+    cached scenario_id index and never builds this DataFrame.
+
+    Returns:
+        DataFrame with historical crash scenarios including sector-specific performance
+
+    Raises:
+        FileNotFoundError: If historical-crashes.json doesn't exist
+        ValueError: If JSON is malformed
+    """
+    # Convert crashes list to DataFrame (JSON is parsed once and cached)
+    return pd.DataFrame.from_records(_read_crash_scenarios())
+
+
+@lru_cache(maxsize=1)
+def _crashes_by_scenario() -> Mapping[str, dict]:
+    """Index the cached crash scenarios by scenario_id (read-only)."""
+    return MappingProxyType({crash["scenario_id"]: crash for crash in _read_crash_scenarios()})
+
+
 def get_sector_crash_performance(sector_name: str, crash_scenario: str = DEFAULT_CRASH_SCENARIO) -> Dict:
     """
     Query historical sector performance for a specific crash scenario.
@@ -122,18 +248,17 @@ def get_sector_crash_performance(sector_name: str, crash_scenario: str = DEFAULT
         ValueError: If crash scenario or sector not found
     """
     try:
-        crashes_df = load_historical_crashes()
+        crashes = _crashes_by_scenario()
     except FileNotFoundError as e:
         logger.error(f"Historical crashes unavailable: {str(e)}")
         raise
 
     # Find the crash scenario
-    crash = crashes_df[crashes_df["scenario_id"] == crash_scenario]
+    crash_row = crashes.get(crash_scenario)
 
-    if crash.empty:
+    if crash_row is None:
         raise ValueError(f"Crash scenario '{crash_scenario}' not found")
 
-    crash_row = crash.iloc[0]
     sector_performance = crash_row["sector_performance"]
 
     # Check if sector exists in crash data
@@ -171,18 +296,17 @@ def get_opportunity_cost(
         return []
 
     try:
-        crashes_df = load_historical_crashes()
+        crashes = _crashes_by_scenario()
     except FileNotFoundError as e:
         logger.error(f"Historical crashes unavailable: {str(e)}")
         return []
 
     # Find the crash scenario
-    crash = crashes_df[crashes_df["scenario_id"] == crash_scenario]
+    crash_row = crashes.get(crash_scenario)
 
-    if crash.empty:
+    if crash_row is None:
         raise ValueError(f"Crash scenario '{crash_scenario}' not found")
 
-    crash_row = crash.iloc[0]
     opportunity_sectors = crash_row.get("opportunity_cost_sectors", {})
 
     if not opportunity_sectors:
@@ -194,8 +318,9 @@ def get_opportunity_cost(
     for sector_name, opp_data in opportunity_sectors.items():
         # Only show opportunity cost for sectors NOT heavily represented in portfolio
         if sector_name not in concentrated_sectors:
+            # Trusted bundled crash data: construct without re-validating
             opportunity_costs.append(
-                OpportunityCost(
+                OpportunityCost.model_construct(
                     missed_sector=sector_name,
                     missed_token=opp_data["best_performer"],
                     recovery_gain_pct=opp_data["recovery_gain_pct"],
@@ -226,28 +351,33 @@ def generate_sector_risk_narrative(sector_risks: List[SectorRisk]) -> str:
         - Concentrated with risk: "Your 68% DeFi Governance concentration lost 75% in 2022..."
     """
     if not sector_risks:
-        return "Well-diversified across sectors, no concentration warnings."
-
-    narrative_parts = []
+        return SECTOR_RISK_NARRATIVE_EMPTY
 
+    # Risks drawn from the same crash share its period and market average,
+    # so format that part once per scenario and reuse it.
+    scenario_context: Dict[Tuple[str, str, float], Dict[str, str]] = {}
+    parts = []
     for risk in sector_risks:
-        # Crash performance
-        crash_text = (
-            f"Your {risk.sector_name} concentration lost {abs(risk.sector_loss_pct):.0f}% "
-            f"during the {risk.crash_scenario} ({risk.crash_period}), "
-            f"compared to {abs(risk.market_avg_loss_pct):.0f}% market average."
-        )
-
-        # Opportunity cost
-        opp_cost = risk.opportunity_cost
-        opp_text = (
-            f" Meanwhile, {opp_cost.missed_sector} tokens like {opp_cost.missed_token} "
-            f"gained {opp_cost.recovery_gain_pct:.0f}% during recovery. {opp_cost.narrative}"
-        )
-
-        narrative_parts.append(f"\n\n📉 Historical Risk:\n{crash_text}{opp_text}")
+        scenario_key = (risk.crash_scenario, risk.crash_period, risk.market_avg_loss_pct)
+        context = scenario_context.get(scenario_key)
+        if context is None:
+            context = scenario_context[scenario_key] = {
+                "crash_scenario": risk.crash_scenario,
+                "crash_period": risk.crash_period,
+                "market_avg_loss": f"{abs(risk.market_avg_loss_pct):.0f}%",
+            }
+        opportunity = risk.opportunity_cost
+        parts.append(SECTOR_RISK_TEMPLATE.format_map({
+            **context,
+            "sector_name": risk.sector_name,
+            "sector_loss": f"{abs(risk.sector_loss_pct):.0f}%",
+            "missed_sector": opportunity.missed_sector,
+            "missed_token": opportunity.missed_token,
+            "recovery_gain_pct": f"{opportunity.recovery_gain_pct:.0f}%",
+            "opportunity_narrative": opportunity.narrative,
+        }))
 
-    return "".join(narrative_parts)
+    return "".join(parts)
 
 
 def classify_tokens(portfolio: Portfolio) -> Dict[str, Dict]:
@@ -264,11 +394,30 @@ def classify_tokens(portfolio: Portfolio) -> Dict[str, Dict]:
         - percentage: float
         - token_symbols: List[str]
 
+    Raises:
+        FileNotFoundError: If sector mappings file missing
+    """
+    sector_data, _ = _classify_tokens(portfolio, CONCENTRATION_THRESHOLD)
+    return sector_data
+
+
+def _classify_tokens(portfolio: Portfolio, threshold: float) -> Tuple[Dict[str, Dict], List[str]]:
+    """
+    Classify tokens into sectors, flagging concentrated sectors in the same pass.
+
+    Args:
+        portfolio: Portfolio model containing token holdings
+        threshold: Concentration threshold percentage
+
+    Returns:
+        Tuple of (sector breakdown as returned by classify_tokens,
+        sector names whose percentage exceeds threshold)
+
     Raises:
         FileNotFoundError: If sector mappings file missing
     """
     try:
-        sector_map = load_sector_mappings()
+        sector_lookup = load_sector_lookup()
     except FileNotFoundError as e:
         logger.error(f"Sector mappings unavailable: {str(e)}")
         raise
@@ -285,32 +434,33 @@ def classify_tokens(portfolio: Portfolio) -> Dict[str, Dict]:
         symbol = token.symbol
 
         # Look up sector for this token
-        if symbol in sector_map.index:
-            sector_name = sector_map.loc[symbol, "sector"]
-        else:
+        sector_name = sector_lookup.get(symbol)
+        if sector_name is None:
             # Unknown token - add to "Unknown Sector"
             logger.warning(f"Token {symbol} not found in sector mappings, categorizing as Unknown Sector")
-            sector_name = "Unknown Sector"
+            sector_name = UNKNOWN_SECTOR
             unknown_tokens.append(symbol)
             unknown_value += token.value_usd
 
         # Add token value to sector total
-        if sector_name not in sector_data:
-            sector_data[sector_name] = {
+        sector = sector_data.get(sector_name)
+        if sector is None:
+            sector = sector_data[sector_name] = {
                 "sector_name": sector_name,
                 "value_usd": 0.0,
                 "percentage": 0.0,
                 "token_symbols": []
             }
 
-        sector_data[sector_name]["value_usd"] += token.value_usd
-        sector_data[sector_name]["token_symbols"].append(symbol)
+        sector["value_usd"] += token.value_usd
+        sector["token_symbols"].append(symbol)
 
-    # Calculate percentages
-    for sector_name in sector_data:
-        sector_data[sector_name]["percentage"] = (
-            sector_data[sector_name]["value_usd"] / portfolio.total_value_usd * 100
-        )
+    # Calculate percentages, collecting concentrated sectors as we go
+    concentrated = []
+    for sector_name, sector in sector_data.items():
+        sector["percentage"] = sector["value_usd"] / portfolio.total_value_usd * 100
+        if sector["percentage"] > threshold:
+            concentrated.append(sector_name)
 
     logger.info(f"Classified portfolio into {len(sector_data)} sectors")
     if unknown_tokens:
@@ -319,7 +469,34 @@ def classify_tokens(portfolio: Portfolio) -> Dict[str, Dict]:
             f"(${unknown_value:.2f} USD, {unknown_value/portfolio.total_value_usd*100:.1f}%)"
         )
 
-    return sector_data
+    return sector_data, concentrated
+
+
+def analyze_sectors(
+    portfolio: Portfolio,
+    threshold: float = CONCENTRATION_THRESHOLD
+) -> Tuple[Dict[str, Dict], List[str], str]:
+    """
+    Classify tokens, identify concentrated sectors and score diversification.
+
+    Equivalent to classify_tokens -> identify_concentrated_sectors ->
+    calculate_diversification_score, but finds concentrated sectors while
+    computing percentages instead of re-walking the breakdown.
+
+    Args:
+        portfolio: Portfolio model containing token holdings
+        threshold: Concentration threshold percentage (default: 60.0)
+
+    Returns:
+        Tuple of (sector_breakdown, concentrated_sectors, diversification_score)
+
+    Raises:
+        FileNotFoundError: If sector mappings file missing
+    """
+    sector_breakdown, concentrated = _classify_tokens(portfolio, threshold)
+    logger.info(f"Identified {len(concentrated)} concentrated sectors (>{threshold}%): {concentrated}")
+
+    return sector_breakdown, concentrated, calculate_diversification_score(concentrated)
 
 
 def identify_concentrated_sectors(
@@ -357,13 +534,7 @@ def calculate_diversification_score(concentrated_sectors: List[str]) -> str:
         Diversification score: "Well-Diversified" | "Moderate Concentration" | "High Concentration"
     """
     num_concentrated = len(concentrated_sectors)
-
-    if num_concentrated == 0:
-        score = "Well-Diversified"
-    elif num_concentrated == 1:
-        score = "Moderate Concentration"
-    else:
-        score = "High Concentration"
+    score = DIVERSIFICATION_SCORES[min(num_concentrated, len(DIVERSIFICATION_SCORES) - 1)]
 
     logger.info(f"Diversification score: {score} ({num_concentrated} concentrated sectors)")
     return score
@@ -387,14 +558,9 @@ def generate_sector_narrative(
     Returns:
         Plain English narrative with sector breakdown and concentration warnings
     """
-    narrative_parts = []
-
     # Header
-    num_sectors = len(sector_breakdown)
-    if diversification_score == "Well-Diversified":
-        narrative_parts.append(f"Your portfolio is well-diversified across {num_sectors} sectors:\n")
-    else:
-        narrative_parts.append(f"Your portfolio is distributed across {num_sectors} sectors:\n")
+    header = SECTOR_NARRATIVE_HEADERS.get(diversification_score, SECTOR_NARRATIVE_DEFAULT_HEADER)
+    narrative_parts = [header.format_map({"num_sectors": len(sector_breakdown)})]
 
     # Sector breakdown (sorted by percentage descending)
     sorted_sectors = sorted(
@@ -403,46 +569,148 @@ def generate_sector_narrative(
         reverse=True
     )
 
-    for sector_name, data in sorted_sectors:
-        tokens_str = ", ".join(data["token_symbols"])
-        narrative_parts.append(
-            f"\n- {sector_name}: {data['percentage']:.1f}% (${data['value_usd']:.2f} USD) - {tokens_str}"
-        )
+    narrative_parts.extend(
+        SECTOR_LINE_TEMPLATE.format_map({
+            "sector_name": sector_name,
+            "percentage": data["percentage"],
+            "value_usd": data["value_usd"],
+            "tokens": ", ".join(data["token_symbols"]),
+        })
+        for sector_name, data in sorted_sectors
+    )
 
     # Concentration warnings
     if concentrated_sectors:
         narrative_parts.append("\n")
-        for sector_name in concentrated_sectors:
-            sector_pct = sector_breakdown[sector_name]["percentage"]
-            narrative_parts.append(
-                f"\n⚠️ HIGH CONCENTRATION: {sector_pct:.1f}% of your portfolio is in {sector_name} tokens. "
-                f"This creates dangerous sector risk - if {sector_name} crashes, your entire portfolio is exposed."
-            )
+        narrative_parts.extend(
+            CONCENTRATION_WARNING_TEMPLATE.format_map({
+                "sector_name": sector_name,
+                "percentage": sector_breakdown[sector_name]["percentage"],
+            })
+            for sector_name in concentrated_sectors
+        )
 
     # Diversification assessment
-    narrative_parts.append(f"\n\nDiversification Score: {diversification_score}")
+    narrative_parts.append(DIVERSIFICATION_SCORE_TEMPLATE.format_map({"diversification_score": diversification_score}))
 
-    # Risk implication based on score
-    if diversification_score == "Well-Diversified":
-        narrative_parts.append(
-            "\n\nNo sector exceeds 60% concentration. Your portfolio structure demonstrates good sector "
-            "diversification, which reduces the risk of a single-sector crash wiping out your holdings."
-        )
-    elif diversification_score == "Moderate Concentration":
-        narrative_parts.append(
-            "\n\nOne sector exceeds 60% concentration. Consider diversifying into uncorrelated sectors "
-            "to reduce this compounding risk."
-        )
-    else:  # High Concentration
-        narrative_parts.append(
-            "\n\nMultiple sectors exceed 60% concentration or you have extreme concentration in one sector. "
-            "Consider diversifying into uncorrelated sectors like Stablecoins, Layer-1 Alts, or different "
-            "DeFi categories to reduce this compounding risk."
-        )
+    # Risk implication based on score (anything else reads as High Concentration)
+    narrative_parts.append(
+        DIVERSIFICATION_IMPLICATIONS.get(diversification_score, DIVERSIFICATION_IMPLICATIONS["High Concentration"])
+    )
 
     return "".join(narrative_parts)
 
 
+def build_sector_analysis(portfolio: Portfolio) -> SectorAnalysis:
+    """
+    Build the SectorAnalysis for a portfolio, memoized per distinct holdings.
+
+    Results are cached per holdings and sector-mappings.json version, so
+    repeat requests for the same portfolio skip classification, crash lookups
+    and narrative formatting. The returned model is shared between callers
+    and must be treated as read-only.
+
+    Args:
+        portfolio: Portfolio model containing token holdings
+
+    Returns:
+        SectorAnalysis with breakdown, score, sector risks and narrative
+
+    Raises:
+        FileNotFoundError: If sector mappings file missing
+        ValueError: If portfolio data is invalid
+    """
+    holdings = tuple(
+        (token.symbol, token.amount, token.price_usd, token.value_usd) for token in portfolio.tokens
+    )
+    mtime_ns = SECTOR_MAPPINGS_PATH.stat().st_mtime_ns if SECTOR_MAPPINGS_PATH.exists() else 0
+    return _cached_sector_analysis(holdings, portfolio.total_value_usd, mtime_ns)
+
+
+@lru_cache(maxsize=SECTOR_ANALYSIS_CACHE_SIZE)
+def _cached_sector_analysis(
+    holdings: Tuple[Tuple[str, float, float, float], ...],
+    total_value_usd: float,
+    mtime_ns: int,
+) -> SectorAnalysis:
+    """
+    Compute the SectorAnalysis for one set of holdings.
+
+    Args:
+        holdings: (symbol, amount, price_usd, value_usd) per token, in portfolio order
+        total_value_usd: Total portfolio value in USD
+        mtime_ns: Modification time of sector-mappings.json (cache key only)
+
+    Returns:
+        SectorAnalysis for the holdings
+    """
+    # Holdings come from an already-validated Portfolio, so skip re-validation
+    portfolio = Portfolio.model_construct(
+        tokens=[
+            TokenHolding.model_construct(symbol=symbol, amount=amount, price_usd=price_usd, value_usd=value_usd)
+            for symbol, amount, price_usd, value_usd in holdings
+        ],
+        total_value_usd=total_value_usd,
+    )
+
+    # Classify tokens into sectors, identify concentrated sectors and
+    # calculate diversification score
+    sector_breakdown, concentrated_sectors, diversification_score = analyze_sectors(portfolio)
+
+    # Generate plain English narrative (sector breakdown)
+    narrative = generate_sector_narrative(
+        sector_breakdown,
+        concentrated_sectors,
+        diversification_score,
+        portfolio.total_value_usd
+    )
+
+    # Build sector_risks list with historical crash performance (Story 1.6)
+    sector_risks = []
+    if concentrated_sectors:
+        try:
+            # Get opportunity cost once (same for all concentrated sectors)
+            opportunity_costs = get_opportunity_cost(concentrated_sectors)
+
+            # For each concentrated sector, get crash performance
+            for sector_name in concentrated_sectors:
+                # Get sector crash performance
+                crash_perf = get_sector_crash_performance(sector_name)
+
+                # Build SectorRisk object
+                if opportunity_costs:
+                    sector_risk = SectorRisk(
+                        sector_name=sector_name,
+                        crash_scenario=crash_perf["crash_name"],
+                        sector_loss_pct=crash_perf["sector_loss_pct"],
+                        market_avg_loss_pct=crash_perf["market_avg_loss_pct"],
+                        crash_period=crash_perf["crash_period"],
+                        opportunity_cost=opportunity_costs[0]
+                    )
+                    sector_risks.append(sector_risk)
+
+                    # Break after first sector (avoid duplicate opportunity costs)
+                    break
+
+        except (ValueError, FileNotFoundError) as e:
+            # If historical data unavailable, log warning but continue without sector_risks
+            logger.warning(f"Could not load historical crash data: {str(e)}")
+            sector_risks = []
+
+    # Append historical risk narrative to main narrative
+    historical_narrative = generate_sector_risk_narrative(sector_risks)
+    narrative = narrative + historical_narrative
+
+    # Build SectorAnalysis model
+    return SectorAnalysis(
+        sector_breakdown=sector_breakdown,
+        concentrated_sectors=concentrated_sectors,
+        diversification_score=diversification_score,
+        sector_risks=sector_risks,  # NOW POPULATED with historical data
+        narrative=narrative
+    )
+
+
 @sector_agent.on_message(model=AnalysisRequest)
 async def handle_analysis_request(ctx: Context, sender: str, msg: AnalysisRequest):
     """
@@ -462,67 +730,8 @@ async def handle_analysis_request(ctx: Context, sender: str, msg: AnalysisReques
         # Convert portfolio_data dict to Portfolio model
         portfolio = Portfolio(**msg.portfolio_data)
 
-        # Classify tokens into sectors
-        sector_breakdown = classify_tokens(portfolio)
-
-        # Identify concentrated sectors
-        concentrated_sectors = identify_concentrated_sectors(sector_breakdown)
-
-        # Calculate diversification score
-        diversification_score = calculate_diversification_score(concentrated_sectors)
-
-        # Generate plain English narrative (sector breakdown)
-        narrative = generate_sector_narrative(
-            sector_breakdown,
-            concentrated_sectors,
-            diversification_score,
-            portfolio.total_value_usd
-        )
-
-        # Build sector_risks list with historical crash performance (Story 1.6)
-        sector_risks = []
-        if concentrated_sectors:
-            try:
-                # Get opportunity cost once (same for all concentrated sectors)
-                opportunity_costs = get_opportunity_cost(concentrated_sectors)
-
-                # For each concentrated sector, get crash performance
-                for sector_name in concentrated_sectors:
-                    # Get sector crash performance
-                    crash_perf = get_sector_crash_performance(sector_name)
-
-                    # Build SectorRisk object
-                    if opportunity_costs:
-                        sector_risk = SectorRisk(
-                            sector_name=sector_name,
-                            crash_scenario=crash_perf["crash_name"],
-                            sector_loss_pct=crash_perf["sector_loss_pct"],
-                            market_avg_loss_pct=crash_perf["market_avg_loss_pct"],
-                            crash_period=crash_perf["crash_period"],
-                            opportunity_cost=opportunity_costs[0]
-                        )
-                        sector_risks.append(sector_risk)
-
-                        # Break after first sector (avoid duplicate opportunity costs)
-                        break
-
-            except (ValueError, FileNotFoundError) as e:
-                # If historical data unavailable, log warning but continue without sector_risks
-                logger.warning(f"Could not load historical crash data: {str(e)}")
-                sector_risks = []
-
-        # Append historical risk narrative to main narrative
-        historical_narrative = generate_sector_risk_narrative(sector_risks)
-        narrative = narrative + historical_narrative
-
-        # Build SectorAnalysis model
-        analysis = SectorAnalysis(
-            sector_breakdown=sector_breakdown,
-            concentrated_sectors=concentrated_sectors,
-            diversification_score=diversification_score,
-            sector_risks=sector_risks,  # NOW POPULATED with historical data
-            narrative=narrative
-        )
+        # Classify sectors, attach crash context and build the narrative
+        analysis = build_sector_analysis(portfolio)
 
         # Calculate processing time
         processing_time_ms = int((time.time() - start_time) * 1000)
@@ -7,16 +7,20 @@ and stores them as CSV files in data/historical_prices/.
 
 Rate limiting: 1 API call per second (respects CoinGecko free tier)
 Error handling: Retries on 429 errors with exponential backoff
+Caching: Tokens whose CSV is less than 12 hours old are skipped (use --force)
 """
 
+import argparse
+import csv
 import json
 import logging
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import pandas as pd
+import numpy as np
 import requests
 
 # Configure logging
@@ -27,9 +31,18 @@ logger = logging.getLogger(__name__)
 
 # CoinGecko API configuration
 COINGECKO_API_BASE = "https://api.coingecko.com/api/v3"
+MARKET_CHART_URL = COINGECKO_API_BASE + "/coins/{}/market_chart"
+DEFAULT_CHART_PARAMS = {"vs_currency": "usd", "days": 90, "interval": "daily"}
 RATE_LIMIT_DELAY = 1.0  # seconds between API calls
 MAX_RETRIES = 3
 RETRY_DELAY = 60  # seconds to wait on 429 error
+WRITER_THREADS = 4  # background threads for validation + CSV writes
+CSV_MAX_AGE_SECONDS = 12 * 3600  # reuse CSVs downloaded within this window
+CSV_WRITE_BUFFER = 1 << 20  # 1 MiB userspace buffer -> one write(2) per file
+
+# Price data is kept as a dict of column arrays (no pandas in this script)
+CSV_COLUMNS = ("date", "price_usd", "volume_usd")
+PriceData = Dict[str, np.ndarray]
 
 # Top 30 DeFi tokens (CoinGecko IDs)
 DEFI_TOKENS = {
@@ -74,10 +87,16 @@ DEFI_TOKENS = {
     "convex-finance": "CVX",
 }
 
+# Frozen (coin_id, symbol) pairs in download order
+TOKEN_PAIRS = tuple(DEFI_TOKENS.items())
+
 
 def get_historical_prices(
-    coin_id: str, days: int = 90, vs_currency: str = "usd"
-) -> Optional[pd.DataFrame]:
+    coin_id: str,
+    days: int = 90,
+    vs_currency: str = "usd",
+    session: Optional[requests.Session] = None,
+) -> Optional[PriceData]:
     """
     Fetch historical price data from CoinGecko API.
 
@@ -85,18 +104,25 @@ def get_historical_prices(
         coin_id: CoinGecko coin ID (e.g., 'uniswap')
         days: Number of days of historical data (default 90)
         vs_currency: Currency for pricing (default 'usd')
+        session: Optional shared session so consecutive calls reuse the
+            same keep-alive connection to CoinGecko
 
     Returns:
-        DataFrame with columns: date, price_usd, volume_usd
+        Dict of column arrays: date, price_usd, volume_usd
         None if request fails after all retries
     """
-    url = f"{COINGECKO_API_BASE}/coins/{coin_id}/market_chart"
-    params = {"vs_currency": vs_currency, "days": days, "interval": "daily"}
+    url = MARKET_CHART_URL.format(coin_id)
+    # requests does not mutate params, so the default query can be shared
+    if days == DEFAULT_CHART_PARAMS["days"] and vs_currency == DEFAULT_CHART_PARAMS["vs_currency"]:
+        params = DEFAULT_CHART_PARAMS
+    else:
+        params = {"vs_currency": vs_currency, "days": days, "interval": "daily"}
+    http = session or requests
 
     for attempt in range(MAX_RETRIES):
         try:
             logger.info(f"Fetching {coin_id} (attempt {attempt + 1}/{MAX_RETRIES})")
-            response = requests.get(url, params=params, timeout=10)
+            response = http.get(url, params=params, timeout=10)
 
             if response.status_code == 429:
                 logger.warning(
@@ -116,17 +142,28 @@ def get_historical_prices(
                 logger.error(f"No data returned for {coin_id}")
                 return None
 
-            # Convert to DataFrame
-            df = pd.DataFrame(
-                {
-                    "date": [datetime.fromtimestamp(p[0] / 1000).date() for p in prices],
-                    "price_usd": [p[1] for p in prices],
-                    "volume_usd": [v[1] for v in volumes],
-                }
-            )
+            if len(prices) != len(volumes):
+                logger.error(
+                    f"Mismatched data for {coin_id}: "
+                    f"{len(prices)} prices vs {len(volumes)} volumes"
+                )
+                return None
 
-            logger.info(f"✓ Fetched {len(df)} days of data for {coin_id}")
-            return df
+            # Convert [timestamp_ms, value] pairs to column arrays
+            prices_arr = np.asarray(prices, dtype=np.float64)
+            volumes_arr = np.asarray(volumes, dtype=np.float64)
+            price_data = {
+                # ms timestamps -> UTC calendar days in one vectorised cast
+                "date": prices_arr[:, 0]
+                .astype(np.int64)
+                .astype("datetime64[ms]")
+                .astype("datetime64[D]"),
+                "price_usd": prices_arr[:, 1],
+                "volume_usd": volumes_arr[:, 1],
+            }
+
+            logger.info(f"✓ Fetched {len(prices_arr)} days of data for {coin_id}")
+            return price_data
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Request failed for {coin_id}: {e}")
@@ -138,12 +175,12 @@ def get_historical_prices(
     return None
 
 
-def save_to_csv(df: pd.DataFrame, symbol: str, output_dir: Path) -> bool:
+def save_to_csv(price_data: PriceData, symbol: str, output_dir: Path) -> bool:
     """
     Save price data to CSV file.
 
     Args:
-        df: DataFrame with price data
+        price_data: Dict of column arrays (date, price_usd, volume_usd)
         symbol: Token symbol (e.g., 'UNI')
         output_dir: Directory to save CSV files
 
@@ -152,46 +189,58 @@ def save_to_csv(df: pd.DataFrame, symbol: str, output_dir: Path) -> bool:
     """
     try:
         output_path = output_dir / f"{symbol}.csv"
-        df.to_csv(output_path, index=False)
-        logger.info(f"✓ Saved {symbol}.csv ({len(df)} rows)")
+        # tolist() yields Python floats so values are written as plain repr()
+        rows = zip(*(price_data[column].tolist() for column in CSV_COLUMNS))
+        with open(output_path, "w", buffering=CSV_WRITE_BUFFER, newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(rows)
+        logger.info(f"✓ Saved {symbol}.csv ({len(price_data['date'])} rows)")
         return True
     except Exception as e:
         logger.error(f"Failed to save {symbol}.csv: {e}")
         return False
 
 
-def validate_data(df: pd.DataFrame, symbol: str, expected_days: int = 90) -> bool:
+def validate_data(
+    price_data: Optional[PriceData], symbol: str, expected_days: int = 90
+) -> bool:
     """
     Validate downloaded price data.
 
     Args:
-        df: DataFrame to validate
+        price_data: Dict of column arrays to validate
         symbol: Token symbol for logging
         expected_days: Expected number of days (default 90)
 
     Returns:
         True if validation passes, False otherwise
     """
-    if df is None or df.empty:
-        logger.error(f"Validation failed for {symbol}: DataFrame is empty")
+    if price_data is None or len(price_data["date"]) == 0:
+        logger.error(f"Validation failed for {symbol}: no price data")
         return False
 
+    row_count = len(price_data["date"])
+
     # Check for missing dates (allow some variance due to API behavior)
-    if len(df) < expected_days * 0.9:  # Allow 10% variance
+    if row_count < expected_days * 0.9:  # Allow 10% variance
         logger.warning(
-            f"Validation warning for {symbol}: Only {len(df)} days (expected ~{expected_days})"
+            f"Validation warning for {symbol}: Only {row_count} days (expected ~{expected_days})"
         )
 
+    prices = price_data["price_usd"]
+    volumes = price_data["volume_usd"]
+
     # Check for zero prices
-    zero_prices = df[df["price_usd"] == 0]
-    if not zero_prices.empty:
+    zero_count = int(np.count_nonzero(prices == 0))
+    if zero_count:
         logger.error(
-            f"Validation failed for {symbol}: {len(zero_prices)} zero prices found"
+            f"Validation failed for {symbol}: {zero_count} zero prices found"
         )
         return False
 
     # Check for negative values
-    if (df["price_usd"] < 0).any() or (df["volume_usd"] < 0).any():
+    if bool(((prices < 0) | (volumes < 0)).any()):
         logger.error(f"Validation failed for {symbol}: Negative values found")
         return False
 
@@ -199,6 +248,28 @@ def validate_data(df: pd.DataFrame, symbol: str, expected_days: int = 90) -> boo
     return True
 
 
+def save_and_validate(price_data: PriceData, symbol: str, output_dir: Path) -> bool:
+    """
+    Validate price data and save it to CSV in one step.
+
+    Runs on a worker thread so disk writes overlap with the next token's
+    HTTP fetch and rate-limit delay.
+
+    Args:
+        price_data: Dict of column arrays (date, price_usd, volume_usd)
+        symbol: Token symbol (e.g., 'UNI')
+        output_dir: Directory to save CSV files
+
+    Returns:
+        True if validation and save succeeded, False otherwise
+    """
+    if not validate_data(price_data, symbol):
+        logger.error(f"✗ Validation failed for {symbol}")
+        return False
+
+    return save_to_csv(price_data, symbol, output_dir)
+
+
 def create_readme(output_dir: Path, success_count: int, total_count: int):
     """Create README documenting the data collection."""
     readme_content = f"""# Historical Price Data
@@ -216,6 +287,9 @@ Each CSV file contains daily price data with the following columns:
 - `price_usd`: Closing price in USD
 - `volume_usd`: 24-hour trading volume in USD
 
+Files are stored one CSV per token (not a combined Parquet dataset) because the
+hosted agents fetch each `<SYMBOL>.csv` from GitHub raw URLs and parse it without pandas.
+
 ## Token List
 Top DeFi tokens including:
 - DeFi Governance: UNI, AAVE, COMP, MKR, SNX, CRV, BAL, YFI
@@ -241,7 +315,8 @@ Historical price data is used for:
 ## Updates
 To refresh the data, run:
 ```bash
-python scripts/download_prices.py
+python scripts/download_prices.py          # skips CSVs updated in the last 12h
+python scripts/download_prices.py --force  # re-download everything
 ```
 
 **Note**: Respect CoinGecko rate limits (1 call/second for free tier).
@@ -251,10 +326,32 @@ python scripts/download_prices.py
     logger.info(f"✓ Created README.md")
 
 
-def main():
-    """Main execution function."""
+def is_csv_current(output_path: Path, max_age_seconds: float = CSV_MAX_AGE_SECONDS) -> bool:
+    """
+    Check whether a previously downloaded CSV is recent enough to reuse.
+
+    Args:
+        output_path: Path to the token's CSV file
+        max_age_seconds: Maximum file age before it is re-downloaded
+
+    Returns:
+        True if the file exists and was modified within max_age_seconds
+    """
+    try:
+        return (time.time() - output_path.stat().st_mtime) < max_age_seconds
+    except FileNotFoundError:
+        return False
+
+
+def main(force: bool = False):
+    """
+    Main execution function.
+
+    Args:
+        force: Re-download every token even if its CSV is current
+    """
     logger.info("Starting historical price data download...")
-    logger.info(f"Target: {len(DEFI_TOKENS)} tokens, 90-day window")
+    logger.info(f"Target: {len(TOKEN_PAIRS)} tokens, 90-day window")
 
     # Setup output directory
     output_dir = Path(__file__).parent.parent / "data" / "historical_prices"
@@ -262,41 +359,53 @@ def main():
 
     success_count = 0
     failed_tokens = []
+    pending_writes: Dict[str, Future] = {}
+
+    # Download data for each token; validation + CSV writes run in the
+    # background so they overlap with the next fetch. The market_chart
+    # history is per-coin only (the batch /coins/markets endpoint has no
+    # time series), so one session amortizes connection setup instead.
+    with requests.Session() as session, ThreadPoolExecutor(
+        max_workers=WRITER_THREADS
+    ) as executor:
+        for coin_id, symbol in TOKEN_PAIRS:
+            logger.info(f"\n--- Processing {symbol} ({coin_id}) ---")
+
+            # Skip tokens downloaded recently (idempotent reruns, saves API quota)
+            if not force and is_csv_current(output_dir / f"{symbol}.csv"):
+                logger.info(f"✓ Using cached {symbol}.csv")
+                success_count += 1
+                continue
 
-    # Download data for each token
-    for coin_id, symbol in DEFI_TOKENS.items():
-        logger.info(f"\n--- Processing {symbol} ({coin_id}) ---")
+            # Fetch data
+            price_data = get_historical_prices(coin_id, days=90, session=session)
 
-        # Fetch data
-        df = get_historical_prices(coin_id, days=90)
+            if price_data is None:
+                logger.error(f"✗ Failed to fetch {symbol}")
+                failed_tokens.append(symbol)
+                continue
 
-        if df is None:
-            logger.error(f"✗ Failed to fetch {symbol}")
-            failed_tokens.append(symbol)
-            continue
+            # Validate and save to CSV
+            pending_writes[symbol] = executor.submit(
+                save_and_validate, price_data, symbol, output_dir
+            )
 
-        # Validate data
-        if not validate_data(df, symbol):
-            logger.error(f"✗ Validation failed for {symbol}")
-            failed_tokens.append(symbol)
-            continue
+            # Rate limiting
+            time.sleep(RATE_LIMIT_DELAY)
 
-        # Save to CSV
-        if save_to_csv(df, symbol, output_dir):
+    for symbol, future in pending_writes.items():
+        if future.result():
             success_count += 1
         else:
             failed_tokens.append(symbol)
 
-        # Rate limiting
-        time.sleep(RATE_LIMIT_DELAY)
-
     # Create README
-    create_readme(output_dir, success_count, len(DEFI_TOKENS))
+    create_readme(output_dir, success_count, len(TOKEN_PAIRS))
 
     # Summary
     logger.info(f"\n{'='*60}")
     logger.info(f"Download complete!")
-    logger.info(f"Success: {success_count}/{len(DEFI_TOKENS)} tokens")
+    logger.info(f"Success: {success_count}/{len(TOKEN_PAIRS)} tokens")
     if failed_tokens:
         logger.warning(f"Failed tokens: {', '.join(failed_tokens)}")
     logger.info(f"Output directory: {output_dir}")
@@ -304,4 +413,11 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-download all tokens even if their CSV files are current",
+    )
+    args = parser.parse_args()
+    main(force=args.force)
@@ -25,13 +25,17 @@ Environment Variables (set in Agentverse dashboard):
 - [OTHER_CONFIG_VARS]=value
 """
 
+import asyncio
 import os
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from uuid import uuid4
 from typing import Any, Dict, List
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pydantic import BaseModel, ConfigDict, Field
 from uagents import Agent, Context, Model, Protocol
 from uagents_core.models import ErrorMessage
@@ -72,6 +76,22 @@ AI_AGENT_ADDRESS = OPENAI_AGENT if AI_AGENT_CHOICE == "openai" else CLAUDE_AGENT
 # THRESHOLD_VALUE = float(get_env_var("THRESHOLD_VALUE", "85"))
 # API_ENDPOINT = get_env_var("API_ENDPOINT", "https://api.example.com")
 
+# Shared HTTP session: reuses keep-alive connections (no TCP/TLS handshake per
+# request) and retries transient failures with backoff
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
 print(f"✅ Configuration loaded")
 
 # =============================================================================
@@ -143,6 +163,11 @@ class AgentRequest(Model):
     requested_by: str
 
 
+# JSON schema sent to the AI agent for parameter extraction.
+# Built once at import; it is only read when constructing prompts.
+AGENT_REQUEST_SCHEMA: Dict[str, Any] = AgentRequest.model_json_schema()
+
+
 class AgentResponse(Model):
     """Response message with analysis results."""
     request_id: str
@@ -176,13 +201,30 @@ class StructuredOutputResponse(Model):
 # CORE BUSINESS LOGIC FUNCTIONS
 # =============================================================================
 
-def process_request(request_data: YourRequestModel) -> YourResponseModel:
+async def fetch_json(url: str) -> Dict[str, Any]:
+    """
+    Fetch a JSON payload via the shared HTTP_SESSION without blocking.
+
+    requests is synchronous, so the call runs in a worker thread and the
+    agent's event loop keeps handling other messages meanwhile.
+
+    Raises:
+        requests.exceptions.RequestException: On connection or HTTP errors
+    """
+    response = await asyncio.to_thread(HTTP_SESSION.get, url, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
+async def process_request(request_data: YourRequestModel) -> YourResponseModel:
     """
     Main business logic function.
 
     Replace this with your actual processing logic.
+    Keep it async: issue independent data-source calls together with
+    asyncio.gather so latency is the slowest call rather than the sum.
     Use only Agentverse-supported libraries:
-    - requests (HTTP calls)
+    - requests (HTTP calls - use fetch_json / the shared HTTP_SESSION)
     - Python built-ins (json, csv, statistics, math, etc.)
     - Database connectors (MySQLdb, pymongo if needed)
     - AI libraries (openai, langchain, etc. if needed)
@@ -200,14 +242,13 @@ def process_request(request_data: YourRequestModel) -> YourResponseModel:
     # Example processing logic (REPLACE WITH YOUR LOGIC)
     print(f"🔍 Processing request: {request_data.field1}")
 
-    # Example: Fetch data from external API
+    # Example: Fetch data from external APIs concurrently
     try:
-        response = requests.get(
-            f"https://api.example.com/data/{request_data.field1}",
-            timeout=10
+        (data,) = await asyncio.gather(
+            fetch_json(f"https://api.example.com/data/{request_data.field1}"),
+            # Add further independent sources here, e.g.:
+            # fetch_json(f"https://api.example.com/metadata/{request_data.field1}"),
         )
-        response.raise_for_status()
-        data = response.json()
     except Exception as e:
         raise ValueError(f"Failed to fetch data: {e}")
 
@@ -235,6 +276,14 @@ agent = Agent(
 
 print(f"✅ Agent initialized with address: {agent.address}")
 
+# Session -> sender routing cache. Chat turns are resolved from memory; the
+# durable ctx.storage copy is only written when a session's sender changes
+# and is read back if the agent restarted mid-conversation. Sessions often
+# end without an EndSessionContent, so the map keeps only the most recently
+# active MAX_CACHED_SESSIONS entries.
+MAX_CACHED_SESSIONS = 1024
+_SESSION_SENDERS: OrderedDict[str, str] = OrderedDict()
+
 # Create protocols
 chat_proto = Protocol(spec=chat_protocol_spec)
 struct_output_proto = Protocol(
@@ -254,9 +303,6 @@ async def handle_chat_message(ctx: Context, sender: str, msg: ChatMessage):
     """
     ctx.logger.info(f"📨 Received ChatMessage from {sender}")
 
-    # Store session sender for response routing
-    ctx.storage.set(str(ctx.session), sender)
-
     # Send acknowledgement
     await ctx.send(
         sender,
@@ -267,26 +313,46 @@ async def handle_chat_message(ctx: Context, sender: str, msg: ChatMessage):
     )
 
     # Process message content
+    session_id = str(ctx.session)
+    session_ended = False
+    query_parts: List[str] = []
+
     for content in msg.content:
         if isinstance(content, StartSessionContent):
             ctx.logger.info(f"🟢 Session started with {sender}")
-            continue
 
         elif isinstance(content, EndSessionContent):
             ctx.logger.info(f"🔴 Session ended with {sender}")
-            continue
+            session_ended = True
 
         elif isinstance(content, TextContent):
-            ctx.logger.info(f"💬 User query: {content.text}")
+            query_parts.append(content.text)
+
+    # Session bookkeeping only: no routing state to store, nothing to extract
+    if query_parts:
+        # Store session sender for response routing
+        if _SESSION_SENDERS.get(session_id) != sender:
+            _SESSION_SENDERS[session_id] = sender
+            ctx.storage.set(session_id, sender)
+            if len(_SESSION_SENDERS) > MAX_CACHED_SESSIONS:
+                _SESSION_SENDERS.popitem(last=False)
+        _SESSION_SENDERS.move_to_end(session_id)
+
+        user_query = "\n".join(query_parts)
+        ctx.logger.info(f"💬 User query: {user_query}")
+
+        # Forward to AI agent for structured parameter extraction
+        # (one prompt per message, even if it carries several text items)
+        await ctx.send(
+            AI_AGENT_ADDRESS,
+            StructuredOutputPrompt(
+                prompt=user_query,
+                output_schema=AGENT_REQUEST_SCHEMA
+            ),
+        )
 
-            # Forward to AI agent for structured parameter extraction
-            await ctx.send(
-                AI_AGENT_ADDRESS,
-                StructuredOutputPrompt(
-                    prompt=content.text,
-                    output_schema=AgentRequest.schema()
-                ),
-            )
+    if session_ended:
+        _SESSION_SENDERS.pop(session_id, None)
 
 
 @chat_proto.on_message(ChatAcknowledgement)
@@ -305,7 +371,8 @@ async def handle_structured_output(ctx: Context, sender: str, msg: StructuredOut
     Handle AI agent response with extracted parameters.
     Processes request and sends result back to user.
     """
-    session_sender = ctx.storage.get(str(ctx.session))
+    session_id = str(ctx.session)
+    session_sender = _SESSION_SENDERS.get(session_id) or ctx.storage.get(session_id)
 
     if session_sender is None:
         ctx.logger.error("❌ No session sender found in storage")
@@ -327,7 +394,7 @@ async def handle_structured_output(ctx: Context, sender: str, msg: StructuredOut
 
     try:
         # Parse extracted parameters
-        request = AgentRequest.parse_obj(msg.output)
+        request = AgentRequest.model_validate(msg.output)
 
         ctx.logger.info(f"🔍 Processing request for {request.field1}")
 
@@ -338,7 +405,7 @@ async def handle_structured_output(ctx: Context, sender: str, msg: StructuredOut
         )
 
         # Process request
-        result = process_request(request_data)
+        result = await process_request(request_data)
 
         processing_time_ms = int((time.time() - start_time) * 1000)
 
@@ -404,7 +471,7 @@ async def handle_direct_request(ctx: Context, sender: str, msg: AgentRequest):
         )
 
         # Process request
-        result = process_request(request_data)
+        result = await process_request(request_data)
 
         processing_time_ms = int((time.time() - start_time) * 1000)
 
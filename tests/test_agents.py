@@ -5,6 +5,9 @@ This module tests the correlation calculation functions in isolation with mocked
 dependencies to ensure accuracy and edge case handling.
 """
 
+import os
+import re
+import shutil
 import pytest
 from unittest.mock import Mock, patch
 import pandas as pd
@@ -12,10 +15,17 @@ import numpy as np
 
 from agents.correlation_agent_local import (
     calculate_portfolio_returns,
+    calculate_portfolio_returns_batch,
     load_eth_returns,
+    _cached_eth_returns,
     calculate_pearson_correlation,
+    calculate_pearson_correlations_batch,
     calculate_daily_returns,
     load_price_data,
+    interpret_correlation,
+    get_correlation_bracket,
+    build_correlation_analysis,
+    HISTORICAL_PRICES_DIR,
 )
 from agents.shared.models import Portfolio, TokenHolding, SectorRisk, OpportunityCost
 
@@ -61,6 +71,14 @@ def sample_price_data():
     return csv_content
 
 
+@pytest.fixture(scope="session")
+def price_dates_91():
+    """Fixture providing 91 daily dates (90 returns), built once per session."""
+    dates = pd.date_range('2025-01-01', periods=91).to_numpy()
+    dates.flags.writeable = False
+    return dates
+
+
 # Unit Tests
 
 def test_calculate_daily_returns():
@@ -76,6 +94,26 @@ def test_calculate_daily_returns():
     assert returns.iloc[3] == pytest.approx(-0.018181818, abs=0.001)  # (108-110)/110
 
 
+def test_calculate_daily_returns_missing_prices():
+    """Test missing prices are forward-filled and undefined returns dropped, like pct_change().dropna()."""
+    returns = calculate_daily_returns(pd.Series([1.0, 2.0, np.nan, 4.0, 5.0]))
+    assert returns.tolist() == pytest.approx([1.0, 0.0, 1.0, 0.25])
+    assert list(returns.index) == [1, 2, 3, 4]
+
+    # Leading gaps have nothing to fill from and are dropped
+    returns = calculate_daily_returns(pd.Series([np.nan, 2.0, 3.0]))
+    assert returns.tolist() == pytest.approx([0.5])
+    assert list(returns.index) == [2]
+
+
+def test_calculate_daily_returns_zero_prices():
+    """Test zero previous prices give inf, and 0/0 returns are dropped, without warnings."""
+    returns = calculate_daily_returns(pd.Series([0.0, 0.0, 1.0, 2.0]))
+
+    assert returns.tolist() == [np.inf, 1.0]
+    assert list(returns.index) == [2, 3]
+
+
 def test_pearson_correlation_high():
     """Test correlation calculation with known high correlation input."""
     # Create mock returns with high correlation (0.95+)
@@ -114,6 +152,40 @@ def test_pearson_correlation_perfect():
     assert correlation == pytest.approx(1.0)
 
 
+def test_pearson_correlation_same_constant_series():
+    """Test the same constant series passed twice is still undefined (0.0), not 1.0."""
+    returns = pd.Series([0.01] * 5, index=pd.date_range('2025-01-01', periods=5))
+
+    assert calculate_pearson_correlation(returns, returns) == 0.0
+
+
+def test_pearson_correlations_batch_matches_scalar():
+    """Test batch correlations match calculate_pearson_correlation row by row."""
+    np.random.seed(42)
+    dates = pd.date_range('2025-01-01', periods=90)
+    eth_returns = np.random.randn(90) * 0.02
+    matrix = np.vstack([
+        eth_returns + np.random.randn(90) * 0.005,  # High
+        eth_returns * 0.7 + np.random.randn(90) * 0.015,  # Moderate
+        -eth_returns,  # Inverse
+        np.full(90, 0.01),  # Constant (undefined)
+    ])
+
+    correlations = calculate_pearson_correlations_batch(matrix, eth_returns)
+
+    eth_series = pd.Series(eth_returns, index=dates)
+    expected = [calculate_pearson_correlation(pd.Series(row, index=dates), eth_series) for row in matrix]
+    np.testing.assert_allclose(correlations, expected, atol=1e-12)
+    assert correlations[2] == pytest.approx(-1.0)
+    assert correlations[3] == 0.0
+
+
+def test_pearson_correlations_batch_shape_mismatch():
+    """Test batch correlations reject a matrix not aligned to ETH returns."""
+    with pytest.raises(ValueError, match="portfolio returns matrix"):
+        calculate_pearson_correlations_batch(np.zeros((2, 5)), np.zeros(4))
+
+
 def test_pearson_correlation_alignment():
     """Test that correlation handles misaligned date indices."""
     portfolio_returns = pd.Series(
@@ -178,50 +250,42 @@ def test_load_eth_returns(mock_load):
     mock_load.return_value = mock_df
 
     eth_returns = load_eth_returns(days=5)
+    # Drop the memoized mock result so it can't leak into other tests
+    _cached_eth_returns.cache_clear()
 
     assert len(eth_returns) == 5  # 6 prices = 5 returns
     assert eth_returns.iloc[0] == pytest.approx(0.02)  # (2550-2500)/2500
 
 
-@patch("agents.correlation_agent_local.load_price_data")
-def test_calculate_portfolio_returns_single_token(mock_load, single_token_portfolio):
+@patch("agents.correlation_agent_local.load_price_arrays")
+def test_calculate_portfolio_returns_single_token(mock_load, single_token_portfolio, price_dates_91):
     """Test portfolio returns with single token."""
     # Mock ETH price data with 90+ days
-    dates = pd.date_range('2025-01-01', periods=91)
-    prices = [2500 + i * 10 for i in range(91)]  # Trending prices
-    mock_df = pd.DataFrame({
-        "date": dates,
-        "price_usd": prices,
-        "volume_usd": [1000000] * 91
-    })
-    mock_load.return_value = mock_df
+    prices = np.arange(91, dtype=np.float64) * 10.0 + 2500.0  # Trending prices
+    mock_load.return_value = price_dates_91, prices
 
     returns = calculate_portfolio_returns(single_token_portfolio, days=90)
 
     # Should return series of 90 returns
     assert len(returns) == 90
     assert isinstance(returns, pd.Series)
+    # Single token has weight 1: portfolio returns are the token's returns
+    np.testing.assert_allclose(returns.to_numpy(), np.diff(prices) / prices[:-1])
 
 
-@patch("agents.correlation_agent_local.load_price_data")
-def test_calculate_portfolio_returns_weighted(mock_load, sample_portfolio):
+@patch("agents.correlation_agent_local.load_price_arrays")
+def test_calculate_portfolio_returns_weighted(mock_load, sample_portfolio, price_dates_91):
     """Test weighted portfolio returns calculation."""
     # Mock price data for both tokens with 91 days
-    dates = pd.date_range('2025-01-01', periods=91)
-
     def mock_load_side_effect(symbol, days):
         if symbol == "UNI":
-            prices = [6.0 + i * 0.01 for i in range(91)]
+            prices = np.arange(91, dtype=np.float64) * 0.01 + 6.0
         elif symbol == "AAVE":
-            prices = [90.0 + i * 0.1 for i in range(91)]
+            prices = np.arange(91, dtype=np.float64) * 0.1 + 90.0
         else:
             raise FileNotFoundError(f"No data for {symbol}")
 
-        return pd.DataFrame({
-            "date": dates,
-            "price_usd": prices,
-            "volume_usd": [1000000] * 91
-        })
+        return price_dates_91, prices
 
     mock_load.side_effect = mock_load_side_effect
 
@@ -232,17 +296,13 @@ def test_calculate_portfolio_returns_weighted(mock_load, sample_portfolio):
     assert isinstance(returns, pd.Series)
 
 
-@patch("agents.correlation_agent_local.load_price_data")
+@patch("agents.correlation_agent_local.load_price_arrays")
 def test_calculate_portfolio_returns_insufficient_data(mock_load, sample_portfolio):
     """Test error handling when token has insufficient data (<60 days)."""
     dates = pd.date_range('2025-01-01', periods=31)  # Only 30 days
 
     def mock_load_side_effect(symbol, days):
-        return pd.DataFrame({
-            "date": dates,
-            "price_usd": [100.0] * 31,
-            "volume_usd": [1000000] * 31
-        })
+        return dates.to_numpy(), np.full(31, 100.0)
 
     mock_load.side_effect = mock_load_side_effect
 
@@ -251,7 +311,7 @@ def test_calculate_portfolio_returns_insufficient_data(mock_load, sample_portfol
         calculate_portfolio_returns(sample_portfolio, days=90)
 
 
-@patch("agents.correlation_agent_local.load_price_data")
+@patch("agents.correlation_agent_local.load_price_arrays")
 def test_calculate_portfolio_returns_unknown_token(mock_load):
     """Test handling of unknown tokens (not in historical data)."""
     portfolio = Portfolio(
@@ -270,8 +330,8 @@ def test_calculate_portfolio_returns_unknown_token(mock_load):
         calculate_portfolio_returns(portfolio, days=90)
 
 
-@patch("agents.correlation_agent_local.load_price_data")
-def test_calculate_portfolio_returns_partial_exclusion(mock_load):
+@patch("agents.correlation_agent_local.load_price_arrays")
+def test_calculate_portfolio_returns_partial_exclusion(mock_load, price_dates_91):
     """Test portfolio calculation when some tokens are excluded but <50%."""
     # Portfolio with 3 tokens, one will be excluded
     portfolio = Portfolio(
@@ -284,18 +344,12 @@ def test_calculate_portfolio_returns_partial_exclusion(mock_load):
         total_value_usd=39920.0,
     )
 
-    dates = pd.date_range('2025-01-01', periods=91)
-
     def mock_load_side_effect(symbol, days):
         if symbol == "UNKNOWN":
             raise FileNotFoundError("Token not found")
 
-        prices = [100.0 + i * 0.1 for i in range(91)]
-        return pd.DataFrame({
-            "date": dates,
-            "price_usd": prices,
-            "volume_usd": [1000000] * 91
-        })
+        prices = np.arange(91, dtype=np.float64) * 0.1 + 100.0
+        return price_dates_91, prices
 
     mock_load.side_effect = mock_load_side_effect
 
@@ -306,6 +360,42 @@ def test_calculate_portfolio_returns_partial_exclusion(mock_load):
     assert isinstance(returns, pd.Series)
 
 
+@patch("agents.correlation_agent_local.load_price_arrays")
+def test_calculate_portfolio_returns_batch(mock_load, sample_portfolio, single_token_portfolio, price_dates_91):
+    """Test batch portfolio returns preserve input order and match single calls."""
+    def mock_load_side_effect(symbol, days):
+        step = {"UNI": 0.01, "AAVE": 0.1}.get(symbol, 10.0)
+        return price_dates_91, np.arange(91, dtype=np.float64) * step + 100.0
+
+    mock_load.side_effect = mock_load_side_effect
+
+    batch = calculate_portfolio_returns_batch([sample_portfolio, single_token_portfolio], days=90)
+
+    assert len(batch) == 2
+    pd.testing.assert_series_equal(batch[0], calculate_portfolio_returns(sample_portfolio, days=90))
+    pd.testing.assert_series_equal(batch[1], calculate_portfolio_returns(single_token_portfolio, days=90))
+    assert calculate_portfolio_returns_batch([], days=90) == []
+
+
+def test_build_correlation_analysis_memoized_per_holdings(sample_portfolio, tmp_path):
+    """Test equal holdings reuse the cached analysis until a price CSV changes."""
+    for symbol in ("UNI", "AAVE", "ETH"):
+        shutil.copy2(HISTORICAL_PRICES_DIR / f"{symbol}.csv", tmp_path)
+
+    with patch("agents.correlation_agent_local.HISTORICAL_PRICES_DIR", tmp_path):
+        analysis = build_correlation_analysis(sample_portfolio)
+        assert build_correlation_analysis(sample_portfolio.model_copy()) is analysis
+
+        # A new price file version is a cache miss, recomputed from the same data
+        uni_csv = tmp_path / "UNI.csv"
+        mtime_ns = uni_csv.stat().st_mtime_ns + 1_000_000_000
+        os.utime(uni_csv, ns=(mtime_ns, mtime_ns))
+        refreshed = build_correlation_analysis(sample_portfolio)
+
+    assert refreshed is not analysis
+    assert refreshed == analysis
+
+
 def test_correlation_interpretation():
     """Test correlation percentage to interpretation mapping."""
     # This tests the logic in handle_analysis_request
@@ -325,6 +415,29 @@ def test_correlation_interpretation():
     assert "Low" == ("High" if 0 > 85 else "Moderate" if 0 >= 70 else "Low")
 
 
+def test_interpret_correlation_boundaries():
+    """Test interpretation boundaries match the >85% / >=70% thresholds."""
+    assert interpret_correlation(0.95) == "High"
+    assert interpret_correlation(0.851) == "High"
+    assert interpret_correlation(0.85) == "Moderate"
+    assert interpret_correlation(0.70) == "Moderate"
+    assert interpret_correlation(0.699) == "Low"
+    assert interpret_correlation(0.0) == "Low"
+    assert interpret_correlation(-0.9) == "High"  # Uses absolute value
+
+
+def test_get_correlation_bracket_boundaries():
+    """Test crash bracket boundaries (>90, 80-90, 70-80, <70)."""
+    assert get_correlation_bracket(100) == ">90%"
+    assert get_correlation_bracket(91) == ">90%"
+    assert get_correlation_bracket(90) == "80-90%"
+    assert get_correlation_bracket(80) == "80-90%"
+    assert get_correlation_bracket(79) == "70-80%"
+    assert get_correlation_bracket(70) == "70-80%"
+    assert get_correlation_bracket(69) == "<70%"
+    assert get_correlation_bracket(0) == "<70%"
+
+
 # =============================================================================
 # HISTORICAL CRASH CONTEXT TESTS (Story 1.4)
 # =============================================================================
@@ -488,7 +601,10 @@ def test_historical_accuracy():
 
 from agents.sector_agent_local import (
     load_sector_mappings,
+    load_sector_lookup,
     classify_tokens,
+    analyze_sectors,
+    build_sector_analysis,
     identify_concentrated_sectors,
     calculate_diversification_score,
     generate_sector_narrative,
@@ -501,7 +617,7 @@ from agents.sector_agent_local import (
 
 # Fixtures for sector analysis testing
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def high_concentration_portfolio():
     """Portfolio with high concentration in DeFi Governance (>60%)."""
     return Portfolio(
@@ -517,7 +633,7 @@ def high_concentration_portfolio():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def well_diversified_portfolio():
     """Portfolio with good sector diversification (<60% in any sector)."""
     return Portfolio(
@@ -535,7 +651,7 @@ def well_diversified_portfolio():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def portfolio_with_unknown_tokens():
     """Portfolio containing tokens not in sector mappings."""
     return Portfolio(
@@ -549,11 +665,17 @@ def portfolio_with_unknown_tokens():
     )
 
 
+@pytest.fixture(scope="session")
+def sector_df():
+    """Fixture providing the sector mappings DataFrame, loaded once per session."""
+    return load_sector_mappings()
+
+
 # Unit Tests for Sector Classification
 
-def test_load_sector_mappings():
+def test_load_sector_mappings(sector_df):
     """Test sector mappings load correctly and validate schema."""
-    df = load_sector_mappings()
+    df = sector_df
 
     # Verify DataFrame is not empty
     assert len(df) > 0
@@ -574,6 +696,46 @@ def test_load_sector_mappings():
     assert df.loc["USDC", "sector"] == "Stablecoins"
 
 
+def test_load_sector_mappings_returns_copy():
+    """Test cached sector mappings can't be mutated through a returned frame."""
+    df = load_sector_mappings()
+    df.loc["UNI", "sector"] = "Mutated"
+
+    assert load_sector_mappings().loc["UNI", "sector"] == "DeFi Governance"
+
+
+def test_analyze_sectors_matches_individual_steps(high_concentration_portfolio, well_diversified_portfolio):
+    """Test fused sector analysis agrees with the step-by-step functions."""
+    for portfolio in (high_concentration_portfolio, well_diversified_portfolio):
+        breakdown, concentrated, score = analyze_sectors(portfolio)
+
+        assert breakdown == classify_tokens(portfolio)
+        assert concentrated == identify_concentrated_sectors(breakdown)
+        assert score == calculate_diversification_score(concentrated)
+
+
+def test_build_sector_analysis_memoized_per_holdings(high_concentration_portfolio):
+    """Test equal holdings reuse one cached SectorAnalysis matching the step-by-step result."""
+    analysis = build_sector_analysis(high_concentration_portfolio)
+    breakdown, concentrated, score = analyze_sectors(high_concentration_portfolio)
+
+    assert build_sector_analysis(high_concentration_portfolio.model_copy()) is analysis
+    assert analysis.concentrated_sectors == concentrated
+    assert analysis.diversification_score == score
+    assert analysis.narrative.startswith(
+        generate_sector_narrative(breakdown, concentrated, score, high_concentration_portfolio.total_value_usd)
+    )
+
+
+def test_load_sector_lookup_matches_mappings(sector_df):
+    """Test the classification lookup agrees with the sector mappings frame."""
+    lookup = load_sector_lookup()
+
+    assert dict(lookup) == sector_df["sector"].to_dict()
+    with pytest.raises(TypeError):
+        lookup["UNI"] = "Mutated"  # Shared cache is read-only
+
+
 def test_classify_tokens_all_known(high_concentration_portfolio):
     """Test classification with all known tokens."""
     sector_breakdown = classify_tokens(high_concentration_portfolio)
@@ -711,9 +873,9 @@ def test_sector_narrative_generation_well_diversified(well_diversified_portfolio
     assert "good" in narrative.lower() or "no sector exceeds" in narrative.lower()
 
 
-def test_sector_classification_accuracy():
+def test_sector_classification_accuracy(sector_df):
     """Verify sector classification accuracy for key tokens."""
-    df = load_sector_mappings()
+    df = sector_df
 
     # DeFi Governance tokens
     assert df.loc["UNI", "sector"] == "DeFi Governance"
@@ -907,12 +1069,25 @@ from agents.guardian_agent_local import (
     detect_compounding_risk,
     calculate_risk_level,
     generate_synthesis_narrative,
-    synthesis_analysis
+    synthesis_analysis,
+    _query_severe_crashes,
+    generate_recommendations,
+    get_correlation_recommendations,
+    get_sector_recommendations,
+    get_diversified_recommendations,
+    get_prioritization_recommendation,
+)
+from agents.shared.models import (
+    CorrelationAnalysis,
+    SectorAnalysis,
+    SectorHolding,
+    CrashPerformance,
+    CorrelationAnalysisResponse,
+    SectorAnalysisResponse,
 )
-from agents.shared.models import CorrelationAnalysis, SectorAnalysis, CrashPerformance
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def high_risk_correlation_analysis():
     """Fixture for high correlation analysis (95%)."""
     return CorrelationAnalysis(
@@ -933,7 +1108,7 @@ def high_risk_correlation_analysis():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def low_risk_correlation_analysis():
     """Fixture for low correlation analysis (65%)."""
     return CorrelationAnalysis(
@@ -946,7 +1121,7 @@ def low_risk_correlation_analysis():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def high_concentration_sector_analysis():
     """Fixture for high sector concentration (68% DeFi Governance)."""
     return SectorAnalysis(
@@ -965,7 +1140,7 @@ def high_concentration_sector_analysis():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def low_concentration_sector_analysis():
     """Fixture for low sector concentration (well-diversified)."""
     return SectorAnalysis(
@@ -1080,6 +1255,16 @@ def test_calculate_risk_level_low():
     assert risk_level == "Low"
 
 
+def test_calculate_risk_level_boundaries():
+    """Test risk level boundaries: >85% is high, 70% is inclusive moderate."""
+    assert calculate_risk_level(correlation_percentage=85, concentrated_sectors=[]) == "Moderate"
+    assert calculate_risk_level(correlation_percentage=85.5, concentrated_sectors=[]) == "High"
+    assert calculate_risk_level(correlation_percentage=85, concentrated_sectors=["Layer-2"]) == "High"
+    assert calculate_risk_level(correlation_percentage=85.5, concentrated_sectors=["Layer-2"]) == "Critical"
+    assert calculate_risk_level(correlation_percentage=70, concentrated_sectors=[]) == "Moderate"
+    assert calculate_risk_level(correlation_percentage=69.9, concentrated_sectors=[]) == "Low"
+
+
 def test_generate_synthesis_narrative_compounding_risk(high_risk_correlation_analysis, high_concentration_sector_analysis):
     """Test synthesis narrative generation for compounding risk portfolios (AC 4, 6, 7)."""
     crash_data = [{"name": "2022 Bear Market"}]
@@ -1138,7 +1323,6 @@ def test_synthesis_metta_integration(mock_metta_query, high_risk_correlation_ana
         {"scenario_id": "crash_2022_bear", "name": "2022 Bear Market"}
     ]
 
-    from agents.shared.models import CorrelationAnalysisResponse, SectorAnalysisResponse
 
     correlation_response = Mock(spec=CorrelationAnalysisResponse)
     correlation_response.analysis_data = high_risk_correlation_analysis.model_dump()
@@ -1146,7 +1330,12 @@ def test_synthesis_metta_integration(mock_metta_query, high_risk_correlation_ana
     sector_response = Mock(spec=SectorAnalysisResponse)
     sector_response.analysis_data = high_concentration_sector_analysis.model_dump()
 
-    synthesis = synthesis_analysis(correlation_response, sector_response, request_id="test_123")
+    # MeTTa results are memoized per bracket: start and finish with an empty cache
+    _query_severe_crashes.cache_clear()
+    try:
+        synthesis = synthesis_analysis(correlation_response, sector_response, request_id="test_123")
+    finally:
+        _query_severe_crashes.cache_clear()
 
     # Verify MeTTa query was called
     mock_metta_query.assert_called_once()
@@ -1162,7 +1351,6 @@ def test_synthesis_metta_integration(mock_metta_query, high_risk_correlation_ana
 
 def test_synthesis_analysis_full_workflow(high_risk_correlation_analysis, high_concentration_sector_analysis):
     """Test complete synthesis_analysis workflow (AC 1-8)."""
-    from agents.shared.models import CorrelationAnalysisResponse, SectorAnalysisResponse
 
     correlation_response = Mock(spec=CorrelationAnalysisResponse)
     correlation_response.analysis_data = high_risk_correlation_analysis.model_dump()
@@ -1197,29 +1385,120 @@ def test_synthesis_analysis_full_workflow(high_risk_correlation_analysis, high_c
 # Story 2.4: Recommendation Generation Unit Tests
 # =============================================================================
 
-def test_generate_recommendations_high_correlation():
-    """Test high correlation generates uncorrelated asset recommendation (AC 2)."""
-    from agents.guardian_agent_local import generate_recommendations
-    from agents.shared.models import CorrelationAnalysis, SectorAnalysis, CrashPerformance
+# Specific token buy/sell instructions recommendations must never contain (AC 9)
+FORBIDDEN_TOKEN_PICKS = re.compile(r"Buy BTC|Sell UNI|Buy SOL|Sell AAVE")
+# Asset classes recommendations should point to instead of specific tokens
+RECOMMENDED_ASSET_CLASSES = re.compile(r"Bitcoin|Alternative Layer-1s|Stablecoins")
+
+# Shared scenario templates (treat as read-only; use model_copy(update=...) for variants)
+BEAR_2022 = CrashPerformance.model_construct(
+    crash_name="2022 Bear Market",
+    crash_period="Nov 2021 - Jun 2022",
+    eth_drawdown_pct=-75.3,
+    portfolio_loss_pct=-73.0,
+    market_avg_loss_pct=-55.0
+)
+SOL_OPPORTUNITY = OpportunityCost.model_construct(
+    missed_sector="Layer-1 Alts",
+    missed_token="SOL",
+    recovery_gain_pct=500.0,
+    narrative="SOL gained 500% during recovery"
+)
+DEFI_CONCENTRATED_HOLDING = SectorHolding.model_construct(
+    sector_name="DeFi Governance",
+    value_usd=10912.0,
+    percentage=68.0,
+    token_symbols=["UNI", "AAVE", "COMP"]
+)
+DEFI_BEAR_2022_RISK = SectorRisk.model_construct(
+    sector_name="DeFi Governance",
+    crash_scenario="2022 Bear Market",
+    sector_loss_pct=-75.0,
+    market_avg_loss_pct=-55.0,
+    crash_period="Nov 2021 - Jun 2022",
+    opportunity_cost=SOL_OPPORTUNITY
+)
 
-    correlation_analysis = CorrelationAnalysis(
+
+@pytest.fixture(scope="session")
+def bear_market_crash():
+    """2022 Bear Market crash performance shared by the high-correlation scenarios."""
+    return BEAR_2022
+
+
+@pytest.fixture(scope="session")
+def high_corr_analysis(bear_market_crash):
+    """95% ETH correlation with 2022 Bear Market context."""
+    return CorrelationAnalysis.model_construct(
         correlation_coefficient=0.95,
         correlation_percentage=95,
         interpretation="High",
-        historical_context=[
-            CrashPerformance(
-                crash_name="2022 Bear Market",
-                crash_period="Nov 2021 - Jun 2022",
-                eth_drawdown_pct=-75.3,
-                portfolio_loss_pct=-73.0,
-                market_avg_loss_pct=-55.0
-            )
-        ],
+        historical_context=[bear_market_crash],
         calculation_period_days=90,
-        narrative="Your portfolio is 95% correlated to ETH"
+        narrative="95% correlated to ETH"
     )
 
-    sector_analysis = SectorAnalysis(
+
+@pytest.fixture(scope="session")
+def moderate_corr_analysis():
+    """65% ETH correlation without historical context."""
+    return CorrelationAnalysis.model_construct(
+        correlation_coefficient=0.65,
+        correlation_percentage=65,
+        interpretation="Moderate",
+        historical_context=[],
+        calculation_period_days=90,
+        narrative="65% correlated to ETH"
+    )
+
+
+@pytest.fixture(scope="session")
+def concentrated_sector_analysis():
+    """68% DeFi Governance concentration with 2022 Bear Market sector risk."""
+    return SectorAnalysis.model_construct(
+        sector_breakdown={"DeFi Governance": DEFI_CONCENTRATED_HOLDING},
+        concentrated_sectors=["DeFi Governance"],
+        diversification_score="High Concentration",
+        sector_risks=[DEFI_BEAR_2022_RISK],
+        narrative="68% concentrated in DeFi Governance"
+    )
+
+
+@pytest.fixture(scope="session")
+def diversified_sector_analysis():
+    """Balanced allocation across DeFi Governance, Layer-2 and Stablecoins."""
+    return SectorAnalysis.model_construct(
+        sector_breakdown={
+            "DeFi Governance": SectorHolding.model_construct(
+                sector_name="DeFi Governance",
+                value_usd=4000.0,
+                percentage=25.0,
+                token_symbols=["UNI", "AAVE"]
+            ),
+            "Layer-2": SectorHolding.model_construct(
+                sector_name="Layer-2",
+                value_usd=3200.0,
+                percentage=20.0,
+                token_symbols=["MATIC", "OP"]
+            ),
+            "Stablecoins": SectorHolding.model_construct(
+                sector_name="Stablecoins",
+                value_usd=4800.0,
+                percentage=30.0,
+                token_symbols=["USDC", "DAI"]
+            )
+        },
+        concentrated_sectors=[],
+        diversification_score="Well-Diversified",
+        sector_risks=[],
+        narrative="Balanced sector allocation"
+    )
+
+
+@pytest.fixture(scope="session")
+def empty_sector_analysis():
+    """Well-diversified sector analysis with no holdings breakdown."""
+    return SectorAnalysis.model_construct(
         sector_breakdown={},
         concentrated_sectors=[],
         diversification_score="Well-Diversified",
@@ -1227,86 +1506,57 @@ def test_generate_recommendations_high_correlation():
         narrative="Diversified sector allocation"
     )
 
-    recommendations = generate_recommendations(
-        correlation_analysis,
-        sector_analysis,
-        compounding_risk_detected=False,
-        overall_risk_level="High"
-    )
 
+def test_recommendation_fixtures_match_schema(
+    high_corr_analysis,
+    moderate_corr_analysis,
+    concentrated_sector_analysis,
+    diversified_sector_analysis,
+    empty_sector_analysis,
+):
+    """Test unvalidated recommendation fixtures still satisfy the model schemas."""
+    for analysis in (high_corr_analysis, moderate_corr_analysis):
+        validated = CorrelationAnalysis.model_validate(analysis.model_dump())
+        assert validated.model_dump() == analysis.model_dump()
+
+    for analysis in (concentrated_sector_analysis, diversified_sector_analysis, empty_sector_analysis):
+        validated = SectorAnalysis.model_validate(analysis.model_dump())
+        assert validated.model_dump() == analysis.model_dump()
+
+
+def _lowered(rec):
+    """Lowercase a recommendation's action, rationale and expected impact once."""
+    return rec.action.lower(), rec.rationale.lower(), rec.expected_impact.lower()
+
+
+def _check_high_correlation_recommendations(recommendations):
+    """High correlation generates uncorrelated asset recommendation (AC 2)."""
     # Verify recommendation count
     assert len(recommendations) == 1
 
     # Verify recommendation content
     rec = recommendations[0]
+    action_lower, rationale_lower, impact_lower = _lowered(rec)
     assert rec.priority == 1
     assert "95%" in rec.action
     assert "below 80%" in rec.action
-    assert "uncorrelated assets" in rec.action.lower() or "bitcoin" in rec.action.lower() or "alternative layer-1s" in rec.action.lower()
+    assert "uncorrelated assets" in action_lower or "bitcoin" in action_lower or "alternative layer-1s" in action_lower
 
     # Verify no specific token picks (AC 9)
     assert "Buy BTC" not in rec.action
     assert "Sell" not in rec.action
-    assert "Bitcoin" in rec.action or "Alternative Layer-1s" in rec.action or "Stablecoins" in rec.action
+    assert RECOMMENDED_ASSET_CLASSES.search(rec.action)
 
     # Verify rationale explains correlation risk
-    assert "correlation" in rec.rationale.lower()
+    assert "correlation" in rationale_lower
     assert "73" in rec.rationale or "73.0" in rec.rationale
 
     # Verify expected impact references historical data
     assert "2022" in rec.expected_impact or "Bear Market" in rec.expected_impact
 
 
-def test_generate_recommendations_high_sector_concentration():
-    """Test high sector concentration generates reduction recommendation (AC 3)."""
-    from agents.guardian_agent_local import generate_recommendations
-    from agents.shared.models import CorrelationAnalysis, SectorAnalysis, SectorHolding, SectorRisk, OpportunityCost
-
-    correlation_analysis = CorrelationAnalysis(
-        correlation_coefficient=0.65,
-        correlation_percentage=65,
-        interpretation="Moderate",
-        historical_context=[],
-        calculation_period_days=90,
-        narrative="Moderate correlation"
-    )
-
-    sector_analysis = SectorAnalysis(
-        sector_breakdown={
-            "DeFi Governance": SectorHolding(
-                sector_name="DeFi Governance",
-                value_usd=10912.0,
-                percentage=68.0,
-                token_symbols=["UNI", "AAVE", "COMP"]
-            )
-        },
-        concentrated_sectors=["DeFi Governance"],
-        diversification_score="High Concentration",
-        sector_risks=[
-            SectorRisk(
-                sector_name="DeFi Governance",
-                crash_scenario="2022 Bear Market",
-                sector_loss_pct=-75.0,
-                market_avg_loss_pct=-55.0,
-                crash_period="Nov 2021 - Jun 2022",
-                opportunity_cost=OpportunityCost(
-                    missed_sector="Layer-1 Alts",
-                    missed_token="SOL",
-                    recovery_gain_pct=500.0,
-                    narrative="SOL gained 500% during recovery"
-                )
-            )
-        ],
-        narrative="68% concentrated in DeFi Governance"
-    )
-
-    recommendations = generate_recommendations(
-        correlation_analysis,
-        sector_analysis,
-        compounding_risk_detected=False,
-        overall_risk_level="High"
-    )
-
+def _check_high_sector_concentration_recommendations(recommendations):
+    """High sector concentration generates reduction recommendation (AC 3)."""
     # Verify recommendation count
     assert len(recommendations) == 1
 
@@ -1330,225 +1580,111 @@ def test_generate_recommendations_high_sector_concentration():
     assert "500" in rec.expected_impact or "recovery" in rec.expected_impact.lower()
 
 
-def test_generate_recommendations_compounding_risk_prioritization():
-    """Test compounding risk prioritizes sector diversification first (AC 4)."""
-    from agents.guardian_agent_local import generate_recommendations
-    from agents.shared.models import CorrelationAnalysis, SectorAnalysis, SectorHolding, SectorRisk, OpportunityCost, CrashPerformance
-
-    correlation_analysis = CorrelationAnalysis(
-        correlation_coefficient=0.95,
-        correlation_percentage=95,
-        interpretation="High",
-        historical_context=[
-            CrashPerformance(
-                crash_name="2022 Bear Market",
-                crash_period="Nov 2021 - Jun 2022",
-                eth_drawdown_pct=-75.3,
-                portfolio_loss_pct=-73.0,
-                market_avg_loss_pct=-55.0
-            )
-        ],
-        calculation_period_days=90,
-        narrative="95% correlated to ETH"
-    )
-
-    sector_analysis = SectorAnalysis(
-        sector_breakdown={
-            "DeFi Governance": SectorHolding(
-                sector_name="DeFi Governance",
-                value_usd=10912.0,
-                percentage=68.0,
-                token_symbols=["UNI", "AAVE", "COMP"]
-            )
-        },
-        concentrated_sectors=["DeFi Governance"],
-        diversification_score="High Concentration",
-        sector_risks=[
-            SectorRisk(
-                sector_name="DeFi Governance",
-                crash_scenario="2022 Bear Market",
-                sector_loss_pct=-75.0,
-                market_avg_loss_pct=-55.0,
-                crash_period="Nov 2021 - Jun 2022",
-                opportunity_cost=OpportunityCost(
-                    missed_sector="Layer-1 Alts",
-                    missed_token="SOL",
-                    recovery_gain_pct=500.0,
-                    narrative="SOL gained 500%"
-                )
-            )
-        ],
-        narrative="68% concentrated in DeFi Governance"
-    )
-
-    recommendations = generate_recommendations(
-        correlation_analysis,
-        sector_analysis,
-        compounding_risk_detected=True,
-        overall_risk_level="Critical"
-    )
-
+def _check_compounding_risk_recommendations(recommendations):
+    """Compounding risk prioritizes sector diversification first (AC 4)."""
     # Verify recommendation count (should be 3 for compounding risk)
     assert len(recommendations) == 3
 
+    sector_rec, correlation_rec, prioritization_rec = recommendations
+
     # Verify sector diversification has priority 1
-    assert recommendations[0].priority == 1
-    assert "DeFi Governance" in recommendations[0].action
-    assert "concentration" in recommendations[0].action.lower()
+    assert sector_rec.priority == 1
+    assert "DeFi Governance" in sector_rec.action
+    assert "concentration" in sector_rec.action.lower()
 
     # Verify correlation reduction has priority 2
-    assert recommendations[1].priority == 2
-    assert "uncorrelated assets" in recommendations[1].action.lower() or "correlation" in recommendations[1].action.lower()
+    correlation_action_lower = correlation_rec.action.lower()
+    assert correlation_rec.priority == 2
+    assert "uncorrelated assets" in correlation_action_lower or "correlation" in correlation_action_lower
 
     # Verify prioritization explanation has priority 3
-    assert recommendations[2].priority == 3
-    assert "Prioritize" in recommendations[2].action or "prioritize" in recommendations[2].action.lower()
-    assert "sector" in recommendations[2].rationale.lower()
-    assert ("first" in recommendations[2].rationale.lower() or
-           "before" in recommendations[2].rationale.lower() or
-           "naturally" in recommendations[2].rationale.lower())
+    action_lower, rationale_lower, impact_lower = _lowered(prioritization_rec)
+    assert prioritization_rec.priority == 3
+    assert "Prioritize" in prioritization_rec.action or "prioritize" in action_lower
+    assert "sector" in rationale_lower
+    assert ("first" in rationale_lower or
+           "before" in rationale_lower or
+           "naturally" in rationale_lower)
 
     # Verify expected impact explains compounding benefit
-    assert "compounding" in recommendations[2].expected_impact.lower() or "both" in recommendations[2].expected_impact.lower()
-
-
-def test_generate_recommendations_well_diversified():
-    """Test well-diversified portfolio gets positive monitoring recommendation (AC 5)."""
-    from agents.guardian_agent_local import generate_recommendations
-    from agents.shared.models import CorrelationAnalysis, SectorAnalysis, SectorHolding
+    assert "compounding" in impact_lower or "both" in impact_lower
 
-    correlation_analysis = CorrelationAnalysis(
-        correlation_coefficient=0.65,
-        correlation_percentage=65,
-        interpretation="Moderate",
-        historical_context=[],
-        calculation_period_days=90,
-        narrative="65% correlated to ETH"
-    )
-
-    sector_analysis = SectorAnalysis(
-        sector_breakdown={
-            "DeFi Governance": SectorHolding(
-                sector_name="DeFi Governance",
-                value_usd=4000.0,
-                percentage=25.0,
-                token_symbols=["UNI", "AAVE"]
-            ),
-            "Layer-2": SectorHolding(
-                sector_name="Layer-2",
-                value_usd=3200.0,
-                percentage=20.0,
-                token_symbols=["MATIC", "OP"]
-            ),
-            "Stablecoins": SectorHolding(
-                sector_name="Stablecoins",
-                value_usd=4800.0,
-                percentage=30.0,
-                token_symbols=["USDC", "DAI"]
-            )
-        },
-        concentrated_sectors=[],
-        diversification_score="Well-Diversified",
-        sector_risks=[],
-        narrative="Balanced sector allocation"
-    )
-
-    recommendations = generate_recommendations(
-        correlation_analysis,
-        sector_analysis,
-        compounding_risk_detected=False,
-        overall_risk_level="Low"
-    )
 
+def _check_well_diversified_recommendations(recommendations):
+    """Well-diversified portfolio gets positive monitoring recommendation (AC 5)."""
     # Verify single recommendation
     assert len(recommendations) == 1
 
     # Verify positive acknowledgment tone
     rec = recommendations[0]
-    assert "Maintain" in rec.action or "balanced" in rec.rationale.lower()
+    action_lower, rationale_lower, impact_lower = _lowered(rec)
+    assert "Maintain" in rec.action or "balanced" in rationale_lower
 
     # Verify mentions correlation and sectors
     assert "65%" in rec.rationale
     assert "DeFi Governance" in rec.rationale or "Layer-2" in rec.rationale or "Stablecoins" in rec.rationale
 
     # Verify monitoring frequency included
-    assert "monitoring" in rec.expected_impact.lower() or "quarterly" in rec.expected_impact.lower()
+    assert "monitoring" in impact_lower or "quarterly" in impact_lower
 
     # Verify sets alert thresholds
     assert "40%" in rec.expected_impact or "80%" in rec.expected_impact
 
 
-def test_recommendations_no_specific_token_picks():
-    """Test recommendations avoid specific token symbols (AC 9)."""
-    from agents.guardian_agent_local import generate_recommendations
-    from agents.shared.models import CorrelationAnalysis, SectorAnalysis, SectorHolding, CrashPerformance
-
-    correlation_analysis = CorrelationAnalysis(
-        correlation_coefficient=0.95,
-        correlation_percentage=95,
-        interpretation="High",
-        historical_context=[
-            CrashPerformance(
-                crash_name="2022 Bear Market",
-                crash_period="Nov 2021 - Jun 2022",
-                eth_drawdown_pct=-75.3,
-                portfolio_loss_pct=-73.0,
-                market_avg_loss_pct=-55.0
-            )
-        ],
-        calculation_period_days=90,
-        narrative="95% correlated to ETH"
+@pytest.mark.parametrize(
+    "correlation_fixture, sector_fixture, compounding_risk_detected, overall_risk_level, check",
+    [
+        pytest.param("high_corr_analysis", "empty_sector_analysis", False, "High", _check_high_correlation_recommendations, id="high_correlation"),
+        pytest.param("moderate_corr_analysis", "concentrated_sector_analysis", False, "High", _check_high_sector_concentration_recommendations, id="high_sector_concentration"),
+        pytest.param("high_corr_analysis", "concentrated_sector_analysis", True, "Critical", _check_compounding_risk_recommendations, id="compounding_risk_prioritization"),
+        pytest.param("moderate_corr_analysis", "diversified_sector_analysis", False, "Low", _check_well_diversified_recommendations, id="well_diversified"),
+    ],
+)
+def test_generate_recommendations(
+    request, correlation_fixture, sector_fixture, compounding_risk_detected, overall_risk_level, check
+):
+    """Test recommendation generation across the canonical risk scenarios (AC 2-5)."""
+    recommendations = generate_recommendations(
+        request.getfixturevalue(correlation_fixture),
+        request.getfixturevalue(sector_fixture),
+        compounding_risk_detected=compounding_risk_detected,
+        overall_risk_level=overall_risk_level
     )
 
-    sector_analysis = SectorAnalysis(
-        sector_breakdown={},
-        concentrated_sectors=[],
-        diversification_score="Well-Diversified",
-        sector_risks=[],
-        narrative="Diversified"
-    )
+    check(recommendations)
+
+
+def test_recommendations_no_specific_token_picks(high_corr_analysis, empty_sector_analysis):
+    """Test recommendations avoid specific token symbols (AC 9)."""
 
     recommendations = generate_recommendations(
-        correlation_analysis,
-        sector_analysis,
+        high_corr_analysis,
+        empty_sector_analysis,
         compounding_risk_detected=False,
         overall_risk_level="High"
     )
 
     # Verify no specific token picks in any recommendation
     for rec in recommendations:
+        action_lower = rec.action.lower()
+
         # Should NOT contain specific token buy/sell instructions
-        assert "Buy BTC" not in rec.action
-        assert "Sell UNI" not in rec.action
-        assert "Buy SOL" not in rec.action
-        assert "Sell AAVE" not in rec.action
-        assert "Swap" not in rec.action.lower() or "for BTC" not in rec.action
+        assert not FORBIDDEN_TOKEN_PICKS.search(rec.action)
+        assert "Swap" not in action_lower or "for BTC" not in rec.action
 
         # SHOULD use asset classes instead
-        if "uncorrelated" in rec.action.lower() or "correlation" in rec.action.lower():
-            assert ("Bitcoin" in rec.action or
-                   "Alternative Layer-1s" in rec.action or
-                   "Stablecoins" in rec.action)
+        if "uncorrelated" in action_lower or "correlation" in action_lower:
+            assert RECOMMENDED_ASSET_CLASSES.search(rec.action)
 
 
 def test_get_correlation_recommendations_helper():
     """Test get_correlation_recommendations helper function (AC 2)."""
-    from agents.guardian_agent_local import get_correlation_recommendations
-    from agents.shared.models import CorrelationAnalysis, CrashPerformance
 
     correlation_analysis = CorrelationAnalysis(
         correlation_coefficient=0.92,
         correlation_percentage=92,
         interpretation="High",
-        historical_context=[
-            CrashPerformance(
-                crash_name="2022 Bear Market",
-                crash_period="Nov 2021 - Jun 2022",
-                eth_drawdown_pct=-75.3,
-                portfolio_loss_pct=-70.0,
-                market_avg_loss_pct=-55.0
-            )
-        ],
+        historical_context=[BEAR_2022.model_copy(update={"portfolio_loss_pct": -70.0})],
         calculation_period_days=90,
         narrative="92% correlated"
     )
@@ -1563,9 +1699,7 @@ def test_get_correlation_recommendations_helper():
     assert "below 80%" in rec.action
 
     # Verify asset classes used (no specific tokens)
-    assert ("Bitcoin" in rec.action or
-           "Alternative Layer-1s" in rec.action or
-           "Stablecoins" in rec.action)
+    assert RECOMMENDED_ASSET_CLASSES.search(rec.action)
 
     # Verify rationale explains risk
     assert "correlation" in rec.rationale.lower()
@@ -1577,35 +1711,14 @@ def test_get_correlation_recommendations_helper():
 
 def test_get_sector_recommendations_helper():
     """Test get_sector_recommendations helper function (AC 3)."""
-    from agents.guardian_agent_local import get_sector_recommendations
-    from agents.shared.models import SectorAnalysis, SectorHolding, SectorRisk, OpportunityCost
 
     sector_analysis = SectorAnalysis(
         sector_breakdown={
-            "DeFi Governance": SectorHolding(
-                sector_name="DeFi Governance",
-                value_usd=10912.0,
-                percentage=72.0,
-                token_symbols=["UNI", "AAVE", "COMP"]
-            )
+            "DeFi Governance": DEFI_CONCENTRATED_HOLDING.model_copy(update={"percentage": 72.0})
         },
         concentrated_sectors=["DeFi Governance"],
         diversification_score="High Concentration",
-        sector_risks=[
-            SectorRisk(
-                sector_name="DeFi Governance",
-                crash_scenario="2022 Bear Market",
-                sector_loss_pct=-80.0,
-                market_avg_loss_pct=-55.0,
-                crash_period="Nov 2021 - Jun 2022",
-                opportunity_cost=OpportunityCost(
-                    missed_sector="Layer-1 Alts",
-                    missed_token="SOL",
-                    recovery_gain_pct=500.0,
-                    narrative="Missed SOL recovery"
-                )
-            )
-        ],
+        sector_risks=[DEFI_BEAR_2022_RISK.model_copy(update={"sector_loss_pct": -80.0})],
         narrative="72% in DeFi Governance"
     )
 
@@ -1631,8 +1744,6 @@ def test_get_sector_recommendations_helper():
 
 def test_get_diversified_recommendations_helper():
     """Test get_diversified_recommendations helper function (AC 5)."""
-    from agents.guardian_agent_local import get_diversified_recommendations
-    from agents.shared.models import CorrelationAnalysis, SectorAnalysis, SectorHolding
 
     correlation_analysis = CorrelationAnalysis(
         correlation_coefficient=0.60,
@@ -1671,40 +1782,41 @@ def test_get_diversified_recommendations_helper():
     )
 
     rec = get_diversified_recommendations(correlation_analysis, sector_analysis)
+    action_lower, rationale_lower, impact_lower = _lowered(rec)
 
     # Verify priority is 1 (only recommendation)
     assert rec.priority == 1
 
     # Verify positive action
-    assert "Maintain" in rec.action or "balanced" in rec.action.lower()
+    assert "Maintain" in rec.action or "balanced" in action_lower
 
     # Verify rationale acknowledges good structure
     assert "60%" in rec.rationale
     assert "DeFi Governance" in rec.rationale or "Layer-2" in rec.rationale
 
     # Verify monitoring guidance
-    assert "monitoring" in rec.expected_impact.lower() or "quarterly" in rec.expected_impact.lower()
+    assert "monitoring" in impact_lower or "quarterly" in impact_lower
     assert "40%" in rec.expected_impact or "80%" in rec.expected_impact
 
 
 def test_get_prioritization_recommendation_helper():
     """Test get_prioritization_recommendation helper function (AC 4)."""
-    from agents.guardian_agent_local import get_prioritization_recommendation
 
     rec = get_prioritization_recommendation()
+    action_lower, rationale_lower, impact_lower = _lowered(rec)
 
     # Verify priority is 3 (explanatory recommendation)
     assert rec.priority == 3
 
     # Verify action explains prioritization
-    assert "Prioritize" in rec.action or "prioritize" in rec.action.lower()
-    assert "sector" in rec.action.lower()
-    assert "before" in rec.action.lower() or "first" in rec.action.lower()
+    assert "Prioritize" in rec.action or "prioritize" in action_lower
+    assert "sector" in action_lower
+    assert "before" in action_lower or "first" in action_lower
 
     # Verify rationale explains compounding benefit
-    assert "sector concentration" in rec.rationale.lower()
-    assert "amplifies" in rec.rationale.lower() or "naturally" in rec.rationale.lower()
+    assert "sector concentration" in rationale_lower
+    assert "amplifies" in rationale_lower or "naturally" in rationale_lower
 
     # Verify expected impact explains dual benefit
-    assert "both" in rec.expected_impact.lower() or "compounding" in rec.expected_impact.lower()
-    assert "risk" in rec.expected_impact.lower()
+    assert "both" in impact_lower or "compounding" in impact_lower
+    assert "risk" in impact_lower
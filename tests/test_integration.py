@@ -5,14 +5,20 @@ Tests verify end-to-end agent functionality with demo portfolios, error handling
 Chat Protocol integration, and README completeness.
 """
 
+import asyncio
 import json
 import logging
 import os
 import pytest
+import re
 import time
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 from unittest.mock import AsyncMock, Mock
 
+from pydantic import TypeAdapter, ValidationError
+
 from agents.shared.models import (
     AnalysisRequest,
     CorrelationAnalysisResponse,
@@ -20,9 +26,22 @@ from agents.shared.models import (
     ErrorMessage,
     Portfolio,
     TokenHolding,
+    GuardianAnalysisResponse,
+)
+from agents.correlation_agent_local import (
+    handle_analysis_request as correlation_handler,
+    _cached_correlation_analysis,
+)
+from agents.sector_agent_local import (
+    handle_analysis_request as sector_handler,
+    _cached_sector_analysis,
+)
+from agents.guardian_agent_local import (
+    handle_analysis_request as guardian_handler,
+    wait_for_response,
+    format_combined_response,
+    truncate_address,
 )
-from agents.correlation_agent_local import handle_analysis_request as correlation_handler
-from agents.sector_agent_local import handle_analysis_request as sector_handler
 
 logger = logging.getLogger(__name__)
 
@@ -32,19 +51,57 @@ DEMO_WALLETS_PATH = Path(__file__).parent.parent / "data" / "demo-wallets.json"
 # Constants for test assertions
 MAX_RESPONSE_TIME_MS = 5000  # 5 seconds max response time (AC 4)
 
+# Validates a demo wallet's token rows in a single call
+TOKEN_HOLDINGS_ADAPTER = TypeAdapter(list[TokenHolding])
+
+# Sections every agent README must contain (AC 17)
+AGENT_README_SECTIONS = (
+    "## Description",
+    "## Example Queries",
+    "## How it works",
+    "## Technical Details",
+    "## Limitations",
+    "## Example Output",
+)
+AGENT_README_SECTION_RE = re.compile("|".join(map(re.escape, AGENT_README_SECTIONS)))
+# Body of the Example Queries section, up to the next heading marker
+EXAMPLE_QUERIES_RE = re.compile(r"## Example Queries(.*?)(?:##|\Z)", re.S)
+AGENTS_DIR = Path(__file__).parent.parent / "agents"
 
+
+@lru_cache(maxsize=None)
+def read_agent_readme(agent_name: str) -> Optional[str]:
+    """Read agents/<agent_name>_agent_README.md once; None if it does not exist."""
+    try:
+        return (AGENTS_DIR / f"{agent_name}_agent_README.md").read_text()
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=1)
 def load_demo_wallets():
-    """Load demo wallets from JSON file."""
-    with open(DEMO_WALLETS_PATH, "r") as f:
-        data = json.load(f)
+    """Load demo wallets from JSON file (parsed once per test session)."""
+    data = json.loads(DEMO_WALLETS_PATH.read_bytes())
     return data["wallets"]
 
 
+@lru_cache(maxsize=None)
+def _demo_wallet_portfolio(wallet_address: str) -> Portfolio:
+    """Build and validate the Portfolio for a demo wallet once, keyed by address."""
+    wallet_data = next(w for w in load_demo_wallets() if w["wallet_address"] == wallet_address)
+    return Portfolio(
+        wallet_address=wallet_data["wallet_address"],
+        tokens=TOKEN_HOLDINGS_ADAPTER.validate_python(wallet_data["tokens"]),
+        total_value_usd=wallet_data["total_value_usd"],
+    )
+
+
 def create_portfolio_from_demo_wallet(wallet_data: dict) -> Portfolio:
     """
     Helper function to create Portfolio object from demo wallet data.
 
-    Reduces code duplication across test cases.
+    Reduces code duplication across test cases. Portfolios are cached per
+    wallet address, so tests must treat the returned object as read-only.
 
     Args:
         wallet_data: Demo wallet dictionary from demo-wallets.json
@@ -52,14 +109,133 @@ def create_portfolio_from_demo_wallet(wallet_data: dict) -> Portfolio:
     Returns:
         Portfolio object ready for testing
     """
-    return Portfolio(
-        wallet_address=wallet_data["wallet_address"],
-        tokens=[TokenHolding(**token) for token in wallet_data["tokens"]],
-        total_value_usd=wallet_data["total_value_usd"],
-    )
+    return _demo_wallet_portfolio(wallet_data["wallet_address"])
 
 
 DEMO_WALLETS = load_demo_wallets()
+# Validated Portfolio for each demo wallet, built once at import (read-only)
+DEMO_PORTFOLIOS = tuple(create_portfolio_from_demo_wallet(wallet_data) for wallet_data in DEMO_WALLETS)
+
+# (wallet index, expected risk profile) for each demo wallet
+DEMO_WALLET_CASES = [
+    pytest.param(0, "high", id="high"),
+    pytest.param(1, "moderate", id="moderate"),
+    pytest.param(2, "diversified", id="diversified"),
+]
+DEMO_WALLET_LABELS = {"high": "High Risk", "moderate": "Moderate Risk", "diversified": "Diversified"}
+# Demo wallet keys that make up a Portfolio payload
+DEMO_PORTFOLIO_FIELDS = ("wallet_address", "tokens", "total_value_usd")
+# 10 ETH holding shared by the edge-case portfolios (read-only)
+ETH_HOLDING = TokenHolding(symbol="ETH", amount=10.0, price_usd=2650.0, value_usd=26500.0)
+# Portfolio payload with no tokens, rejected by Portfolio validation (AC 5)
+EMPTY_PORTFOLIO_DATA = {
+    "wallet_address": "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0",
+    "tokens": [],
+    "total_value_usd": 0.0,
+}
+
+
+@pytest.fixture(scope="session")
+def demo_portfolios():
+    """(Portfolio, portfolio_data) for each demo wallet, built once per session.
+
+    portfolio_data is the wallet's Portfolio fields taken straight from
+    demo-wallets.json (handlers validate it themselves), so no model_dump()
+    round-trip is needed. Shared across tests; treat both as read-only.
+    """
+    return [
+        (portfolio, {field: wallet_data[field] for field in DEMO_PORTFOLIO_FIELDS})
+        for portfolio, wallet_data in zip(DEMO_PORTFOLIOS, DEMO_WALLETS)
+    ]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_agent_handlers(demo_portfolios):
+    """Run both agent handlers once before any test so timed tests measure steady state.
+
+    The first call pays one-off costs (price CSV parsing, crash data and sector
+    mapping loads) that would otherwise land in whichever test runs first. The
+    per-portfolio analysis caches are then cleared so timed tests still run
+    the analysis itself rather than a cache hit.
+    """
+    portfolio, portfolio_data = min(demo_portfolios, key=lambda pair: len(pair[0].tokens))
+    request = AnalysisRequest(
+        request_id="warmup",
+        wallet_address=portfolio.wallet_address,
+        portfolio_data=portfolio_data,
+        requested_by="agent1test_warmup",
+    )
+
+    async def warm():
+        ctx = AsyncMock()
+        ctx.agent.address = "agent1test_warmup"
+        await correlation_handler(ctx=ctx, sender="agent1test_warmup", msg=request)
+        await sector_handler(ctx=ctx, sender="agent1test_warmup", msg=request)
+
+    asyncio.run(warm())
+    _cached_correlation_analysis.cache_clear()
+    _cached_sector_analysis.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def shared_agent_ctx():
+    """Mock agent context constructed once per session for the single-agent test classes."""
+    ctx = AsyncMock()
+    ctx.agent.address = "agent1test_agent"
+    return ctx
+
+
+@pytest.fixture
+def mock_ctx(shared_agent_ctx):
+    """Shared mock context, reset so each test starts with no recorded calls.
+
+    Messages passed to ``send`` are appended to ``mock_ctx.sent_messages`` in order.
+    Test classes that need session storage define their own mock_ctx instead.
+    """
+    shared_agent_ctx.reset_mock(return_value=True, side_effect=True)
+    sent_messages = []
+    shared_agent_ctx.send.side_effect = lambda destination, message: sent_messages.append(message)
+    shared_agent_ctx.sent_messages = sent_messages
+    return shared_agent_ctx
+
+
+async def run_demo_wallet_case(
+    handler, mock_ctx, demo_portfolios, wallet_idx: int, expected_profile: str, request_id: str
+):
+    """
+    Send one demo wallet through an agent handler and capture its response.
+
+    Args:
+        handler: Agent message handler to invoke
+        mock_ctx: Mock agent context that records sent messages
+        demo_portfolios: Session-cached (Portfolio, portfolio_data) pairs per demo wallet
+        wallet_idx: Index into DEMO_WALLETS
+        expected_profile: Risk profile the demo wallet is labelled with
+        request_id: Request ID for the AnalysisRequest
+
+    Returns:
+        Tuple of (portfolio, response, elapsed_ms)
+    """
+    wallet_data = DEMO_WALLETS[wallet_idx]
+    assert wallet_data["risk_profile"] == expected_profile, (
+        f"Demo wallet {wallet_idx + 1} should be {expected_profile}"
+    )
+
+    portfolio, portfolio_data = demo_portfolios[wallet_idx]
+    request = AnalysisRequest(
+        request_id=request_id,
+        wallet_address=portfolio.wallet_address,
+        portfolio_data=portfolio_data,
+        requested_by="agent1test_guardian",
+    )
+
+    start_ns = time.perf_counter_ns()
+    await handler(ctx=mock_ctx, sender="agent1test_guardian", msg=request)
+    elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+    assert mock_ctx.sent_messages, "Agent should send response"
+    response = mock_ctx.sent_messages[-1]
+    return portfolio, response, elapsed_ms
 
 
 # ==============================================================================
@@ -70,60 +246,26 @@ DEMO_WALLETS = load_demo_wallets()
 class TestCorrelationAgentDemoWallets:
     """Integration tests for CorrelationAgent with all 3 demo wallets (AC 2, 4)."""
 
-    @pytest.fixture
-    def mock_ctx(self):
-        """Create mock context for testing."""
-        ctx = AsyncMock()
-        ctx.agent.address = "agent1test_correlation_agent_local"
-        return ctx
-
-    @pytest.mark.asyncio
-    async def test_correlation_agent_demo_wallet_1_high_risk(self, mock_ctx):
-        """Test CorrelationAgent with Demo Wallet 1 (High Risk DeFi Whale).
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("wallet_idx, expected_profile", DEMO_WALLET_CASES)
+    async def test_correlation_agent_demo_wallet(self, mock_ctx, demo_portfolios, wallet_idx, expected_profile):
+        """Test CorrelationAgent with each demo wallet.
 
-        Expected: High correlation (>85%) due to DeFi governance concentration.
+        Expected: High correlation (>85%) for the DeFi whale, moderate (70-85%)
+        for the balanced portfolio and low (<70%) for the diversified one.
         AC 2: Verify response structure and correlation accuracy
         AC 4: Verify response time < 5 seconds
-        AC 7: Verify high-risk classification
+        AC 7: Verify risk classification
         AC 8: Log response for narrative quality review
         """
-        # Load demo wallet 1 (High Risk)
-        wallet_data = DEMO_WALLETS[0]
-        assert wallet_data["risk_profile"] == "high", "Demo wallet 1 should be high risk"
-
-        # Create Portfolio from demo wallet using helper function
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
-
-        # Create analysis request
-        request = AnalysisRequest(
-            request_id="test-demo-wallet-1",
-            wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
-            requested_by="agent1test_guardian",
+        request_id = f"test-demo-wallet-{wallet_idx + 1}"
+        portfolio, response, elapsed_ms = await run_demo_wallet_case(
+            correlation_handler, mock_ctx, demo_portfolios, wallet_idx, expected_profile, request_id
         )
 
-        # Measure response time
-        start_time = time.time()
-
-        # Call handler
-        await correlation_handler(
-            ctx=mock_ctx,
-            sender="agent1test_guardian",
-            msg=request,
-        )
-
-        elapsed_ms = (time.time() - start_time) * 1000
-
-        # Verify response was sent
-        assert mock_ctx.send.called, "Agent should send response"
-        call_args = mock_ctx.send.call_args
-        response = call_args[0][1]
-
         # AC 2: Verify response structure
-        assert isinstance(
-            response, CorrelationAnalysisResponse
-        ), "Should return CorrelationAnalysisResponse"
-        assert response.request_id == "test-demo-wallet-1"
+        assert type(response) is CorrelationAnalysisResponse, "Should return CorrelationAnalysisResponse"
+        assert response.request_id == request_id
         assert response.wallet_address == portfolio.wallet_address
 
         # Verify analysis data structure
@@ -132,8 +274,7 @@ class TestCorrelationAgentDemoWallets:
         assert "interpretation" in analysis_data
         assert "narrative" in analysis_data
 
-        # AC 7: Verify high-risk classification
-        # Note: We expect high correlation for DeFi-heavy portfolio
+        # AC 7: Verify risk classification
         correlation_pct = analysis_data["correlation_percentage"]
         assert 0 <= correlation_pct <= 100, "Correlation should be 0-100%"
 
@@ -142,115 +283,17 @@ class TestCorrelationAgentDemoWallets:
         assert response.processing_time_ms < MAX_RESPONSE_TIME_MS
 
         # AC 8: Log response for narrative quality review
-        logger.info("\n=== Demo Wallet 1 (High Risk) Correlation Analysis ===")
-        logger.info(f"Correlation: {correlation_pct}%")
-        logger.info(f"Interpretation: {analysis_data['interpretation']}")
-        logger.info(f"Narrative: {analysis_data['narrative']}")
-        logger.info(f"Response time: {elapsed_ms:.2f}ms")
-
-    @pytest.mark.asyncio
-    async def test_correlation_agent_demo_wallet_2_moderate_risk(self, mock_ctx):
-        """Test CorrelationAgent with Demo Wallet 2 (Moderate Risk Balanced Portfolio).
-
-        Expected: Moderate correlation (70-85%).
-        AC 2, 4, 7, 8: Same as wallet 1 test
-        """
-        wallet_data = DEMO_WALLETS[1]
-        assert wallet_data["risk_profile"] == "moderate", "Demo wallet 2 should be moderate risk"
-
-        portfolio = Portfolio(
-            wallet_address=wallet_data["wallet_address"],
-            tokens=[TokenHolding(**token) for token in wallet_data["tokens"]],
-            total_value_usd=wallet_data["total_value_usd"],
-        )
-
-        request = AnalysisRequest(
-            request_id="test-demo-wallet-2",
-            wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
-            requested_by="agent1test_guardian",
+        logger.info(
+            "\n=== Demo Wallet %d (%s) Correlation Analysis ===\n"
+            "Correlation: %s%%\nInterpretation: %s\nNarrative: %s\nResponse time: %.2fms",
+            wallet_idx + 1,
+            DEMO_WALLET_LABELS[expected_profile],
+            correlation_pct,
+            analysis_data["interpretation"],
+            analysis_data["narrative"],
+            elapsed_ms,
         )
 
-        start_time = time.time()
-        await correlation_handler(ctx=mock_ctx, sender="agent1test_guardian", msg=request)
-        elapsed_ms = (time.time() - start_time) * 1000
-
-        assert mock_ctx.send.called
-        response = mock_ctx.send.call_args[0][1]
-
-        # Verify response structure
-        assert isinstance(response, CorrelationAnalysisResponse)
-        analysis_data = response.analysis_data
-        correlation_pct = analysis_data["correlation_percentage"]
-
-        # AC 4: Response time < 5 seconds
-        assert elapsed_ms < 5000
-        assert response.processing_time_ms < 5000
-
-        # AC 8: Log for narrative quality review
-        logger.info("\n=== Demo Wallet 2 (Moderate Risk) Correlation Analysis ===")
-        logger.info(f"Correlation: {correlation_pct}%")
-        logger.info(f"Interpretation: {analysis_data['interpretation']}")
-        logger.info(f"Narrative: {analysis_data['narrative']}")
-        logger.info(f"Response time: {elapsed_ms:.2f}ms")
-
-    @pytest.mark.asyncio
-    async def test_correlation_agent_demo_wallet_3_diversified(self, mock_ctx):
-        """Test CorrelationAgent with Demo Wallet 3 (Well-Diversified Conservative).
-
-        Expected: Low correlation (<70%) due to diversification.
-        AC 2, 4, 7, 8: Same as wallet 1 test
-        """
-        wallet_data = DEMO_WALLETS[2]
-        assert wallet_data["risk_profile"] == "diversified", "Demo wallet 3 should be diversified"
-
-        portfolio = Portfolio(
-            wallet_address=wallet_data["wallet_address"],
-            tokens=[TokenHolding(**token) for token in wallet_data["tokens"]],
-            total_value_usd=wallet_data["total_value_usd"],
-        )
-
-        request = AnalysisRequest(
-            request_id="test-demo-wallet-3",
-            wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
-            requested_by="agent1test_guardian",
-        )
-
-        start_time = time.time()
-        await correlation_handler(ctx=mock_ctx, sender="agent1test_guardian", msg=request)
-        elapsed_ms = (time.time() - start_time) * 1000
-
-        assert mock_ctx.send.called
-        response = mock_ctx.send.call_args[0][1]
-
-        assert isinstance(response, CorrelationAnalysisResponse)
-        analysis_data = response.analysis_data
-        correlation_pct = analysis_data["correlation_percentage"]
-
-        # AC 4: Response time < 5 seconds
-        assert elapsed_ms < 5000
-        assert response.processing_time_ms < 5000
-
-        # AC 8: Log for narrative quality review
-        logger.info("\n=== Demo Wallet 3 (Diversified) Correlation Analysis ===")
-        logger.info(f"Correlation: {correlation_pct}%")
-        logger.info(f"Interpretation: {analysis_data['interpretation']}")
-        logger.info(f"Narrative: {analysis_data['narrative']}")
-        logger.info(f"Response time: {elapsed_ms:.2f}ms")
-
-    @pytest.mark.hosted
-    @pytest.mark.skip(reason="Requires hosted agent deployed on Agentverse - run manually after deployment")
-    def test_correlation_agent_hosted_accessible(self):
-        """Test CorrelationAgent hosted version is accessible on Agentverse (AC 6, 11)."""
-        # Load hosted agent address from environment
-        hosted_address = os.getenv("CORRELATION_AGENT_ADDRESS_HOSTED")
-        assert hosted_address, "CORRELATION_AGENT_ADDRESS_HOSTED not configured in .env"
-
-        # TODO: Send test request to hosted agent and verify response
-        # This requires actual Agentverse deployment
-        pass
-
 
 # ==============================================================================
 # TASK 2: SectorAgent Integration Tests with Demo Wallets (Story 1.7)
@@ -260,49 +303,27 @@ class TestCorrelationAgentDemoWallets:
 class TestSectorAgentDemoWallets:
     """Integration tests for SectorAgent with all 3 demo wallets (AC 3, 4)."""
 
-    @pytest.fixture
-    def mock_ctx(self):
-        """Create mock context for testing."""
-        ctx = AsyncMock()
-        ctx.agent.address = "agent1test_sector_agent_local"
-        return ctx
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("wallet_idx, expected_profile", DEMO_WALLET_CASES)
+    async def test_sector_agent_demo_wallet(self, mock_ctx, demo_portfolios, wallet_idx, expected_profile):
+        """Test SectorAgent with each demo wallet.
 
-    @pytest.mark.asyncio
-    async def test_sector_agent_demo_wallet_1_high_concentration(self, mock_ctx):
-        """Test SectorAgent with Demo Wallet 1 (High Sector Concentration).
-
-        Expected: High concentration in DeFi Governance sector (>60%).
+        Expected: High concentration in DeFi Governance (>60%) for the DeFi whale,
+        moderate concentration (40-60%) for the balanced portfolio and no sector
+        above 60% for the diversified one.
         AC 3: Verify sector breakdown and concentration detection
         AC 4: Verify response time < 5 seconds
-        AC 7: Verify high-risk classification
+        AC 7: Verify risk classification
         AC 8: Log response for narrative quality review
         """
-        wallet_data = DEMO_WALLETS[0]
-        assert wallet_data["risk_profile"] == "high"
-
-        portfolio = Portfolio(
-            wallet_address=wallet_data["wallet_address"],
-            tokens=[TokenHolding(**token) for token in wallet_data["tokens"]],
-            total_value_usd=wallet_data["total_value_usd"],
+        request_id = f"test-sector-wallet-{wallet_idx + 1}"
+        portfolio, response, elapsed_ms = await run_demo_wallet_case(
+            sector_handler, mock_ctx, demo_portfolios, wallet_idx, expected_profile, request_id
         )
 
-        request = AnalysisRequest(
-            request_id="test-sector-wallet-1",
-            wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
-            requested_by="agent1test_guardian",
-        )
-
-        start_time = time.time()
-        await sector_handler(ctx=mock_ctx, sender="agent1test_guardian", msg=request)
-        elapsed_ms = (time.time() - start_time) * 1000
-
-        assert mock_ctx.send.called
-        response = mock_ctx.send.call_args[0][1]
-
         # AC 3: Verify response structure
-        assert isinstance(response, SectorAnalysisResponse)
-        assert response.request_id == "test-sector-wallet-1"
+        assert type(response) is SectorAnalysisResponse
+        assert response.request_id == request_id
 
         analysis_data = response.analysis_data
         assert "sector_breakdown" in analysis_data
@@ -310,106 +331,23 @@ class TestSectorAgentDemoWallets:
         assert "diversification_score" in analysis_data
 
         # AC 4: Response time < 5 seconds
-        assert elapsed_ms < 5000
-        assert response.processing_time_ms < 5000
+        assert elapsed_ms < MAX_RESPONSE_TIME_MS
+        assert response.processing_time_ms < MAX_RESPONSE_TIME_MS
 
         # AC 8: Log for narrative quality review
-        logger.info("\n=== Demo Wallet 1 (High Risk) Sector Analysis ===")
-        logger.info(f"Diversification Score: {analysis_data['diversification_score']}")
-        logger.info(f"Concentrated Sectors: {analysis_data['concentrated_sectors']}")
-        logger.info(f"Sector Breakdown: {analysis_data['sector_breakdown']}")
-        logger.info(f"Narrative: {analysis_data['narrative']}")
-        logger.info(f"Response time: {elapsed_ms:.2f}ms")
-
-    @pytest.mark.asyncio
-    async def test_sector_agent_demo_wallet_2_moderate_concentration(self, mock_ctx):
-        """Test SectorAgent with Demo Wallet 2 (Moderate Concentration).
-
-        Expected: Moderate concentration (40-60%).
-        """
-        wallet_data = DEMO_WALLETS[1]
-
-        portfolio = Portfolio(
-            wallet_address=wallet_data["wallet_address"],
-            tokens=[TokenHolding(**token) for token in wallet_data["tokens"]],
-            total_value_usd=wallet_data["total_value_usd"],
-        )
-
-        request = AnalysisRequest(
-            request_id="test-sector-wallet-2",
-            wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
-            requested_by="agent1test_guardian",
+        logger.info(
+            "\n=== Demo Wallet %d (%s) Sector Analysis ===\n"
+            "Diversification Score: %s\nConcentrated Sectors: %s\nSector Breakdown: %s\n"
+            "Narrative: %s\nResponse time: %.2fms",
+            wallet_idx + 1,
+            DEMO_WALLET_LABELS[expected_profile],
+            analysis_data["diversification_score"],
+            analysis_data["concentrated_sectors"],
+            analysis_data["sector_breakdown"],
+            analysis_data["narrative"],
+            elapsed_ms,
         )
 
-        start_time = time.time()
-        await sector_handler(ctx=mock_ctx, sender="agent1test_guardian", msg=request)
-        elapsed_ms = (time.time() - start_time) * 1000
-
-        assert mock_ctx.send.called
-        response = mock_ctx.send.call_args[0][1]
-
-        assert isinstance(response, SectorAnalysisResponse)
-        analysis_data = response.analysis_data
-
-        # AC 4: Response time < 5 seconds
-        assert elapsed_ms < 5000
-
-        # AC 8: Log for review
-        logger.info("\n=== Demo Wallet 2 (Moderate Risk) Sector Analysis ===")
-        logger.info(f"Diversification Score: {analysis_data['diversification_score']}")
-        logger.info(f"Concentrated Sectors: {analysis_data['concentrated_sectors']}")
-        logger.info(f"Response time: {elapsed_ms:.2f}ms")
-
-    @pytest.mark.asyncio
-    async def test_sector_agent_demo_wallet_3_well_diversified(self, mock_ctx):
-        """Test SectorAgent with Demo Wallet 3 (Well-Diversified).
-
-        Expected: No sector exceeds 60%, concentrated_sectors list empty.
-        """
-        wallet_data = DEMO_WALLETS[2]
-
-        portfolio = Portfolio(
-            wallet_address=wallet_data["wallet_address"],
-            tokens=[TokenHolding(**token) for token in wallet_data["tokens"]],
-            total_value_usd=wallet_data["total_value_usd"],
-        )
-
-        request = AnalysisRequest(
-            request_id="test-sector-wallet-3",
-            wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
-            requested_by="agent1test_guardian",
-        )
-
-        start_time = time.time()
-        await sector_handler(ctx=mock_ctx, sender="agent1test_guardian", msg=request)
-        elapsed_ms = (time.time() - start_time) * 1000
-
-        assert mock_ctx.send.called
-        response = mock_ctx.send.call_args[0][1]
-
-        assert isinstance(response, SectorAnalysisResponse)
-        analysis_data = response.analysis_data
-
-        # AC 4: Response time < 5 seconds
-        assert elapsed_ms < 5000
-
-        # AC 8: Log for review
-        logger.info("\n=== Demo Wallet 3 (Diversified) Sector Analysis ===")
-        logger.info(f"Diversification Score: {analysis_data['diversification_score']}")
-        logger.info(f"Concentrated Sectors: {analysis_data['concentrated_sectors']}")
-        logger.info(f"Response time: {elapsed_ms:.2f}ms")
-
-    @pytest.mark.hosted
-    @pytest.mark.skip(reason="Requires hosted agent deployed on Agentverse")
-    def test_sector_agent_hosted_accessible(self):
-        """Test SectorAgent hosted version is accessible on Agentverse (AC 6, 11)."""
-        hosted_address = os.getenv("SECTOR_AGENT_ADDRESS_HOSTED")
-        assert hosted_address, "SECTOR_AGENT_ADDRESS_HOSTED not configured"
-        # TODO: Send test request to hosted agent
-        pass
-
 
 # ==============================================================================
 # TASK 3: Error Handling Integration Tests (Story 1.7)
@@ -419,33 +357,25 @@ class TestSectorAgentDemoWallets:
 class TestErrorHandling:
     """Test error handling for edge cases (AC 5)."""
 
-    @pytest.fixture
-    def mock_ctx(self):
-        """Create mock context for testing."""
-        ctx = AsyncMock()
-        ctx.agent.address = "agent1test_agent"
-        return ctx
+    def test_empty_portfolio_rejected_by_validation(self):
+        """Test empty portfolio data fails Portfolio validation before any analysis (AC 5)."""
+        with pytest.raises(ValidationError, match="at least 1 item"):
+            Portfolio(**EMPTY_PORTFOLIO_DATA)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_correlation_agent_empty_portfolio(self, mock_ctx):
-        """Test CorrelationAgent with empty portfolio (AC 5)."""
-        empty_portfolio_data = {
-            "wallet_address": "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0",
-            "tokens": [],
-            "total_value_usd": 0.0,
-        }
-
+        """Test CorrelationAgent replies with an ErrorMessage for an empty portfolio (AC 5)."""
         request = AnalysisRequest(
             request_id="test-empty-portfolio",
             wallet_address="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0",
-            portfolio_data=empty_portfolio_data,
+            portfolio_data=EMPTY_PORTFOLIO_DATA,
             requested_by="agent1test_guardian",
         )
 
         await correlation_handler(ctx=mock_ctx, sender="agent1test_guardian", msg=request)
 
-        assert mock_ctx.send.called
-        response = mock_ctx.send.call_args[0][1]
+        assert mock_ctx.sent_messages
+        response = mock_ctx.sent_messages[-1]
 
         # Expect ErrorMessage
         assert isinstance(response, ErrorMessage)
@@ -461,26 +391,26 @@ class TestErrorHandling:
 
         logger.info(f"\nEmpty Portfolio Error: {response.error_message}")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_correlation_agent_single_token(self, mock_ctx):
         """Test CorrelationAgent with single token portfolio (AC 5)."""
         single_token_portfolio = Portfolio(
             wallet_address="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0",
-            tokens=[TokenHolding(symbol="ETH", amount=10.0, price_usd=2650.0, value_usd=26500.0)],
+            tokens=[ETH_HOLDING],
             total_value_usd=26500.0,
         )
 
         request = AnalysisRequest(
             request_id="test-single-token",
             wallet_address=single_token_portfolio.wallet_address,
-            portfolio_data=single_token_portfolio.model_dump(),
+            portfolio_data=single_token_portfolio.model_dump(exclude_unset=True),
             requested_by="agent1test_guardian",
         )
 
         await correlation_handler(ctx=mock_ctx, sender="agent1test_guardian", msg=request)
 
-        assert mock_ctx.send.called
-        response = mock_ctx.send.call_args[0][1]
+        assert mock_ctx.sent_messages
+        response = mock_ctx.sent_messages[-1]
 
         # Agent should handle gracefully (may return error or correlation=1.0)
         assert isinstance(response, (CorrelationAnalysisResponse, ErrorMessage))
@@ -490,7 +420,7 @@ class TestErrorHandling:
         else:
             logger.info(f"\nSingle Token Correlation: {response.analysis_data['correlation_percentage']}%")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_sector_agent_unknown_tokens(self, mock_ctx):
         """Test SectorAgent with unknown tokens (AC 5)."""
         unknown_token_portfolio = Portfolio(
@@ -506,14 +436,14 @@ class TestErrorHandling:
         request = AnalysisRequest(
             request_id="test-unknown-tokens",
             wallet_address=unknown_token_portfolio.wallet_address,
-            portfolio_data=unknown_token_portfolio.model_dump(),
+            portfolio_data=unknown_token_portfolio.model_dump(exclude_unset=True),
             requested_by="agent1test_guardian",
         )
 
         await sector_handler(ctx=mock_ctx, sender="agent1test_guardian", msg=request)
 
-        assert mock_ctx.send.called
-        response = mock_ctx.send.call_args[0][1]
+        assert mock_ctx.sent_messages
+        response = mock_ctx.sent_messages[-1]
 
         # Should complete without crash
         assert isinstance(response, (SectorAnalysisResponse, ErrorMessage))
@@ -533,8 +463,9 @@ class TestChatProtocolIntegration:
 
     @pytest.mark.hosted
     @pytest.mark.skip(reason="Requires hosted agents with Chat Protocol deployed")
-    def test_correlation_agent_chat_protocol(self):
-        """Test CorrelationAgent Chat Protocol integration (AC 12, 13, 14).
+    @pytest.mark.parametrize("agent_name", ["CorrelationAgent", "SectorAgent"])
+    def test_agent_chat_protocol(self, agent_name):
+        """Test CorrelationAgent/SectorAgent Chat Protocol integration (AC 12, 13, 14).
 
         Tests:
         - Natural language query handling
@@ -542,40 +473,27 @@ class TestChatProtocolIntegration:
         - Session management (ctx.storage.set/get)
         """
         # TODO: Implement when hosted agents are deployed
-        # Send ChatMessage to hosted CorrelationAgent
+        # Send ChatMessage to hosted agent
         # Verify ChatResponse returned
         # Verify AI extracted wallet address correctly
         # Test session persistence with follow-up message
         pass
 
-    @pytest.mark.hosted
-    @pytest.mark.skip(reason="Requires hosted agents with Chat Protocol deployed")
-    def test_sector_agent_chat_protocol(self):
-        """Test SectorAgent Chat Protocol integration (AC 12, 13, 14)."""
-        # TODO: Implement when hosted agents are deployed
-        pass
-
     @pytest.mark.hosted
     @pytest.mark.skip(reason="Requires manual verification via ASI:One interface")
-    def test_correlation_agent_discoverable_in_asi_one(self):
-        """Test CorrelationAgent is discoverable in ASI:One (AC 15).
+    @pytest.mark.parametrize("agent_name", ["CorrelationAgent", "SectorAgent"])
+    def test_agent_discoverable_in_asi_one(self, agent_name):
+        """Test CorrelationAgent/SectorAgent is discoverable in ASI:One (AC 15).
 
         Manual verification steps:
-        1. Search ASI:One for "correlation agent" or "ETH correlation"
-        2. Verify CorrelationAgent appears in results
+        1. Search ASI:One for the agent (e.g. "correlation agent" or "ETH correlation")
+        2. Verify the agent appears in results
         3. Verify publish_manifest=True in hosted agent
         4. Verify comprehensive README visible
         """
         # This test documents the manual verification requirement
         pass
 
-    @pytest.mark.hosted
-    @pytest.mark.skip(reason="Requires manual verification via ASI:One interface")
-    def test_sector_agent_discoverable_in_asi_one(self):
-        """Test SectorAgent is discoverable in ASI:One (AC 15)."""
-        # Manual verification required
-        pass
-
 
 # ==============================================================================
 # TASK 6: Local vs Hosted Consistency Tests (Story 1.7)
@@ -586,33 +504,40 @@ class TestLocalVsHostedConsistency:
     """Test local and hosted agents produce consistent results (AC 16)."""
 
     @pytest.mark.hosted
-    @pytest.mark.skip(reason="Requires both local and hosted agents running")
-    def test_correlation_agent_local_vs_hosted_consistency(self):
-        """Compare CorrelationAgent local vs hosted outputs (AC 16).
+    @pytest.mark.skip(reason="Requires hosted agent deployed on Agentverse - run manually after deployment")
+    @pytest.mark.parametrize(
+        "agent_name, env_var",
+        [
+            ("CorrelationAgent", "CORRELATION_AGENT_ADDRESS_HOSTED"),
+            ("SectorAgent", "SECTOR_AGENT_ADDRESS_HOSTED"),
+        ],
+    )
+    def test_agent_hosted_accessible(self, agent_name, env_var):
+        """Test CorrelationAgent/SectorAgent hosted version is accessible on Agentverse (AC 6, 11)."""
+        # Load hosted agent address from environment
+        hosted_address = os.getenv(env_var)
+        assert hosted_address, f"{env_var} not configured in .env"
 
-        Sends identical AnalysisRequest to both versions and compares:
-        - correlation_percentage (should match within ±2%)
-        - historical_context (crash scenarios should be identical)
-        - narrative quality (should be semantically similar)
-        """
-        # TODO: Implement when hosted agent deployed
-        # Send same request to local and hosted versions
-        # Compare correlation_percentage (allow ±2% tolerance)
-        # Compare historical_context lists
-        # Log any discrepancies
+        # TODO: Send test request to hosted agent and verify response
+        # This requires actual Agentverse deployment
         pass
 
     @pytest.mark.hosted
     @pytest.mark.skip(reason="Requires both local and hosted agents running")
-    def test_sector_agent_local_vs_hosted_consistency(self):
-        """Compare SectorAgent local vs hosted outputs (AC 16).
+    @pytest.mark.parametrize("agent_name", ["CorrelationAgent", "SectorAgent"])
+    def test_agent_local_vs_hosted_consistency(self, agent_name):
+        """Compare CorrelationAgent/SectorAgent local vs hosted outputs (AC 16).
 
-        Compares:
-        - sector_breakdown percentages (should match exactly)
-        - concentrated_sectors lists (should be identical)
-        - narrative content (minor formatting differences acceptable)
+        Sends identical AnalysisRequest to both versions and compares:
+        - CorrelationAgent: correlation_percentage (within ±2%) and
+          historical_context (crash scenarios should be identical)
+        - SectorAgent: sector_breakdown percentages (exact) and
+          concentrated_sectors lists (identical)
+        - narrative quality (semantically similar; minor formatting differences acceptable)
         """
         # TODO: Implement when hosted agent deployed
+        # Send same request to local and hosted versions
+        # Compare the metrics above and log any discrepancies
         pass
 
 
@@ -626,65 +551,44 @@ class TestAgentREADMEValidation:
 
     def test_correlation_agent_readme_exists(self):
         """Test CorrelationAgent README completeness (AC 17)."""
-        readme_path = Path(__file__).parent.parent / "agents" / "correlation_agent_README.md"
-        assert readme_path.exists(), f"README not found at {readme_path}"
-
-        with open(readme_path, "r") as f:
-            content = f.read()
+        content = read_agent_readme("correlation")
+        assert content is not None, f"README not found at {AGENTS_DIR / 'correlation_agent_README.md'}"
 
         # Verify required sections present
-        required_sections = [
-            "## Description",
-            "## Example Queries",
-            "## How it works",
-            "## Technical Details",
-            "## Limitations",
-            "## Example Output",
-        ]
-
-        for section in required_sections:
-            assert section in content, f"Missing required section: {section}"
+        found_sections = set(AGENT_README_SECTION_RE.findall(content))
+        for section in AGENT_README_SECTIONS:
+            assert section in found_sections, f"Missing required section: {section}"
 
         # Count example queries (should be >= 5)
-        if "## Example Queries" in content:
-            queries_section = content.split("## Example Queries")[1].split("##")[0]
+        queries_match = EXAMPLE_QUERIES_RE.search(content)
+        if queries_match:
             # Count bullet points
-            query_count = queries_section.count("- ")
+            query_count = queries_match.group(1).count("- ")
             assert query_count >= 5, f"Found {query_count} queries, need >= 5"
 
         logger.info("\n✅ CorrelationAgent README validation passed")
-        logger.info(f"   Required sections: {len(required_sections)}/{len(required_sections)}")
+        logger.info(f"   Required sections: {len(AGENT_README_SECTIONS)}/{len(AGENT_README_SECTIONS)}")
         logger.info(f"   Example queries: {query_count}")
 
     def test_sector_agent_readme_exists(self):
         """Test SectorAgent README completeness (AC 17)."""
-        readme_path = Path(__file__).parent.parent / "agents" / "sector_agent_README.md"
-        assert readme_path.exists(), f"README not found at {readme_path}"
-
-        with open(readme_path, "r") as f:
-            content = f.read()
+        content = read_agent_readme("sector")
+        assert content is not None, f"README not found at {AGENTS_DIR / 'sector_agent_README.md'}"
 
         # Verify required sections
-        required_sections = [
-            "## Description",
-            "## Example Queries",
-            "## How it works",
-            "## Technical Details",
-            "## Limitations",
-            "## Example Output",
-        ]
-
-        for section in required_sections:
-            assert section in content, f"Missing required section: {section}"
+        found_sections = set(AGENT_README_SECTION_RE.findall(content))
+        for section in AGENT_README_SECTIONS:
+            assert section in found_sections, f"Missing required section: {section}"
 
         # Count example queries
-        if "## Example Queries" in content:
-            queries_section = content.split("## Example Queries")[1].split("##")[0]
-            query_count = queries_section.count("- ")
+        queries_match = EXAMPLE_QUERIES_RE.search(content)
+        if queries_match:
+            # Count bullet points
+            query_count = queries_match.group(1).count("- ")
             assert query_count >= 5, f"Found {query_count} queries, need >= 5"
 
         logger.info("\n✅ SectorAgent README validation passed")
-        logger.info(f"   Required sections: {len(required_sections)}/{len(required_sections)}")
+        logger.info(f"   Required sections: {len(AGENT_README_SECTIONS)}/{len(AGENT_README_SECTIONS)}")
         logger.info(f"   Example queries: {query_count}")
 
 
@@ -696,15 +600,9 @@ class TestAgentREADMEValidation:
 class TestComprehensiveRiskProfiles:
     """Test all 3 demo wallets return expected risk profiles from both agents (AC 7, 8)."""
 
-    @pytest.fixture
-    def mock_ctx(self):
-        """Create mock context for testing."""
-        ctx = AsyncMock()
-        ctx.agent.address = "agent1test_comprehensive"
-        return ctx
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-    @pytest.mark.asyncio
-    async def test_all_demo_wallets_expected_risk_profiles(self, mock_ctx):
+    async def test_all_demo_wallets_expected_risk_profiles(self, mock_ctx, demo_portfolios):
         """Test all 3 demo wallets with both agents and verify risk classification (AC 7, 8).
 
         Validates:
@@ -712,77 +610,75 @@ class TestComprehensiveRiskProfiles:
         - Demo Wallet 2: Both agents classify as moderate risk
         - Demo Wallet 3: Both agents classify as low risk/well-diversified
         """
-        results = []
-
-        for idx, wallet_data in enumerate(DEMO_WALLETS, start=1):
-            portfolio = Portfolio(
-                wallet_address=wallet_data["wallet_address"],
-                tokens=[TokenHolding(**token) for token in wallet_data["tokens"]],
-                total_value_usd=wallet_data["total_value_usd"],
-            )
-
-            # Test CorrelationAgent
-            corr_request = AnalysisRequest(
-                request_id=f"test-comprehensive-{idx}-corr",
-                wallet_address=portfolio.wallet_address,
-                portfolio_data=portfolio.model_dump(),
-                requested_by="agent1test_guardian",
+        # Build every request up front so dispatch below is pure event-loop scheduling
+        dispatches = [
+            (
+                handler,
+                AnalysisRequest(
+                    request_id=f"test-comprehensive-{idx}-{suffix}",
+                    wallet_address=portfolio.wallet_address,
+                    portfolio_data=portfolio_data,
+                    requested_by="agent1test_guardian",
+                ),
             )
+            for idx, (portfolio, portfolio_data) in enumerate(demo_portfolios, start=1)
+            for handler, suffix in ((correlation_handler, "corr"), (sector_handler, "sector"))
+        ]
 
-            await correlation_handler(ctx=mock_ctx, sender="agent1test_guardian", msg=corr_request)
-            corr_response = mock_ctx.send.call_args[0][1]
+        # Dispatch both agents for every wallet at once; responses are matched by request_id
+        await asyncio.gather(
+            *(handler(ctx=mock_ctx, sender="agent1test_guardian", msg=request) for handler, request in dispatches)
+        )
+        responses = {message.request_id: message for message in mock_ctx.sent_messages}
 
-            # Test SectorAgent
-            sector_request = AnalysisRequest(
-                request_id=f"test-comprehensive-{idx}-sector",
-                wallet_address=portfolio.wallet_address,
-                portfolio_data=portfolio.model_dump(),
-                requested_by="agent1test_guardian",
-            )
+        results = []
 
-            await sector_handler(ctx=mock_ctx, sender="agent1test_guardian", msg=sector_request)
-            sector_response = mock_ctx.send.call_args[0][1]
+        for idx, wallet_data in enumerate(DEMO_WALLETS, start=1):
+            corr_response = responses[f"test-comprehensive-{idx}-corr"]
+            sector_response = responses[f"test-comprehensive-{idx}-sector"]
 
             # Collect results
+            corr_ok = type(corr_response) is CorrelationAnalysisResponse
+            sector_ok = type(sector_response) is SectorAnalysisResponse
             result = {
                 "wallet": wallet_data["name"],
                 "expected_risk": wallet_data["risk_profile"],
-                "correlation_response": isinstance(corr_response, CorrelationAnalysisResponse),
-                "sector_response": isinstance(sector_response, SectorAnalysisResponse),
+                "responses_ok": (corr_ok, sector_ok),
             }
 
-            if isinstance(corr_response, CorrelationAnalysisResponse):
+            if corr_ok:
                 result["correlation_pct"] = corr_response.analysis_data["correlation_percentage"]
                 result["correlation_interpretation"] = corr_response.analysis_data["interpretation"]
 
-            if isinstance(sector_response, SectorAnalysisResponse):
+            if sector_ok:
                 result["diversification_score"] = sector_response.analysis_data["diversification_score"]
                 result["concentrated_sectors"] = sector_response.analysis_data["concentrated_sectors"]
 
             results.append(result)
 
-        # Log comprehensive report (AC 8)
-        logger.info("\n" + "=" * 80)
-        logger.info("COMPREHENSIVE RISK PROFILE VALIDATION - ALL DEMO WALLETS")
-        logger.info("=" * 80)
+        # Log comprehensive report (AC 8) as a single record
+        if logger.isEnabledFor(logging.INFO):
+            report = ["", "=" * 80, "COMPREHENSIVE RISK PROFILE VALIDATION - ALL DEMO WALLETS", "=" * 80]
 
-        for result in results:
-            logger.info(f"\n{result['wallet']} (Expected: {result['expected_risk']})")
-            logger.info("  CorrelationAgent:")
-            if result.get("correlation_pct") is not None:
-                logger.info(f"    - Correlation: {result['correlation_pct']}%")
-                logger.info(f"    - Interpretation: {result['correlation_interpretation']}")
-            logger.info("  SectorAgent:")
-            if result.get("diversification_score"):
-                logger.info(f"    - Diversification Score: {result['diversification_score']}")
-                logger.info(f"    - Concentrated Sectors: {result['concentrated_sectors']}")
+            for result in results:
+                report.append(f"\n{result['wallet']} (Expected: {result['expected_risk']})")
+                report.append("  CorrelationAgent:")
+                if result.get("correlation_pct") is not None:
+                    report.append(f"    - Correlation: {result['correlation_pct']}%")
+                    report.append(f"    - Interpretation: {result['correlation_interpretation']}")
+                report.append("  SectorAgent:")
+                if result.get("diversification_score"):
+                    report.append(f"    - Diversification Score: {result['diversification_score']}")
+                    report.append(f"    - Concentrated Sectors: {result['concentrated_sectors']}")
 
-        logger.info("\n" + "=" * 80)
+            report.extend(["", "=" * 80])
+            logger.info("\n".join(report))
 
         # Verify all responses successful
         for result in results:
-            assert result["correlation_response"], f"{result['wallet']}: CorrelationAgent failed"
-            assert result["sector_response"], f"{result['wallet']}: SectorAgent failed"
+            corr_ok, sector_ok = result["responses_ok"]
+            assert corr_ok, f"{result['wallet']}: CorrelationAgent failed"
+            assert sector_ok, f"{result['wallet']}: SectorAgent failed"
 
 
 # ==============================================================================
@@ -793,9 +689,9 @@ class TestComprehensiveRiskProfiles:
 class TestGuardianOrchestration:
     """Integration tests for Guardian orchestrator agent (Story 2.2)."""
 
-    @pytest.fixture
-    def mock_ctx(self):
-        """Create mock context for testing."""
+    @pytest.fixture(scope="session")
+    def guardian_ctx(self):
+        """Mock Guardian context with dict-backed storage, constructed once per session."""
         ctx = AsyncMock()
         ctx.agent.address = "agent1test_guardian_local"
 
@@ -810,11 +706,19 @@ class TestGuardianOrchestration:
 
         ctx.storage.set = storage_set
         ctx.storage.get = storage_get
+        ctx.storage_dict = storage_dict
 
         return ctx
 
-    @pytest.mark.asyncio
-    async def test_guardian_to_correlation_agent(self, mock_ctx):
+    @pytest.fixture
+    def mock_ctx(self, guardian_ctx):
+        """Shared Guardian context, reset so each test starts with no calls and empty storage."""
+        guardian_ctx.reset_mock(return_value=True, side_effect=True)
+        guardian_ctx.storage_dict.clear()
+        return guardian_ctx
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_guardian_to_correlation_agent(self, mock_ctx, demo_portfolios):
         """Test Guardian sends request to CorrelationAgent and receives response (AC 10).
 
         Validates:
@@ -824,17 +728,16 @@ class TestGuardianOrchestration:
         - Response time < 10 seconds
         """
 
-        wallet_data = DEMO_WALLETS[0]
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[0]
 
         request = AnalysisRequest(
             request_id="test-guardian-corr-1",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user",
         )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Mock sending to CorrelationAgent and receiving response
         # In real scenario, Guardian would send to CorrelationAgent via ctx.send()
@@ -845,7 +748,7 @@ class TestGuardianOrchestration:
             msg=request
         )
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Verify CorrelationAgent responded
         assert mock_ctx.send.called
@@ -861,8 +764,8 @@ class TestGuardianOrchestration:
 
         logger.info(f"\n✅ Guardian → CorrelationAgent test passed ({elapsed_ms:.0f}ms)")
 
-    @pytest.mark.asyncio
-    async def test_guardian_to_sector_agent(self, mock_ctx):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_guardian_to_sector_agent(self, mock_ctx, demo_portfolios):
         """Test Guardian sends request to SectorAgent and receives response (AC 10).
 
         Validates:
@@ -871,17 +774,16 @@ class TestGuardianOrchestration:
         - Response includes sector breakdown and concentration warnings
         - Response time < 10 seconds
         """
-        wallet_data = DEMO_WALLETS[0]
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[0]
 
         request = AnalysisRequest(
             request_id="test-guardian-sector-1",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user",
         )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Mock sending to SectorAgent and receiving response
         await sector_handler(
@@ -890,7 +792,7 @@ class TestGuardianOrchestration:
             msg=request
         )
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Verify SectorAgent responded
         assert mock_ctx.send.called
@@ -906,8 +808,8 @@ class TestGuardianOrchestration:
 
         logger.info(f"\n✅ Guardian → SectorAgent test passed ({elapsed_ms:.0f}ms)")
 
-    @pytest.mark.asyncio
-    async def test_guardian_full_analysis_demo_wallet_1(self, mock_ctx):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_guardian_full_analysis_demo_wallet_1(self, mock_ctx, demo_portfolios):
         """Test complete Guardian orchestration flow for high-risk demo wallet (AC 10).
 
         Validates:
@@ -916,20 +818,17 @@ class TestGuardianOrchestration:
         - Response includes agent addresses for transparency
         - End-to-end time < 30 seconds
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
-        wallet_data = DEMO_WALLETS[0]
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[0]
 
         request = AnalysisRequest(
             request_id="test-guardian-full-1",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user",
         )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Call Guardian handler
         await guardian_handler(
@@ -938,7 +837,7 @@ class TestGuardianOrchestration:
             msg=request
         )
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Verify Guardian sent response
         assert mock_ctx.send.called
@@ -972,7 +871,7 @@ class TestGuardianOrchestration:
             logger.warning(f"\n⚠️ Guardian returned ErrorMessage: {guardian_response.error_message}")
             logger.warning("   This is expected if CORRELATION_AGENT_ADDRESS or SECTOR_AGENT_ADDRESS not configured")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_guardian_timeout_handling(self, mock_ctx):
         """Test Guardian handles agent timeout gracefully (AC 10).
 
@@ -981,10 +880,8 @@ class TestGuardianOrchestration:
         - Response includes available analysis only
         - Response indicates which agent timed out
         """
-        from agents.guardian_agent_local import wait_for_response
 
-        wallet_data = DEMO_WALLETS[0]
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio = DEMO_PORTFOLIOS[0]
 
         # Test timeout with very short timeout value
         response = await wait_for_response(
@@ -1000,14 +897,10 @@ class TestGuardianOrchestration:
         logger.info("\n✅ Guardian timeout handling test passed")
         logger.info("   Timeout correctly returned None after 0.1s")
 
-    @pytest.mark.asyncio
-    async def test_guardian_readme_exists(self):
+    def test_guardian_readme_exists(self):
         """Test Guardian README completeness (AC 16, 17)."""
-        readme_path = Path(__file__).parent.parent / "agents" / "guardian_agent_README.md"
-        assert readme_path.exists(), f"Guardian README not found at {readme_path}"
-
-        with open(readme_path, "r") as f:
-            content = f.read()
+        content = read_agent_readme("guardian")
+        assert content is not None, f"Guardian README not found at {AGENTS_DIR / 'guardian_agent_README.md'}"
 
         # Verify required sections present
         required_sections = [
@@ -1041,8 +934,8 @@ class TestGuardianOrchestration:
     # SYNTHESIS INTEGRATION TESTS (Story 2.3)
     # =========================================================================
 
-    @pytest.mark.asyncio
-    async def test_guardian_synthesis_demo_wallet_1_high_risk(self, mock_ctx):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_guardian_synthesis_demo_wallet_1_high_risk(self, mock_ctx, demo_portfolios):
         """Test Guardian synthesis for high-risk demo wallet with compounding risk (AC 9, 10).
 
         Validates:
@@ -1052,21 +945,18 @@ class TestGuardianOrchestration:
         - Response includes historical crash example
         - Overall risk level = "Critical"
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
         # Demo Wallet 1: High Risk DeFi Whale (95% correlation + 68% DeFi Governance)
-        wallet_data = DEMO_WALLETS[0]
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[0]
 
         request = AnalysisRequest(
             request_id="test-synthesis-wallet-1",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user",
         )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Call Guardian handler
         await guardian_handler(
@@ -1075,7 +965,7 @@ class TestGuardianOrchestration:
             msg=request
         )
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Verify Guardian sent response
         assert mock_ctx.send.called
@@ -1122,8 +1012,8 @@ class TestGuardianOrchestration:
         else:
             logger.warning("\n⚠️ Guardian returned ErrorMessage (expected in test environment without agent addresses)")
 
-    @pytest.mark.asyncio
-    async def test_guardian_synthesis_demo_wallet_3_well_diversified(self, mock_ctx):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_guardian_synthesis_demo_wallet_3_well_diversified(self, mock_ctx, demo_portfolios):
         """Test Guardian synthesis for well-diversified demo wallet (AC 9, 10).
 
         Validates:
@@ -1133,21 +1023,18 @@ class TestGuardianOrchestration:
         - Response explains why portfolio limits compounding risks
         - Overall risk level = "Low" or "Moderate"
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
         # Demo Wallet 3: Well-Diversified Conservative
-        wallet_data = DEMO_WALLETS[2]
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[2]
 
         request = AnalysisRequest(
             request_id="test-synthesis-wallet-3",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user",
         )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Call Guardian handler
         await guardian_handler(
@@ -1156,7 +1043,7 @@ class TestGuardianOrchestration:
             msg=request
         )
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Verify Guardian sent response
         assert mock_ctx.send.called
@@ -1235,9 +1122,6 @@ class TestGuardianTransparencyStructure:
         - AC 6: Timing information present for each agent
         - AC 4: Synthesis includes explicit agent references
         """
-        from agents.guardian_agent_local import format_combined_response
-        from agents.shared.models import CorrelationAnalysisResponse, SectorAnalysisResponse, GuardianSynthesis
-        from unittest.mock import Mock
 
         # Create mock responses with all required fields
         correlation_response = CorrelationAnalysisResponse(
@@ -1359,7 +1243,6 @@ class TestGuardianTransparencyStructure:
         - AC 7: Error transparency for agent failures
         - Timeout messages explain duration and impact
         """
-        from agents.guardian_agent_local import format_combined_response
 
         # Simulate: CorrelationAgent timed out, only SectorAgent responded
         correlation_response = None  # Timeout
@@ -1406,7 +1289,6 @@ class TestGuardianTransparencyStructure:
         Validates:
         - AC 2: Agent responses presented verbatim (not summarized)
         """
-        from agents.guardian_agent_local import format_combined_response
 
         correlation_narrative = "Your portfolio is 95% correlated to ETH. Specific narrative text from CorrelationAgent."
         sector_narrative = "68% of your portfolio is concentrated in DeFi Governance. Specific sector analysis text."
@@ -1458,7 +1340,6 @@ class TestGuardianTransparencyStructure:
 
     def test_truncate_address(self):
         """Test agent address truncation function for header readability."""
-        from agents.guardian_agent_local import truncate_address
 
         # Test long address truncation (first 10 chars + ... + last 3 chars)
         long_address = "agent1qw2e3r4t5y6u7i8o9p0a1s2d3f4g5h6j7k8l9z0"
@@ -1482,6 +1363,8 @@ class TestGuardianTransparencyStructure:
 class TestGuardianOrchestrationE2E:
     """End-to-end integration tests for Guardian orchestration with demo wallets (Story 2.6, Task 1)."""
 
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
     @pytest.fixture
     def mock_ctx(self):
         """Create mock context for testing."""
@@ -1502,8 +1385,7 @@ class TestGuardianOrchestrationE2E:
 
         return ctx
 
-    @pytest.mark.asyncio
-    async def test_guardian_orchestration_demo_wallet_1_e2e(self, mock_ctx):
+    async def test_guardian_orchestration_demo_wallet_1_e2e(self, mock_ctx, demo_portfolios):
         """Test complete Guardian orchestration for demo wallet 1 (High Risk DeFi Whale).
 
         Validates (AC 1, 2):
@@ -1512,21 +1394,18 @@ class TestGuardianOrchestrationE2E:
         - Guardian returns GuardianAnalysisResponse with both analyses
         - Response structure is valid
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
         # Load high-risk demo wallet
-        wallet_data = DEMO_WALLETS[0]
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[0]
 
         request = AnalysisRequest(
             request_id="test-e2e-wallet-1",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user_e2e",
         )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Call Guardian handler (simulates full orchestration)
         await guardian_handler(
@@ -1535,7 +1414,7 @@ class TestGuardianOrchestrationE2E:
             msg=request
         )
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Verify Guardian sent response
         assert mock_ctx.send.called, "Guardian should send response"
@@ -1559,28 +1438,24 @@ class TestGuardianOrchestrationE2E:
             logger.warning(f"⚠️ Guardian returned ErrorMessage: {guardian_response.error_message}")
             logger.warning("   Expected in test environment without CORRELATION_AGENT_ADDRESS/SECTOR_AGENT_ADDRESS")
 
-    @pytest.mark.asyncio
-    async def test_guardian_orchestration_demo_wallet_2_e2e(self, mock_ctx):
+    async def test_guardian_orchestration_demo_wallet_2_e2e(self, mock_ctx, demo_portfolios):
         """Test complete Guardian orchestration for demo wallet 2 (Moderate Risk).
 
         Validates (AC 1, 2):
         - Guardian processes moderate-risk portfolio correctly
         - Response structure valid for moderate-risk classification
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
-        wallet_data = DEMO_WALLETS[1]
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[1]
 
         request = AnalysisRequest(
             request_id="test-e2e-wallet-2",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user_e2e",
         )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         await guardian_handler(
             ctx=mock_ctx,
@@ -1588,7 +1463,7 @@ class TestGuardianOrchestrationE2E:
             msg=request
         )
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         assert mock_ctx.send.called
         guardian_response = mock_ctx.send.call_args[0][1]
@@ -1602,28 +1477,24 @@ class TestGuardianOrchestrationE2E:
         else:
             logger.warning(f"⚠️ Guardian returned ErrorMessage: {guardian_response.error_message}")
 
-    @pytest.mark.asyncio
-    async def test_guardian_orchestration_demo_wallet_3_e2e(self, mock_ctx):
+    async def test_guardian_orchestration_demo_wallet_3_e2e(self, mock_ctx, demo_portfolios):
         """Test complete Guardian orchestration for demo wallet 3 (Well-Diversified).
 
         Validates (AC 1, 2):
         - Guardian processes well-diversified portfolio correctly
         - Response confirms low compounding risk structure
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
-        wallet_data = DEMO_WALLETS[2]
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[2]
 
         request = AnalysisRequest(
             request_id="test-e2e-wallet-3",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user_e2e",
         )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         await guardian_handler(
             ctx=mock_ctx,
@@ -1631,7 +1502,7 @@ class TestGuardianOrchestrationE2E:
             msg=request
         )
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         assert mock_ctx.send.called
         guardian_response = mock_ctx.send.call_args[0][1]
@@ -1649,6 +1520,8 @@ class TestGuardianOrchestrationE2E:
 class TestGuardianSynthesisQuality:
     """Test Guardian synthesis quality and uniqueness (Story 2.6, Task 2)."""
 
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
     @pytest.fixture
     def mock_ctx(self):
         """Create mock context for testing."""
@@ -1668,8 +1541,7 @@ class TestGuardianSynthesisQuality:
 
         return ctx
 
-    @pytest.mark.asyncio
-    async def test_synthesis_reveals_compounding_risk(self, mock_ctx):
+    async def test_synthesis_reveals_compounding_risk(self, mock_ctx, demo_portfolios):
         """Test synthesis identifies compounding risk not visible in individual agent responses (AC 3).
 
         Validates:
@@ -1677,17 +1549,14 @@ class TestGuardianSynthesisQuality:
         - Compounding risk pattern detected when correlation >85% AND sector >60%
         - Synthesis explains risk multiplier effect
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
         # Use demo wallet 1 (high correlation + high sector concentration)
-        wallet_data = DEMO_WALLETS[0]
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[0]
 
         request = AnalysisRequest(
             request_id="test-synthesis-compounding",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user",
         )
 
@@ -1719,24 +1588,20 @@ class TestGuardianSynthesisQuality:
         else:
             logger.warning("⚠️ Test skipped - agent addresses not configured")
 
-    @pytest.mark.asyncio
-    async def test_synthesis_references_both_agents_explicitly(self, mock_ctx):
+    async def test_synthesis_references_both_agents_explicitly(self, mock_ctx, demo_portfolios):
         """Test synthesis narrative references both CorrelationAgent and SectorAgent explicitly (AC 3, 9).
 
         Validates:
         - Synthesis mentions both agent names or their analyses
         - Narrative is cohesive, not just concatenation
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
-        wallet_data = DEMO_WALLETS[0]
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[0]
 
         request = AnalysisRequest(
             request_id="test-synthesis-agent-refs",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user",
         )
 
@@ -1777,6 +1642,8 @@ class TestGuardianSynthesisQuality:
 class TestMeTTaKnowledgeGraphIntegration:
     """Test MeTTa knowledge graph integration in Guardian responses (Story 2.6, Task 3)."""
 
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
     @pytest.fixture
     def mock_ctx(self):
         """Create mock context for testing."""
@@ -1789,24 +1656,20 @@ class TestMeTTaKnowledgeGraphIntegration:
 
         return ctx
 
-    @pytest.mark.asyncio
-    async def test_metta_queries_in_guardian_response(self, mock_ctx):
+    async def test_metta_queries_in_guardian_response(self, mock_ctx, demo_portfolios):
         """Test MeTTa queries execute and historical data appears in Guardian response (AC 4).
 
         Validates:
         - Historical crash data appears in response (2022 bear market, 2021 correction, 2020 COVID)
         - Sector historical performance data present
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
-        wallet_data = DEMO_WALLETS[0]
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[0]
 
         request = AnalysisRequest(
             request_id="test-metta-integration",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user",
         )
 
@@ -1834,24 +1697,20 @@ class TestMeTTaKnowledgeGraphIntegration:
         else:
             logger.warning("⚠️ Test skipped - agent addresses not configured")
 
-    @pytest.mark.asyncio
-    async def test_metta_fallback_mechanism(self, mock_ctx):
+    async def test_metta_fallback_mechanism(self, mock_ctx, demo_portfolios):
         """Test MeTTa fallback mechanism works when MeTTa service unavailable (AC 4).
 
         Validates:
         - If MeTTa query fails, JSON fallback provides historical data
         - No crashes or timeouts when MeTTa unavailable
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
-        wallet_data = DEMO_WALLETS[0]
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[0]
 
         request = AnalysisRequest(
             request_id="test-metta-fallback",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user",
         )
 
@@ -1871,6 +1730,8 @@ class TestMeTTaKnowledgeGraphIntegration:
 class TestGuardianEndToEndPerformance:
     """Test end-to-end performance meets <60 second requirement (Story 2.6, Task 4)."""
 
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
     @pytest.fixture
     def mock_ctx(self):
         """Create mock context for testing."""
@@ -1883,8 +1744,7 @@ class TestGuardianEndToEndPerformance:
 
         return ctx
 
-    @pytest.mark.asyncio
-    async def test_end_to_end_timing_all_wallets(self, mock_ctx):
+    async def test_end_to_end_timing_all_wallets(self, mock_ctx, demo_portfolios):
         """Test Guardian orchestration completes within 60 seconds for all demo wallets (AC 5).
 
         Validates:
@@ -1892,26 +1752,22 @@ class TestGuardianEndToEndPerformance:
         - Timing metadata present in response
         - Performance metrics logged
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
         performance_results = []
 
-        for idx, wallet_data in enumerate(DEMO_WALLETS, start=1):
-            portfolio = create_portfolio_from_demo_wallet(wallet_data)
-
+        for idx, (wallet_data, (portfolio, portfolio_data)) in enumerate(zip(DEMO_WALLETS, demo_portfolios), start=1):
             request = AnalysisRequest(
                 request_id=f"test-performance-wallet-{idx}",
                 wallet_address=portfolio.wallet_address,
-                portfolio_data=portfolio.model_dump(),
+                portfolio_data=portfolio_data,
                 requested_by="agent1test_user",
             )
 
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
             await guardian_handler(ctx=mock_ctx, sender="agent1test_user", msg=request)
 
-            elapsed_s = time.time() - start_time
+            elapsed_s = (time.perf_counter_ns() - start_ns) / 1_000_000_000
             elapsed_ms = elapsed_s * 1000
 
             assert mock_ctx.send.called
@@ -1945,6 +1801,8 @@ class TestGuardianEndToEndPerformance:
 class TestGuardianErrorRecovery:
     """Test timeout handling and error recovery (Story 2.6, Task 5)."""
 
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
     @pytest.fixture
     def mock_ctx(self):
         """Create mock context for testing."""
@@ -1957,7 +1815,6 @@ class TestGuardianErrorRecovery:
 
         return ctx
 
-    @pytest.mark.asyncio
     async def test_correlation_agent_timeout_graceful(self, mock_ctx):
         """Test Guardian handles CorrelationAgent timeout gracefully (AC 6).
 
@@ -1966,7 +1823,6 @@ class TestGuardianErrorRecovery:
         - Response includes error transparency message
         - Response explains timeout threshold
         """
-        from agents.guardian_agent_local import wait_for_response
 
         # Test timeout with very short timeout value
         response = await wait_for_response(
@@ -1982,7 +1838,6 @@ class TestGuardianErrorRecovery:
         logger.info("✅ CorrelationAgent timeout graceful handling test passed")
         logger.info(f"   Timeout correctly returned None after 0.1s: ✓")
 
-    @pytest.mark.asyncio
     async def test_unknown_tokens_graceful_degradation(self, mock_ctx):
         """Test Guardian handles portfolios with unknown tokens gracefully (AC 7).
 
@@ -1991,14 +1846,12 @@ class TestGuardianErrorRecovery:
         - "Insufficient data" message appears gracefully
         - Partial analysis completed for known tokens
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
         # Create portfolio with unknown tokens
         unknown_portfolio = Portfolio(
             wallet_address="0x123test",
             tokens=[
-                TokenHolding(symbol="ETH", amount=10.0, price_usd=2650.0, value_usd=26500.0),
+                ETH_HOLDING,
                 TokenHolding(symbol="UNKNOWN_TOKEN_1", amount=100.0, price_usd=5.0, value_usd=500.0),
                 TokenHolding(symbol="FAKE_COIN_XYZ", amount=50.0, price_usd=10.0, value_usd=500.0),
             ],
@@ -2008,7 +1861,7 @@ class TestGuardianErrorRecovery:
         request = AnalysisRequest(
             request_id="test-unknown-tokens",
             wallet_address=unknown_portfolio.wallet_address,
-            portfolio_data=unknown_portfolio.model_dump(),
+            portfolio_data=unknown_portfolio.model_dump(exclude_unset=True),
             requested_by="agent1test_user",
         )
 
@@ -2031,6 +1884,8 @@ class TestGuardianErrorRecovery:
 class TestDemoWalletExpectedNarratives:
     """Test demo wallets produce expected risk narratives (Story 2.6, Task 6)."""
 
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
     @pytest.fixture
     def mock_ctx(self):
         """Create mock context for testing."""
@@ -2043,8 +1898,7 @@ class TestDemoWalletExpectedNarratives:
 
         return ctx
 
-    @pytest.mark.asyncio
-    async def test_demo_wallet_1_high_risk_narrative(self, mock_ctx):
+    async def test_demo_wallet_1_high_risk_narrative(self, mock_ctx, demo_portfolios):
         """Test demo wallet 1 produces high-risk narrative with compounding risk detection (AC 8).
 
         Expected:
@@ -2052,16 +1906,13 @@ class TestDemoWalletExpectedNarratives:
         - Compounding risk detected: True
         - Recommendations prioritize sector diversification
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
-        wallet_data = DEMO_WALLETS[0]  # High Risk DeFi Whale
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[0]  # High Risk DeFi Whale
 
         request = AnalysisRequest(
             request_id="test-narrative-wallet-1",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user",
         )
 
@@ -2089,8 +1940,7 @@ class TestDemoWalletExpectedNarratives:
         else:
             logger.warning("⚠️ Test skipped - agent addresses not configured")
 
-    @pytest.mark.asyncio
-    async def test_demo_wallet_2_moderate_risk_narrative(self, mock_ctx):
+    async def test_demo_wallet_2_moderate_risk_narrative(self, mock_ctx, demo_portfolios):
         """Test demo wallet 2 produces moderate-risk narrative without compounding risk (AC 8).
 
         Expected:
@@ -2098,16 +1948,13 @@ class TestDemoWalletExpectedNarratives:
         - No critical compounding risk detected
         - Balanced recommendations
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
-        wallet_data = DEMO_WALLETS[1]  # Moderate Risk Balanced Portfolio
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[1]  # Moderate Risk Balanced Portfolio
 
         request = AnalysisRequest(
             request_id="test-narrative-wallet-2",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user",
         )
 
@@ -2130,8 +1977,7 @@ class TestDemoWalletExpectedNarratives:
         else:
             logger.warning("⚠️ Test skipped - agent addresses not configured")
 
-    @pytest.mark.asyncio
-    async def test_demo_wallet_3_diversified_narrative(self, mock_ctx):
+    async def test_demo_wallet_3_diversified_narrative(self, mock_ctx, demo_portfolios):
         """Test demo wallet 3 produces well-diversified confirmation narrative (AC 8).
 
         Expected:
@@ -2139,16 +1985,13 @@ class TestDemoWalletExpectedNarratives:
         - Positive confirmation of balanced structure
         - Recommendations focus on maintaining allocation
         """
-        from agents.guardian_agent_local import handle_analysis_request as guardian_handler
-        from agents.shared.models import GuardianAnalysisResponse
 
-        wallet_data = DEMO_WALLETS[2]  # Well-Diversified Conservative
-        portfolio = create_portfolio_from_demo_wallet(wallet_data)
+        portfolio, portfolio_data = demo_portfolios[2]  # Well-Diversified Conservative
 
         request = AnalysisRequest(
             request_id="test-narrative-wallet-3",
             wallet_address=portfolio.wallet_address,
-            portfolio_data=portfolio.model_dump(),
+            portfolio_data=portfolio_data,
             requested_by="agent1test_user",
         )
 
@@ -2370,11 +2213,8 @@ class TestGuardianREADMECompleteness:
         - Includes technical details about dependencies
         - Follows templates/agent_README_template.md structure
         """
-        readme_path = Path(__file__).parent.parent / "agents" / "guardian_agent_README.md"
-        assert readme_path.exists(), f"Guardian README not found at {readme_path}"
-
-        with open(readme_path, "r") as f:
-            content = f.read()
+        content = read_agent_readme("guardian")
+        assert content is not None, f"Guardian README not found at {AGENTS_DIR / 'guardian_agent_README.md'}"
 
         # Verify required sections present
         required_sections = [